@@ -0,0 +1,256 @@
+"""Soru bankası için yerel ağ HTTP JSON servisi (asyncio, HTTP/1.1).
+
+Sorular uygulamanın kullandığı SoruKatalogu'ndan (load_all_categories ile
+aynı yükleyici) okunur; açılışta her kategori prepare() ile hazırlanır.
+
+    GET /kategoriler                                   kategoriler ve soru sayıları
+    GET /kategoriler/<ad>/sorular?sayfa=1&boyut=50     sayfalı sorular (boyut <= 200)
+    GET /kategoriler/<ad>/rastgele?adet=10             rastgele sorular (adet <= 200)
+
+Değişmeyen yanıtlar (kategori listesi ve sayfalar) ilk istendiklerinde bir
+kez kurulur: gövde, gzip'li gövde (mtime=0, en yüksek sıkıştırma), gövde
+özetinden ETag (gzip'li gösterimde "-gz" ekli) ve hazır başlık baytları önbellekte (en çok CACHE_ENTRIES,
+LRU) saklanır. If-None-Match tutarsa 304 döner; diğer tekrar istekler
+yalnızca hazır baytların yazılmasıdır. Rastgele çekimler her istekte
+üretilir ve önbelleğe alınmaz. Bağlantılar açık tutulur (keep-alive),
+KEEP_ALIVE saniye boşta kalan bağlantı kapatılır.
+
+Kullanım: python3 api.py [--port 8080] [--adres 0.0.0.0] [klasör]
+"""
+import os
+import sys
+import json
+import gzip
+import random
+import asyncio
+import hashlib
+import functools
+import collections
+import urllib.parse
+
+import soru_bankasi
+
+PORT = 8080
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+CACHE_ENTRIES = 1024
+KEEP_ALIVE = 30
+MAX_HEADER_LINES = 100
+GZIP_MIN_BYTES = 512
+STATUS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+
+class HataliIstek(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def question_json(no, q):
+    return {"no": no, "soru": q.soru, "siklar": list(q.siklar), "cevap": q.cevap}
+
+
+def encode_json(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class Yanit:
+    """Bir kez kurulan yanıt: gövdeler, ETag ve hazır başlıklar."""
+    __slots__ = ("status", "etag", "gzip_etag", "body", "gzip_body", "head", "gzip_head",
+                 "not_modified", "gzip_not_modified")
+
+    def __init__(self, status, body, cacheable=True, level=9):
+        self.status = status
+        self.body = body
+        self.gzip_body = gzip.compress(body, level, mtime=0) if len(body) >= GZIP_MIN_BYTES else None
+        self.etag = f'"{hashlib.sha256(body).hexdigest()[:20]}"' if cacheable else None
+        # Güçlü ETag bayt bayt aynı gövdeyi belirtir; gzip'li gösterim ayrı etiket alır
+        self.gzip_etag = self.etag[:-1] + '-gz"' if cacheable else None
+        common = "Content-Type: application/json; charset=utf-8\r\n"
+        # İstemci her seferinde doğrular; değişmediyse 304 ile gövde gönderilmez
+        common += "Cache-Control: no-cache\r\n" if cacheable else "Cache-Control: no-store\r\n"
+        if self.gzip_body is not None:
+            common += "Vary: Accept-Encoding\r\n"
+        status_line = f"HTTP/1.1 {status} {STATUS[status]}\r\n"
+        etag = lambda tag: f"ETag: {tag}\r\n" if cacheable else ""
+        self.head = (status_line + common + etag(self.etag) + f"Content-Length: {len(body)}\r\n").encode("latin-1")
+        self.gzip_head = None
+        if self.gzip_body is not None:
+            self.gzip_head = (status_line + common + etag(self.gzip_etag) + "Content-Encoding: gzip\r\n"
+                              f"Content-Length: {len(self.gzip_body)}\r\n").encode("latin-1")
+        not_modified = lambda tag: (f"HTTP/1.1 304 Not Modified\r\nETag: {tag}\r\nCache-Control: no-cache\r\n"
+                                    + ("Vary: Accept-Encoding\r\n" if self.gzip_body is not None else "")
+                                    ).encode("latin-1") if cacheable else None
+        self.not_modified = not_modified(self.etag)
+        self.gzip_not_modified = not_modified(self.gzip_etag)
+
+
+@functools.lru_cache(maxsize=256)
+def accepts_gzip(header):
+    """Accept-Encoding başlığı gzip'i q > 0 ile kabul ediyor mu (gzip;q=0 reddir)."""
+    star = False
+    for item in header.lower().split(","):
+        coding, *params = item.split(";")
+        q = 1.0
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try: q = float(value)
+                except ValueError: q = 0.0
+        coding = coding.strip()
+        if coding in ("gzip", "x-gzip"):
+            return q > 0
+        if coding == "*":
+            star = q > 0
+    return star
+
+
+def error(status, message):
+    return Yanit(status, encode_json({"hata": message}), cacheable=False)
+
+
+class SoruServisi:
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.names = [name for name in catalog.names() if catalog.prepare(name)]
+        self.cache = collections.OrderedDict()
+
+    def category_list(self):
+        return [{"ad": name, "soru_sayisi": self.catalog.manifest[name]["count"],
+                 "buyuk": self.catalog.is_large(name)} for name in self.names]
+
+    def cached(self, key, build):
+        entry = self.cache.get(key)
+        if entry is not None:
+            self.cache.move_to_end(key)
+            return entry
+        entry = Yanit(200, encode_json(build()))
+        self.cache[key] = entry
+        if len(self.cache) > CACHE_ENTRIES:
+            self.cache.popitem(last=False)
+        return entry
+
+    def route(self, target):
+        url = urllib.parse.urlsplit(target)
+        parts = [urllib.parse.unquote(p) for p in url.path.strip("/").split("/")]
+        query = urllib.parse.parse_qs(url.query)
+        number = lambda key, default, low, high: self.number(query, key, default, low, high)
+        if parts in (["kategoriler"], [""]):
+            return self.cached(("kategoriler",), self.category_list)
+        if len(parts) != 3 or parts[0] != "kategoriler":
+            raise HataliIstek(404, "bulunamadı")
+        name = parts[1]
+        if name not in self.names:
+            raise HataliIstek(404, f"kategori yok: {name}")
+        if parts[2] == "sorular":
+            page, size = number("sayfa", 1, 1, None), number("boyut", PAGE_SIZE, 1, MAX_PAGE_SIZE)
+            return self.cached(("sorular", name, page, size), lambda: self.page(name, page, size))
+        if parts[2] == "rastgele":
+            count = number("adet", 10, 1, MAX_PAGE_SIZE)
+            return Yanit(200, encode_json(self.draw(name, count)), cacheable=False, level=1)
+        raise HataliIstek(404, "bulunamadı")
+
+    @staticmethod
+    def number(query, key, default, low, high):
+        try: value = int(query[key][0]) if key in query else default
+        except ValueError: raise HataliIstek(400, f"'{key}' sayı olmalı")
+        if value < low or (high is not None and value > high):
+            raise HataliIstek(400, f"'{key}' {low}-{high or ''} aralığında olmalı")
+        return value
+
+    def page(self, name, page, size):
+        start = (page - 1) * size
+        total = self.catalog.manifest[name]["count"]
+        questions = self.catalog.questions_page(name, start, size)
+        more = len(questions) == size and (total is None or start + size < total)
+        query = urllib.parse.quote(name)
+        return {"kategori": name, "sayfa": page, "boyut": size, "toplam": total,
+                "sorular": [question_json(start + i, q) for i, q in enumerate(questions)],
+                "sonraki": f"/kategoriler/{query}/sorular?sayfa={page + 1}&boyut={size}" if more else None}
+
+    def draw(self, name, count):
+        if self.catalog.is_large(name):
+            picked = self.catalog.sample(name, count)
+        else:
+            questions = self.catalog.questions(name)
+            picked = random.sample(questions, min(count, len(questions)))
+        return {"kategori": name, "sorular": [
+            {"soru": q.soru, "siklar": list(q.siklar), "cevap": q.cevap} for q in picked]}
+
+    async def handle(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        transport = writer.transport
+        idle = None
+        try:
+            while True:
+                # Boşta kalan bağlantı kapatılır; zamanlayıcı her istekte yenilenir
+                idle = loop.call_later(KEEP_ALIVE, transport.close)
+                try:
+                    request_line = await reader.readline()
+                    headers = {}
+                    for _ in range(MAX_HEADER_LINES):
+                        line = await reader.readline()
+                        if line in (b"\r\n", b"\n", b""): break
+                        key, _, value = line.decode("latin-1").partition(":")
+                        headers[key.strip().lower()] = value.strip()
+                except (ValueError, ConnectionError):
+                    break
+                idle.cancel()
+                if not request_line or not line: break
+                method, _, rest = request_line.decode("latin-1").rstrip("\r\n").partition(" ")
+                target, _, version = rest.rpartition(" ")
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+                if headers.get("content-length", "0") != "0" or "transfer-encoding" in headers:
+                    # Gövdeli istek desteklenmez; bağlantı eşitlenemeyeceği için kapanır
+                    keep_alive = False
+                if method not in ("GET", "HEAD"):
+                    response = error(405, "yalnızca GET ve HEAD")
+                else:
+                    try: response = self.route(target)
+                    except HataliIstek as e: response = error(e.status, str(e))
+                self.write(writer, response, method == "HEAD", headers, keep_alive)
+                if not keep_alive: break
+                if transport.get_write_buffer_size() > 64 * 1024:
+                    await writer.drain()
+        finally:
+            if idle is not None: idle.cancel()
+            writer.close()
+
+    @staticmethod
+    def write(writer, response, head_only, headers, keep_alive):
+        end = b"\r\n" if keep_alive else b"Connection: close\r\n\r\n"
+        # 304 yalnızca seçilecek gösterimin ETag'i tutarsa döner
+        if response.gzip_body is not None and accepts_gzip(headers.get("accept-encoding", "")):
+            etag, not_modified = response.gzip_etag, response.gzip_not_modified
+            head, body = response.gzip_head, response.gzip_body
+        else:
+            etag, not_modified = response.etag, response.not_modified
+            head, body = response.head, response.body
+        if etag is not None and etag in headers.get("if-none-match", ""):
+            writer.write(not_modified + end)
+            return
+        writer.write(head + end if head_only else head + end + body)
+
+
+async def serve(directory, host=None, port=PORT):
+    catalog = soru_bankasi.SoruKatalogu(directory)
+    service = SoruServisi(catalog)
+    # Kategori listesi açılışta hazırlanır
+    service.cached(("kategoriler",), service.category_list)
+    server = await asyncio.start_server(service.handle, host, port, backlog=1024)
+    print(f"{len(service.names)} kategori, http://{host or '0.0.0.0'}:{port}/kategoriler", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    option = lambda flag, default: args[args.index(flag) + 1] if flag in args else default
+    port = int(option("--port", PORT))
+    host = option("--adres", None)
+    rest = [a for i, a in enumerate(args) if not a.startswith("--") and (i == 0 or not args[i - 1].startswith("--"))]
+    directory = rest[0] if rest else os.path.dirname(os.path.abspath(__file__))
+    try:
+        asyncio.run(serve(directory, host, port))
+    except KeyboardInterrupt: pass
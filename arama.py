@@ -0,0 +1,104 @@
+"""Tüm sorularda tam metin arama (SQLite FTS5).
+
+İndeks ~/.islami_test/arama.sqlite3 dosyasında tutulur. Soru, şıklar ve
+cevap Türkçe kurallarına göre normalleştirilmiş olarak indekslenir: İ/i ve
+I/ı doğru küçültülür, ardından aksanlar atılır (ç->c, ğ->g, ı->i, ş->s,
+â->a ...). Böylece "setr-i avret", "SETR-İ AVRET" ve "Setr-i Avret" aynı
+sonucu verir. Kaynak JSON dosyalarının boyutu ve değişme zamanı saklanır;
+update() yalnızca değişen dosyaların satırlarını yeniden yazar.
+"""
+import sys
+import os
+import json
+import sqlite3
+import unicodedata
+
+import soru_bankasi
+
+INDEX_FILE = "arama.sqlite3"
+
+_TR_UPPER = str.maketrans({"İ": "i", "I": "ı"})
+_FOLD = str.maketrans({"ı": "i", "ç": "c", "ğ": "g", "ö": "o", "ş": "s", "ü": "u"})
+
+
+def normalize(text):
+    """Türkçe küçük harfe çevirir ve aksanları atar."""
+    text = text.translate(_TR_UPPER).lower().translate(_FOLD)
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in text if not unicodedata.combining(c))
+
+
+def tokens(text):
+    word = []
+    for c in normalize(text):
+        if c.isalnum():
+            word.append(c)
+        elif word:
+            yield "".join(word)
+            word = []
+    if word:
+        yield "".join(word)
+
+
+class SoruIndeksi:
+    def __init__(self, db_path):
+        self.db = sqlite3.connect(db_path)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS sources (
+                file TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER);
+            CREATE VIRTUAL TABLE IF NOT EXISTS questions USING fts5(
+                soru_n, siklar_n, cevap_n,
+                source UNINDEXED, category UNINDEXED,
+                soru UNINDEXED, siklar UNINDEXED, cevap UNINDEXED);
+        """)
+
+    def update(self, directory):
+        """Değişen, eklenen ve silinen kaynak dosyalara göre indeksi günceller."""
+        known = {row[0]: (row[1], row[2]) for row in self.db.execute("SELECT file, mtime_ns, size FROM sources")}
+        changed = 0
+        seen = set()
+        with self.db:
+            for file_path in soru_bankasi.find_sources(directory):
+                name = os.path.basename(file_path)
+                seen.add(name)
+                st = os.stat(file_path)
+                if known.get(name) == (st.st_mtime_ns, st.st_size):
+                    continue
+                category = soru_bankasi.category_name(file_path)
+                self.db.execute("DELETE FROM questions WHERE source = ?", (name,))
+                try:
+                    # Büyük paketler de belleğe alınmadan akış halinde indekslenir
+                    self.db.executemany(
+                        "INSERT INTO questions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        ((normalize(q["soru"]), normalize(" ".join(q["siklar"])), normalize(q["cevap"]),
+                          name, category, q["soru"], json.dumps(q["siklar"], ensure_ascii=False), q["cevap"])
+                         for q in soru_bankasi.iter_questions(file_path)))
+                except ValueError: pass
+                self.db.execute("INSERT OR REPLACE INTO sources VALUES (?, ?, ?)", (name, st.st_mtime_ns, st.st_size))
+                changed += 1
+            for name in set(known) - seen:
+                self.db.execute("DELETE FROM questions WHERE source = ?", (name,))
+                self.db.execute("DELETE FROM sources WHERE file = ?", (name,))
+                changed += 1
+        return changed
+
+    def search(self, query, limit=50):
+        """Sorgudaki her kelimeyi (önek olarak) içeren soruları alaka sırasıyla döndürür."""
+        words = list(tokens(query))
+        if not words: return []
+        match = " AND ".join(f'"{w}"*' for w in words)
+        rows = self.db.execute(
+            "SELECT category, soru, siklar, cevap FROM questions WHERE questions MATCH ? ORDER BY rank LIMIT ?",
+            (match, limit))
+        return [{"category": c, "soru": s, "siklar": json.loads(o), "cevap": a} for c, s, o, a in rows]
+
+    def close(self):
+        self.db.close()
+
+
+if __name__ == '__main__':
+    index = SoruIndeksi(os.path.join(os.path.expanduser("~"), ".islami_test", INDEX_FILE))
+    index.update(os.path.dirname(os.path.abspath(__file__)))
+    for r in index.search(" ".join(sys.argv[1:])):
+        print(f"[{r['category']}] {r['soru']}\n    -> {r['cevap']}")
+    index.close()
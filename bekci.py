@@ -0,0 +1,118 @@
+"""Olay döngüsü takılma bekçisi.
+
+islami-test.py --watchdog[=ms] ile açılır (varsayılan eşik 50 ms). Ana iş
+parçacığındaki hassas bir QTimer sık aralıklarla "nabız" atar; ayrı bir iş
+parçacığı son nabzın üzerinden eşikten fazla zaman geçtiğini görürse olay
+döngüsü takılmıştır ve ana iş parçacığının o anki Python yığını
+sys._current_frames ile alınır. Takılma sürdükçe her eşik süresinde bir
+örnek daha alınır; döngü döndüğünde takılmanın süresi kaydedilir.
+
+Kapanışta ~/.islami_test/takilma-raporu.txt yazılır: süre histogramı ve
+yığına göre gruplanmış takılmalar (kaç kez, toplam ve en uzun süre).
+Modal QMessageBox.exec() kendi olay döngüsünü döndürdüğü için takılma sayılmaz.
+"""
+import sys
+import time
+import threading
+import traceback
+import collections
+
+from PyQt6.QtCore import Qt, QTimer
+
+REPORT_FILE = "takilma-raporu.txt"
+DEFAULT_THRESHOLD_MS = 50
+# Histogram kovaları eşiğin katlarıdır (varsayılan eşikle 50, 100, 250, 500, 1000, 2000 ms)
+BUCKET_FACTORS = (1, 2, 5, 10, 20, 40)
+STACK_DEPTH = 15
+
+
+class Bekci:
+    def __init__(self, path, threshold_ms=DEFAULT_THRESHOLD_MS):
+        self.path = path
+        self.threshold = threshold_ms / 1000
+        self.buckets_ms = tuple(f * threshold_ms for f in BUCKET_FACTORS)
+        self.interval = max(1, threshold_ms // 4) / 1000
+        # Nesne ana (GUI) iş parçacığında kurulur; izlenen yığın onunkidir
+        self.gui_thread = threading.get_ident()
+        self.stalls = []
+        self.started = time.perf_counter()
+        self._last_beat = self.started
+        self._samples = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._timer = QTimer()
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._beat)
+        self._thread = threading.Thread(target=self._watch, name="bekci", daemon=True)
+
+    def start(self):
+        self._timer.start(int(self.interval * 1000))
+        self._thread.start()
+
+    def _beat(self):
+        now = time.perf_counter()
+        with self._lock:
+            gap = now - self._last_beat - self.interval
+            self._last_beat = now
+            samples, self._samples = self._samples, None
+        if gap > self.threshold:
+            self.stalls.append((gap, samples or []))
+
+    def _watch(self):
+        next_sample = 0.0
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            with self._lock:
+                last_beat = self._last_beat
+            if now - last_beat - self.interval <= self.threshold or now < next_sample:
+                continue
+            frame = sys._current_frames().get(self.gui_thread)
+            stack = "".join(traceback.format_list(traceback.extract_stack(frame, limit=STACK_DEPTH))) if frame else ""
+            with self._lock:
+                # Bu arada döngü döndüyse örnek bayattır
+                if self._last_beat != last_beat: continue
+                if self._samples is None: self._samples = []
+                self._samples.append(stack)
+            next_sample = now + self.threshold
+
+    def stop(self):
+        self._timer.stop()
+        self._stop.set()
+        self._thread.join()
+
+    def report(self):
+        elapsed = time.perf_counter() - self.started
+        durations = [d for d, _ in self.stalls]
+        lines = [f"Eşik: {self.threshold * 1000:.0f} ms, izleme süresi: {elapsed:.1f} s, "
+                 f"{len(durations)} takılma, toplam {sum(durations) * 1000:.0f} ms"]
+        if durations:
+            lines.append(f"En uzun: {max(durations) * 1000:.0f} ms")
+        lines.append("")
+        lines.append("Süre histogramı:")
+        counts = collections.Counter()
+        buckets = self.buckets_ms
+        for d in durations:
+            ms = d * 1000
+            counts[max([b for b in buckets if b <= ms] or [buckets[0]])] += 1
+        for i, low in enumerate(buckets):
+            label = f"{low:g}-{buckets[i + 1]:g} ms" if i + 1 < len(buckets) else f"{low:g}+ ms"
+            lines.append(f"  {label:<16}{'#' * min(counts[low], 50):<50} {counts[low]}")
+
+        # Takılma boyunca en sık görülen yığın, takılmanın yığını sayılır
+        groups = {}
+        for d, samples in self.stalls:
+            stack = collections.Counter(samples).most_common(1)[0][0] if samples else "(yığın yakalanamadı)\n"
+            g = groups.setdefault(stack, [0, 0.0, 0.0])
+            g[0] += 1
+            g[1] += d
+            g[2] = max(g[2], d)
+        for stack, (count, total, longest) in sorted(groups.items(), key=lambda g: -g[1][1]):
+            lines.append("")
+            lines.append(f"{count} kez, toplam {total * 1000:.0f} ms, en uzun {longest * 1000:.0f} ms:")
+            lines.append(stack.rstrip("\n"))
+        return "\n".join(lines) + "\n"
+
+    def save(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(self.report())
+        return self.path
@@ -0,0 +1,101 @@
+"""HTTP servisinin yük ölçümü (localhost, saniyede istek).
+
+api.py ayrı bir süreçte başlatılır; bu süreç tek olay döngüsünde C adet
+açık (keep-alive) bağlantıdan art arda istek gönderir. Her senaryo D saniye
+sürer ve saniyedeki istek sayısı ile gecikme yüzdelikleri yazdırılır:
+
+    304            If-None-Match ile koşullu (gzip'li) sayfa isteği
+    gzip sayfa     Accept-Encoding: gzip ile 50 soruluk sayfa
+    düz sayfa      sıkıştırmasız aynı sayfa
+    rastgele       her istekte üretilen 10 soruluk rastgele çekim
+
+İstemci de aynı makinede çalıştığından sonuç sunucunun üst sınırı değil,
+yerel karşılaştırma içindir.
+
+Kullanım: python3 benchmarks/api_bench.py [bağlantı sayısı] [saniye]
+"""
+import os
+import sys
+import time
+import socket
+import asyncio
+import statistics
+import urllib.parse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import soru_bankasi
+
+
+async def request(reader, writer, path, headers=""):
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n{headers}\r\n".encode("utf-8"))
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    response_headers = {}
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        key, _, value = line.decode("latin-1").partition(":")
+        response_headers[key.strip().lower()] = value.strip()
+    length = int(response_headers.get("content-length", 0))
+    body = await reader.readexactly(length) if length else b""
+    return status, response_headers, body
+
+
+async def worker(port, path, headers, expected, deadline, latencies):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        while time.perf_counter() < deadline:
+            t = time.perf_counter()
+            status, _, _ = await request(reader, writer, path, headers)
+            latencies.append(time.perf_counter() - t)
+            assert status == expected, status
+    finally:
+        writer.close()
+
+
+async def scenario(label, port, path, headers, expected, connections, seconds):
+    latencies = []
+    t = time.perf_counter()
+    await asyncio.gather(*(worker(port, path, headers, expected, t + seconds, latencies)
+                           for _ in range(connections)))
+    elapsed = time.perf_counter() - t
+    q = statistics.quantiles(latencies, n=100)
+    print(f"  {label:<14}{len(latencies) / elapsed:9.0f} istek/s   p50 {q[49] * 1000:6.2f} ms   p99 {q[98] * 1000:6.2f} ms")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def main():
+    connections = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+    catalog = soru_bankasi.SoruKatalogu(ROOT)
+    category = urllib.parse.quote(catalog.names()[0])
+    catalog.close()
+    port = free_port()
+    server = await asyncio.create_subprocess_exec(
+        sys.executable, os.path.join(ROOT, "api.py"), "--port", str(port), "--adres", "127.0.0.1",
+        stdout=asyncio.subprocess.PIPE)
+    try:
+        await server.stdout.readline()
+        page = f"/kategoriler/{category}/sorular?sayfa=1&boyut=50"
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        _, headers, body = await request(reader, writer, page, "Accept-Encoding: gzip\r\n")
+        _, _, plain = await request(reader, writer, page)
+        writer.close()
+        print(f"{connections} bağlantı, senaryo başına {seconds:g} s; sayfa {len(plain)} B, gzip {len(body)} B")
+        await scenario("304", port, page, f"Accept-Encoding: gzip\r\nIf-None-Match: {headers['etag']}\r\n", 304, connections, seconds)
+        await scenario("gzip sayfa", port, page, "Accept-Encoding: gzip\r\n", 200, connections, seconds)
+        await scenario("düz sayfa", port, page, "", 200, connections, seconds)
+        await scenario("rastgele", port, f"/kategoriler/{category}/rastgele?adet=10", "Accept-Encoding: gzip\r\n",
+                       200, connections, seconds)
+    finally:
+        server.terminate()
+        await server.wait()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
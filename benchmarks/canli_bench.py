@@ -0,0 +1,118 @@
+"""Canlı yarışma sunucusunun yük ölçümü (localhost).
+
+canli.py sunucusu ayrı bir süreçte başlatılır; bu süreç tek olay döngüsünde
+N istemci (varsayılan 500) açar. Her istemci her soruya 0-1 sn arası
+rastgele bir gecikmeyle rastgele bir şık gönderir. Ölçülenler:
+
+    katılma           ilk bağlantıdan son "hos" mesajına kadar
+    soru yayını       bir sorunun ilk ve son istemciye varışı arasındaki fark
+    sonuç gecikmesi   son cevabın gönderilmesinden sonucun son istemciye varışına
+
+Süreler istemci tarafında ölçülür; N istemciyi işleyen bu sürecin kendi
+yükü de sonuçlara dahildir.
+
+Kullanım: python3 benchmarks/canli_bench.py [istemci sayısı] [soru sayısı]
+"""
+import os
+import sys
+import json
+import time
+import random
+import socket
+import asyncio
+import statistics
+import collections
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import canli
+import soru_bankasi
+
+ANSWER_DELAY = 1.0
+
+
+class Olcum:
+    def __init__(self):
+        self.joined = []
+        self.questions = collections.defaultdict(list)
+        self.answers = collections.defaultdict(list)
+        self.reveals = collections.defaultdict(list)
+        self.finished = 0
+        self.scores = {}
+
+
+async def client(i, port, rng, m):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(canli.encode({"t": "katil", "ad": f"oyuncu{i}"}))
+    loop = asyncio.get_running_loop()
+
+    def answer(no):
+        m.answers[no].append(time.perf_counter())
+        writer.write(canli.encode({"t": "cevap", "no": no, "sik": rng.randrange(4)}))
+
+    while line := await reader.readline():
+        now = time.perf_counter()
+        message = json.loads(line)
+        kind = message["t"]
+        if kind == "hos":
+            m.joined.append(now)
+        elif kind == "soru":
+            m.questions[message["no"]].append(now)
+            loop.call_later(rng.uniform(0, ANSWER_DELAY), answer, message["no"])
+        elif kind == "sonuc":
+            m.reveals[message["no"]].append(now)
+        elif kind == "durum":
+            m.scores[i] = message["puan"]
+        elif kind == "bitti":
+            m.finished += 1
+            break
+    writer.close()
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def report(label, samples):
+    samples = [s * 1000 for s in samples]
+    print(f"  {label:<24}{statistics.median(samples):9.1f} ms   (en çok {max(samples):.1f}, n={len(samples)})")
+
+
+async def main():
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    questions = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    canli.raise_file_limit()
+    catalog = soru_bankasi.SoruKatalogu(ROOT)
+    category = catalog.names()[0]
+    catalog.close()
+    port = free_port()
+    server = await asyncio.create_subprocess_exec(
+        sys.executable, os.path.join(ROOT, "canli.py"), "sunucu", category, "--port", str(port),
+        "--sure", "10", "--soru", str(questions), "--oyuncu", str(clients), "--ara", "0.2",
+        stdin=asyncio.subprocess.DEVNULL, stdout=asyncio.subprocess.PIPE)
+    await server.stdout.readline()
+
+    m = Olcum()
+    rng = random.Random(1)
+    print(f"{clients} istemci, {questions} soru ({category})")
+    t = time.perf_counter()
+    tasks = [asyncio.ensure_future(client(i, port, random.Random(rng.random()), m)) for i in range(clients)]
+    await asyncio.gather(*tasks)
+    total = time.perf_counter() - t
+    output = (await server.stdout.read()).decode("utf-8")
+    await server.wait()
+
+    report("katılma", [max(m.joined) - t])
+    report("soru yayını", [max(v) - min(v) for v in m.questions.values()])
+    report("sonuç gecikmesi", [max(m.reveals[no]) - max(m.answers[no]) for no in m.reveals])
+    print(f"  {'toplam':<24}{total:9.1f} s    ({m.finished}/{clients} istemci sonu gördü)")
+    assert m.finished == clients, output
+    assert all(len(v) == clients for v in m.reveals.values())
+    print(output.rstrip())
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
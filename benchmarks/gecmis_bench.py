@@ -0,0 +1,78 @@
+"""Cevap geçmişi özetinin ölçümü; Qt içe aktarılmadan çalışır.
+
+Sentetik bir geçmiş (varsayılan 5 milyon cevap: her gün 50 öğrenci x 50
+cevap, beş yıl) geçici bir klasöre yazılır; ardından özetin sıfırdan
+hesaplanması, kayıtlı özetin yüklenmesi, bir oturumluk (50) yeni cevabın
+yazıcı iş parçacığında özete eklenmesi ve istatistik ekranının açılışı
+(summary + category_stats) ölçülür.
+
+Kullanım: python3 benchmarks/gecmis_bench.py [cevap sayısı]
+"""
+import os
+import sys
+import time
+import array
+import random
+import shutil
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import gecmis
+
+CATEGORIES = 14
+YEARS = 5
+
+
+def make_history(directory, rows, rng):
+    now = int(time.time())
+    values = {
+        "soru": [rng.randrange(100) for _ in range(rows)],
+        "kategori": [rng.randrange(CATEGORIES) for _ in range(rows)],
+        "dogru": [rng.random() < 0.7 for _ in range(rows)],
+        "ms": [rng.randrange(60000) for _ in range(rows)],
+        "zaman": sorted(now - rng.randrange(YEARS * 365 * 86400) for _ in range(rows)),
+    }
+    values["sure_doldu"] = [ms > 58000 for ms in values["ms"]]
+    for name, code in gecmis.COLUMNS:
+        with open(gecmis.column_path(directory, name), "wb") as f:
+            array.array(code, values[name]).tofile(f)
+    with open(os.path.join(directory, gecmis.CATEGORY_FILE), "w", encoding="utf-8") as f:
+        f.writelines(f"Kategori {i}\n" for i in range(CATEGORIES))
+
+
+def timed(label, fn):
+    t = time.perf_counter()
+    result = fn()
+    print(f"  {label:<36}{(time.perf_counter() - t) * 1000:10.1f} ms")
+    return result
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    directory = tempfile.mkdtemp(prefix="islami-gecmis-")
+    try:
+        print(f"{rows} cevaplık sentetik geçmiş üretiliyor...")
+        make_history(directory, rows, random.Random(1))
+        print(f"Geçmiş ({rows} cevap, {CATEGORIES} kategori)")
+        timed("read_columns", lambda: gecmis.read_columns(directory))
+        timed("load_summary (sıfırdan)", lambda: gecmis.load_summary(directory))
+        timed("load_summary (değişiklik yok)", lambda: gecmis.load_summary(directory))
+
+        store = gecmis.GecmisDeposu(directory)
+        store.summary()
+        for i in range(50):
+            store.add("Kategori 3", i, i % 3 != 0, False, 4000 + i)
+        timed("50 cevap yazımı + özet (arka plan)", store.flush)
+        summary = timed("GecmisDeposu.summary", store.summary)
+        categories = gecmis.read_categories(directory)
+        timed("category_stats", lambda: gecmis.category_stats(summary, categories))
+        assert summary.rows == gecmis.row_count(directory)
+        store.close()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
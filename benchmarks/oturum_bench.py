@@ -0,0 +1,115 @@
+"""QuizSession sıcak yolu ölçümü; Qt içe aktarılmadan çalışır.
+
+Durum makinesi sabit bir saatle (clock=int, her zaman 0) ölçülür; gerçek
+saatin (time.monotonic_ns) cevap başına maliyeti ayrı satırda gösterilir.
+Gürültülü bir sanal makinede üç çalıştırmanın aralığı:
+
+    answer                          2.0-2.8 M/s
+    answer (monotonic_ns saati)     1.8-2.5 M/s
+    load_question+answer+next       ~0.18 M/s
+
+Cevap süresini tutmayan eski motor (son tarihli saatten önce) aynı makinede
+answer için 3.9-4.9 M/s veriyordu; fark cevap anının kaydedilmesidir (bir
+saat okuması ve bir atama, milisaniye hesabı response_ms okunana kadar ertelenir).
+
+Kullanım: python3 benchmarks/oturum_bench.py [cevap sayısı]
+"""
+import os
+import sys
+import time
+import random
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import soru_bankasi
+from oturum import QuizSession
+
+
+def load_bank():
+    catalog = soru_bankasi.SoruKatalogu(ROOT)
+    questions = []
+    for name in catalog.names():
+        questions.extend(catalog.questions(name))
+    catalog.close()
+    return questions
+
+
+class Tekrarli:
+    """Bankayı kopyalamadan size uzunluğunda gösteren salt okunur dizi."""
+
+    def __init__(self, bank, size):
+        self.bank = bank
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, i):
+        return self.bank[i % len(self.bank)]
+
+
+def first_question(bank, size, repeat=200):
+    questions = Tekrarli(bank, size)
+    rng = random.Random(size)
+    t = time.perf_counter()
+    for _ in range(repeat):
+        session = QuizSession(questions, rng=rng)
+        session.start()
+        session.load_question()
+    elapsed = time.perf_counter() - t
+    print(f"  {size:>10} soru{elapsed * 1e6 / repeat:12.1f} µs")
+
+
+def run(label, n, setup, step):
+    session = setup()
+    t = time.perf_counter()
+    step(session, n)
+    elapsed = time.perf_counter() - t
+    print(f"  {label:<32}{n / elapsed / 1e6:8.2f} M/s   ({elapsed * 1e9 / n:7.0f} ns/cevap)")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    bank = load_bank()
+    rng = random.Random(1)
+    # Seçilen şıklar önceden üretilir, ölçüme RNG maliyeti karışmasın
+    picks = [rng.randrange(4) for _ in range(4096)]
+
+    def make_session(size, max_time=60, clock=int):
+        session = QuizSession(bank * (size // len(bank) + 1), max_time=max_time, rng=random.Random(size), clock=clock)
+        session.start()
+        return session
+
+    def answer_only(session, n):
+        session.load_question()
+        answer = session.answer
+        for i in range(n):
+            answer(picks[i & 4095])
+
+    def full_cycle(session, n):
+        load, answer, advance = session.load_question, session.answer, session.next_question
+        for i in range(n):
+            load()
+            answer(picks[i & 4095])
+            advance()
+
+    def timeout_cycle(session, n):
+        for _ in range(n):
+            session.load_question()
+            session.tick()
+            session.next_question()
+
+    print(f"QuizSession ({len(bank)} soruluk banka, {n} cevap)")
+    run("answer", n, lambda: make_session(0), answer_only)
+    run("answer (monotonic_ns saati)", n, lambda: make_session(0, clock=time.monotonic_ns), answer_only)
+    run("load_question+answer+next", n, lambda: make_session(n), full_cycle)
+    run("load_question+tick(süre doldu)", n, lambda: make_session(n, max_time=0), timeout_cycle)
+    print("İlk soru gecikmesi (start + load_question)")
+    for size in (1_000, 100_000, 10_000_000):
+        first_question(bank, size)
+    assert not any(m.startswith("PyQt6") for m in sys.modules), "Qt içe aktarılmamalı"
+
+
+if __name__ == '__main__':
+    main()
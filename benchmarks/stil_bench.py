@@ -0,0 +1,74 @@
+"""Cevap başına yeniden boyama maliyeti: buton başına setStyleSheet ile
+özellik tabanlı [state=...] stil karşılaştırması.
+
+Kullanım: QT_QPA_PLATFORM=offscreen python3 benchmarks/stil_bench.py [tur sayısı]
+"""
+import os
+import sys
+import time
+import importlib.util
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+CORRECT = "background-color: #27ae60; color: white; border: none;"
+WRONG = "background-color: #c0392b; color: white; border: none;"
+
+
+def load_app_module():
+    spec = importlib.util.spec_from_file_location("islami_test", os.path.join(ROOT, "islami-test.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run(label, rounds, buttons, step):
+    # Önce yalnızca stil değişimi, sonra eşzamanlı boyama dahil ölçülür
+    t = time.perf_counter()
+    for i in range(rounds):
+        step(i)
+    style_only = time.perf_counter() - t
+    t = time.perf_counter()
+    for i in range(rounds):
+        step(i)
+        for btn in buttons: btn.repaint()
+    with_paint = time.perf_counter() - t
+    print(f"  {label:<28}{style_only * 1e6 / rounds:9.1f} µs stil  {with_paint * 1e6 / rounds:9.1f} µs stil+boyama")
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setStyle("Fusion")
+    window = load_app_module().IslamiTestUygulamasi()
+    window.show()
+    window.ensure_game_ui()
+    app.processEvents()
+    buttons = window.buttons
+
+    def per_button_sheet(i):
+        # Eski yol: her cevapta butonlara ayrı CSS atanır, sonraki soruda temizlenir
+        buttons[i % 4].setStyleSheet(WRONG)
+        buttons[(i + 1) % 4].setStyleSheet(CORRECT)
+        for btn in buttons: btn.setStyleSheet("")
+
+    def state_property(i):
+        window.set_answer_state(buttons[i % 4], "wrong")
+        window.set_answer_state(buttons[(i + 1) % 4], "correct")
+        for btn in buttons: window.set_answer_state(btn, "idle")
+
+    def theme_switch(i):
+        window.apply_theme(window.night_style if i % 2 else window.day_style)
+
+    print(f"Cevap stili ({rounds} tur, 4 buton)")
+    run("setStyleSheet (eski)", rounds, buttons, per_button_sheet)
+    run("state özelliği", rounds, buttons, state_property)
+    run("tema değişimi (önbellekli)", rounds, buttons, theme_switch)
+    window.close()
+
+
+if __name__ == '__main__':
+    main()
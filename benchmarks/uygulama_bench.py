@@ -0,0 +1,217 @@
+"""Uygulama ölçüm takımı: yükleme, oturum başlatma, soru gösterme ve kayıt.
+
+Yerleşik banka ve 10k/100k/1M soruluk sentetik bankalar üzerinde (ekransız
+Qt) şu adımları ölçer: load_all_categories, init_ui, apply_theme, arka plan
+yüklemenin bitişi, start_category, load_question, check_answer ->
+next_question, save_state (ve diske yazma ile). Sentetik bankalar geçici bir
+klasörde JSON paketleri olarak üretilir ve paketle.sh'deki gibi derlenir.
+
+Sonuçlar commit'e göre adlandırılan bir JSON dosyasına yazılır; iki dosya
+--karsilastir ile karşılaştırılır.
+
+Kullanım:
+    python3 benchmarks/uygulama_bench.py [--boyutlar 10000,100000,1000000]
+                                         [--tekrar 200] [--cikti dosya.json]
+    python3 benchmarks/uygulama_bench.py --karsilastir eski.json yeni.json
+"""
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import platform
+import itertools
+import statistics
+import subprocess
+import tempfile
+import importlib.util
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QThreadPool, PYQT_VERSION_STR, QT_VERSION_STR
+from PyQt6.QtWidgets import QApplication
+
+import soru_bankasi
+
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "sonuclar")
+CATEGORIES = 10
+WORDS = ["namaz", "abdest", "oruç", "zekat", "hac", "sure", "ayet", "peygamber", "sahabe", "dua",
+         "kıble", "rekat", "secde", "rüku", "kıyam", "hicret", "Mekke", "Medine", "Kabe", "cuma"]
+
+
+def load_app_module():
+    spec = importlib.util.spec_from_file_location("islami_test", os.path.join(ROOT, "islami-test.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "yerel"
+
+
+def make_bank(directory, size, rng):
+    """size soruyu CATEGORIES pakete bölüp yazar ve bankayı derler; derleme süresini döndürür."""
+    os.makedirs(directory, exist_ok=True)
+    per_pack = size // CATEGORIES
+    for c in range(CATEGORIES):
+        with open(os.path.join(directory, f"sentetik-{c:02d}.json"), "w", encoding="utf-8") as f:
+            f.write("[\n")
+            for k in range(per_pack):
+                words = " ".join(rng.choice(WORDS) for _ in range(8))
+                # Şıklar küçük bir kümeden gelir; gerçek paketlerdeki tekrar eden şıklar gibi
+                options = rng.sample(WORDS, 3) + [str(k % 500)]
+                q = {"soru": f"{c}-{k}: {words}?", "siklar": options, "cevap": options[k % 4]}
+                f.write(json.dumps(q, ensure_ascii=False) + (",\n" if k < per_pack - 1 else "\n"))
+            f.write("]\n")
+    t = time.perf_counter()
+    soru_bankasi.compile_bank(directory)
+    return time.perf_counter() - t
+
+
+class Olcum:
+    def __init__(self, bank, questions):
+        self.bank = bank
+        self.questions = questions
+        self.results = []
+
+    def add(self, metric, samples):
+        samples = [s * 1000 for s in samples]
+        self.results.append({"bank": self.bank, "questions": self.questions, "metric": metric,
+                             "ms": round(statistics.median(samples), 4), "min_ms": round(min(samples), 4),
+                             "n": len(samples)})
+        print(f"  {metric:<30}{statistics.median(samples):10.3f} ms   (en az {min(samples):.3f}, n={len(samples)})")
+
+    def repeat(self, metric, n, step, before=None):
+        samples = []
+        for _ in range(n):
+            if before: before()
+            t = time.perf_counter()
+            step()
+            samples.append(time.perf_counter() - t)
+        self.add(metric, samples)
+
+
+def bench_bank(module, app, label, data_dir, home, repeat):
+    # Her banka kendi ev klasörünü kullanır; önceki bankanın yarım oturumu devam sorusu açmasın
+    os.environ["HOME"] = home
+    catalog = soru_bankasi.SoruKatalogu(data_dir)
+    total = sum(e["count"] or 0 for e in catalog.manifest.values())
+    catalog.close()
+    print(f"{label} ({total} soru)")
+    m = Olcum(label, total)
+
+    del module.STARTUP_MARKS[:]
+    t0 = time.perf_counter()
+    window = module.IslamiTestUygulamasi(data_dir)
+    marks = dict(module.STARTUP_MARKS)
+    m.add("load_all_categories", [marks["veri yükleme"] - t0])
+    m.add("init_ui", [marks["init_ui"] - marks["veri yükleme"]])
+    m.add("apply_theme", [marks["apply_theme"] - marks["init_ui"]])
+    t = time.perf_counter()
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+    m.add("kategoriler_hazir", [time.perf_counter() - t])
+    window.show()
+    # Açılıştaki kaldığı yer denetimi (100 ms sonra) boş günlükle ölçümden önce çalışsın
+    deadline = time.perf_counter() + 0.2
+    while time.perf_counter() < deadline:
+        app.processEvents()
+
+    themes = itertools.cycle([window.day_style, window.night_style])
+    t = time.perf_counter()
+    window.apply_theme(window.night_style)
+    m.add("apply_theme(ilk gece)", [time.perf_counter() - t])
+    m.repeat("apply_theme(önbellek)", repeat, lambda: window.apply_theme(next(themes)))
+
+    window.is_muted = True
+    name = next(iter(window.category_buttons))
+    t = time.perf_counter()
+    window.start_category(name)
+    m.add("start_category(ilk)", [time.perf_counter() - t])
+    m.repeat("start_category", repeat, lambda: window.start_category(name))
+    m.repeat("load_question", repeat, window.load_question)
+
+    def fresh_session():
+        # Kategori sonundaki sonuç kutusuna varmadan yeni oturum açılır
+        if window.session.current_q >= window.session.total - 2:
+            window.start_category(name)
+
+    def answer_and_advance():
+        window.check_answer(random.randrange(4))
+        window.next_question()
+    m.repeat("check_answer+next_question", repeat, answer_and_advance, fresh_session)
+    m.repeat("save_state", repeat, lambda: window.record_answer("x", True))
+    m.repeat("save_state+flush", repeat, lambda: (window.record_answer("x", True), window.journal.flush()))
+
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+    return m.results
+
+
+def compare(old_path, new_path):
+    with open(old_path, encoding="utf-8") as f: old = json.load(f)
+    with open(new_path, encoding="utf-8") as f: new = json.load(f)
+    before = {(r["bank"], r["metric"]): r["ms"] for r in old["results"]}
+    print(f"{old['commit']} -> {new['commit']}")
+    for r in new["results"]:
+        prev = before.get((r["bank"], r["metric"]))
+        change = f"{r['ms'] / prev:6.2f}x" if prev else "   yeni"
+        print(f"  {r['bank']:<10}{r['metric']:<30}{prev or 0:10.3f} -> {r['ms']:10.3f} ms  {change}")
+
+
+def main():
+    args = sys.argv[1:]
+    if "--karsilastir" in args:
+        i = args.index("--karsilastir")
+        compare(args[i + 1], args[i + 2])
+        return
+    option = lambda flag, default: args[args.index(flag) + 1] if flag in args else default
+    sizes = [int(s) for s in option("--boyutlar", "10000,100000,1000000").split(",") if s]
+    repeat = int(option("--tekrar", "200"))
+    commit = git_commit()
+    out_path = option("--cikti", os.path.join(RESULTS_DIR, f"{commit}.json"))
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setStyle("Fusion")
+    module = load_app_module()
+    # Sonuç kutusu modaldır; ölçüm sırasında gösterilmez
+    module.QMessageBox.information = lambda *a, **k: None
+
+    tmp = tempfile.mkdtemp(prefix="islami-bench-")
+    results = []
+    try:
+        results += bench_bank(module, app, "yerlesik", ROOT, os.path.join(tmp, "ev-yerlesik"), repeat)
+        rng = random.Random(1)
+        for size in sizes:
+            label = f"{size // 1000}k" if size < 1_000_000 else f"{size // 1_000_000}M"
+            data_dir = os.path.join(tmp, label)
+            print(f"{label} sentetik banka üretiliyor...")
+            compile_time = make_bank(data_dir, size, rng)
+            bank_results = bench_bank(module, app, label, data_dir, os.path.join(tmp, f"ev-{label}"), repeat)
+            bank_results.insert(0, {"bank": label, "questions": size, "metric": "compile_bank",
+                                    "ms": round(compile_time * 1000, 4), "min_ms": round(compile_time * 1000, 4), "n": 1})
+            results += bank_results
+            shutil.rmtree(data_dir)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    report = {"commit": commit, "date": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+              "qt": QT_VERSION_STR, "pyqt": PYQT_VERSION_STR, "platform": platform.platform(),
+              "repeat": repeat, "results": results}
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+    print(f"Sonuçlar: {out_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""Kategoriler arası neredeyse aynı soruların tespiti (MinHash + LSH).
+
+Soru metni arama.normalize ile Türkçe kurallarına göre normalleştirilir
+(SETR-İ AVRET == setr-i avret), kelimeler tek boşlukla birleştirilip 4
+harflik parçalara (shingle) bölünür. Her sorunun parça kümesinden NUM_PERM
+adet MinHash değeri çıkarılır; iki imzanın aynı olan değerlerinin oranı
+Jaccard benzerliğinin tahminidir. İmza BANDS banda bölünür ve her bant bir
+kovaya düşer: en az bir bandı aynı olan sorular aday çift olur. Böylece tüm
+çiftler karşılaştırılmaz, her soru yalnızca kendi kovalarındakilerle
+karşılaştırılır (soru sayısıyla yaklaşık doğrusal).
+
+24 bant x 4 satırda aday olma eşiği (1/24)^(1/4) ~ 0.45'tir; 0.85
+benzerlikteki bir çiftin aday olmama olasılığı ~1e-8'dir. Eşiğin altındaki
+adaylar tahminle değil, bellekteki parça kümelerinin tam Jaccard
+benzerliğiyle elenir; raporlanan her çift gerçekten eşiğin üstündedir.
+
+Aynı indeks yeni bir paket içe aktarılırken de kullanılır: add() eklenen
+sorunun bankadaki benzerlerini döndürür, reject_duplicates() paketi
+tekrarsız ve tekrar eden sorular olarak ayırır.
+
+Kullanım:
+    python3 benzer.py                      tüm bankadaki benzer çiftler
+    python3 benzer.py paket.json [temiz.json]
+                                          paketteki sorulardan bankada
+                                          benzeri olanlar (temiz.json'a
+                                          yalnızca tekrarsızlar yazılır)
+"""
+import sys
+import os
+import json
+import zlib
+import random
+
+import soru_bankasi
+from arama import tokens
+from tekrar import question_key
+
+SHINGLE = 4
+NUM_PERM = 96
+BANDS = 24
+THRESHOLD = 0.85
+# Mersenne asalı; (a * x + b) mod P permütasyon ailesi
+_P = (1 << 61) - 1
+
+
+def shingles(text, k=SHINGLE):
+    """Normalleştirilmiş metnin k harflik parçalarının 32 bitlik karmaları."""
+    text = " ".join(tokens(text))
+    if len(text) <= k:
+        return {zlib.crc32(text.encode("utf-8"))}
+    # crc32 süreçten sürece değişmez (hash() tuzludur), imzalar saklanabilir
+    return {zlib.crc32(text[i:i + k].encode("utf-8")) for i in range(len(text) - k + 1)}
+
+
+class BenzerlikIndeksi:
+    def __init__(self, threshold=THRESHOLD, num_perm=NUM_PERM, bands=BANDS, seed=1):
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = random.Random(seed)
+        self._perms = [(rng.randrange(1, _P), rng.randrange(_P)) for _ in range(self.rows * bands)]
+        self._buckets = [{} for _ in range(bands)]
+        self.signatures = {}
+        self.shingles = {}
+        self.texts = {}
+
+    def signature(self, text, hashes=None):
+        hashes = hashes or shingles(text)
+        return tuple(min((a * x + b) % _P for x in hashes) for a, b in self._perms)
+
+    def _bands(self, sig):
+        r = self.rows
+        return [sig[i * r:(i + 1) * r] for i in range(self.bands)]
+
+    def estimate(self, sig1, sig2):
+        """İmzalardan tahmini Jaccard benzerliği."""
+        return sum(x == y for x, y in zip(sig1, sig2)) / len(sig1)
+
+    @staticmethod
+    def similarity(set1, set2):
+        """Parça kümelerinin tam Jaccard benzerliği."""
+        return len(set1 & set2) / len(set1 | set2)
+
+    def query(self, text, sig=None, hashes=None):
+        """Metne benzeyen kayıtlı soruları [(benzerlik, anahtar)] olarak döndürür."""
+        hashes = hashes or shingles(text)
+        sig = sig or self.signature(text, hashes)
+        candidates = set()
+        for bucket, band in zip(self._buckets, self._bands(sig)):
+            candidates.update(bucket.get(band, ()))
+        found = [(self.similarity(hashes, self.shingles[key]), key) for key in candidates]
+        return sorted((f for f in found if f[0] >= self.threshold), reverse=True)
+
+    def add(self, key, text):
+        """Soruyu indekse ekler; eklenmeden önce bulunan benzerlerini döndürür."""
+        hashes = shingles(text)
+        sig = self.signature(text, hashes)
+        found = self.query(text, sig, hashes)
+        self.signatures[key] = sig
+        self.shingles[key] = hashes
+        self.texts[key] = text
+        for bucket, band in zip(self._buckets, self._bands(sig)):
+            bucket.setdefault(band, []).append(key)
+        return found
+
+    @classmethod
+    def from_directory(cls, directory, pairs=None, **kwargs):
+        """Klasördeki tüm kaynakları akış halinde indeksler; pairs verilirse benzer çiftler eklenir."""
+        index = cls(**kwargs)
+        for file_path in soru_bankasi.find_sources(directory):
+            category = soru_bankasi.category_name(file_path)
+            try:
+                for i, q in enumerate(soru_bankasi.iter_questions(file_path)):
+                    key = question_key(category, i)
+                    for sim, other in index.add(key, q["soru"]):
+                        if pairs is not None:
+                            pairs.append((sim, other, key))
+            except ValueError: continue
+        return index
+
+
+def reject_duplicates(index, questions, category="Yeni"):
+    """Paketi (tekrarsız, [(soru, benzerlik, anahtar)]) olarak ayırır.
+
+    Kabul edilen sorular indekse eklenir; paket kendi içindeki tekrarları da eler.
+    """
+    kept, rejected = [], []
+    for i, q in enumerate(questions):
+        found = index.add(question_key(category, i), q["soru"])
+        if found:
+            sim, key = found[0]
+            rejected.append((q, sim, key))
+        else:
+            kept.append(q)
+    return kept, rejected
+
+
+if __name__ == '__main__':
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    if len(sys.argv) > 1:
+        pack = sys.argv[1]
+        index = BenzerlikIndeksi.from_directory(app_dir)
+        kept, rejected = reject_duplicates(index, list(soru_bankasi.iter_questions(pack)),
+                                           soru_bankasi.category_name(pack))
+        for q, sim, key in rejected:
+            print(f"{sim:.2f} {q['soru']}\n     ~ [{key}] {index.texts[key]}")
+        print(f"{len(kept)} soru kabul edildi, {len(rejected)} tekrar reddedildi")
+        if len(sys.argv) > 2:
+            with open(sys.argv[2], "w", encoding="utf-8") as f:
+                json.dump(kept, f, ensure_ascii=False, indent=2)
+    else:
+        pairs = []
+        index = BenzerlikIndeksi.from_directory(app_dir, pairs)
+        for sim, a, b in sorted(pairs, reverse=True):
+            print(f"{sim:.2f} [{a}] {index.texts[a]}\n     [{b}] {index.texts[b]}")
+        print(f"{len(index.signatures)} soru, {len(pairs)} benzer çift")
@@ -0,0 +1,314 @@
+"""Yerel ağda canlı yarışma: asyncio TCP sunucusu ve terminal istemcisi.
+
+Sunucu kategoriyi uygulamadaki start_category ile aynı yoldan hazırlar
+(tohum, büyük paketlerde örneklem, QuizSession) ve her soruyu tüm
+oyunculara aynı şık sırasıyla yayınlar. Süre sunucudaki QuizSession'ın
+son tarihidir; cevaplar sunucuya vardığı anda monoton saatle zamanlanır.
+Herkes cevaplayınca ya da süre dolunca doğru şık ve sıralama yayınlanır.
+Bütün bağlantılar tek olay döngüsündedir; oyuncu başına iş parçacığı yoktur.
+
+Protokol: her satır bir JSON nesnesidir (UTF-8, "\\n" ile biter), "t" türüdür.
+
+    istemci -> sunucu   {"t": "katil", "ad": ...}
+                        {"t": "cevap", "no": soru no, "sik": 0-3}
+    sunucu -> istemci   {"t": "hos", "v": 1, "ad": ..., "kategori": ..., "toplam": ..., "sure": ...}
+                        {"t": "soru", "no": ..., "soru": ..., "siklar": [...], "sure": ...}
+                        {"t": "sonuc", "no": ..., "cevap": doğru şık, "ilk10": [[ad, puan], ...]}
+                        {"t": "durum", "no": ..., "dogru": ..., "puan": ..., "sira": ...}
+                        {"t": "bitti", "ilk10": [...]}
+
+Doğru cevap kalan süreye göre 500-1000 puan alır. Yayınlanan mesaj bir kez
+kodlanır; yazma tamponu MAX_BUFFER'ı aşan (okumayan) istemci düşürülür.
+
+Kullanım:
+    python3 canli.py sunucu <kategori> [--port 8765] [--sure 60] [--soru N]
+                                       [--oyuncu N] [--bekle saniye] [--ara saniye]
+    python3 canli.py istemci <adres[:port]> <ad>
+
+Sunucu --oyuncu kadar oyuncu katılınca, --bekle süresi dolunca ya da
+konsolda Enter'a basılınca başlar.
+"""
+import os
+import sys
+import json
+import random
+import asyncio
+
+import soru_bankasi
+from oturum import QuizSession
+
+PORT = 8765
+PROTOCOL_VERSION = 1
+SAMPLE_SIZE = 50
+MAX_LINE = 4096
+MAX_BUFFER = 256 * 1024
+MAX_NAME = 24
+REVEAL_SECONDS = 3
+TOP = 10
+
+
+def encode(message):
+    return (json.dumps(message, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def raise_file_limit():
+    # Her oyuncu bir dosya tanımlayıcısıdır; varsayılan 1024 sınırı yüzlerce oyuncuya dar gelir
+    try:
+        import resource
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    except (ImportError, ValueError, OSError): pass
+
+
+class Oyuncu:
+    __slots__ = ("name", "writer", "score", "correct", "answered", "last_correct")
+
+    def __init__(self, name, writer):
+        self.name = name
+        self.writer = writer
+        self.score = 0
+        self.correct = 0
+        # Son cevapladığı sorunun numarası; her soruya tek cevap
+        self.answered = -1
+        self.last_correct = False
+
+
+class CanliYarisma:
+    def __init__(self, session, limit=None, reveal_seconds=REVEAL_SECONDS, min_players=0):
+        self.session = session
+        self.limit = session.total if limit is None else min(limit, session.total)
+        self.reveal_seconds = reveal_seconds
+        self.min_players = min_players
+        self.players = {}
+        self.handlers = set()
+        self.question_no = -1
+        self.current = None
+        self.accepting = False
+        self.answers = 0
+        self.all_answered = asyncio.Event()
+        self.enough_players = asyncio.Event()
+
+    def send(self, player, data):
+        transport = player.writer.transport
+        if transport.is_closing(): return
+        transport.write(data)
+        if transport.get_write_buffer_size() > MAX_BUFFER:
+            # Okumayan istemcinin tamponu sunucunun belleğini şişirmesin
+            transport.abort()
+
+    def broadcast(self, message):
+        data = encode(message)
+        for player in list(self.players.values()):
+            self.send(player, data)
+
+    async def handle(self, reader, writer):
+        player = None
+        self.handlers.add(asyncio.current_task())
+        try:
+            while True:
+                try: line = await reader.readline()
+                except (ValueError, ConnectionError): break
+                if not line: break
+                try: message = json.loads(line)
+                except ValueError: continue
+                if not isinstance(message, dict): continue
+                kind = message.get("t")
+                if kind == "katil" and player is None:
+                    player = self.join(message.get("ad"), writer)
+                elif kind == "cevap" and player is not None:
+                    self.answer(player, message.get("no"), message.get("sik"))
+        finally:
+            if player is not None:
+                self.leave(player)
+            writer.close()
+            self.handlers.discard(asyncio.current_task())
+
+    def join(self, name, writer):
+        name = str(name or "").strip()[:MAX_NAME] or "Oyuncu"
+        taken = {p.name for p in self.players.values()}
+        base, n = name, 1
+        while name in taken:
+            n += 1
+            name = f"{base}#{n}"
+        player = Oyuncu(name, writer)
+        self.players[writer] = player
+        self.send(player, encode({"t": "hos", "v": PROTOCOL_VERSION, "ad": name, "kategori": self.session.category,
+                                  "toplam": self.limit, "sure": self.session.max_time}))
+        # Soru sırasında katılan oyuncu o soruyu da görür
+        if self.accepting:
+            self.send(player, self.current)
+        if self.min_players and len(self.players) >= self.min_players:
+            self.enough_players.set()
+        return player
+
+    def leave(self, player):
+        self.players.pop(player.writer, None)
+        # answers yalnızca bağlı oyuncuların cevaplarını sayar
+        if self.accepting and player.answered == self.question_no:
+            self.answers -= 1
+        if self.accepting and self.players and self.answers >= len(self.players):
+            self.all_answered.set()
+
+    def answer(self, player, no, slot):
+        if not self.accepting or no != self.question_no or player.answered == no: return
+        if not isinstance(slot, int) or not 0 <= slot < len(self.session.options): return
+        remaining = self.session.remaining_ns()
+        if remaining <= 0: return
+        player.answered = no
+        player.last_correct = slot == self.session.correct_slot
+        if player.last_correct:
+            player.correct += 1
+            player.score += 500 + 500 * remaining // max(1, self.session.max_time * 1_000_000_000)
+        self.answers += 1
+        if self.answers >= len(self.players):
+            self.all_answered.set()
+
+    def ranking(self):
+        return sorted(self.players.values(), key=lambda p: (-p.score, p.name))
+
+    async def wait_for_players(self, wait_seconds=None, console=False):
+        """Oyuncu sayısı, bekleme süresi veya konsolda Enter; hangisi önce gelirse."""
+        loop = asyncio.get_running_loop()
+        started = asyncio.Event()
+        waiters = [asyncio.ensure_future(started.wait())]
+        if self.min_players:
+            waiters.append(asyncio.ensure_future(self.enough_players.wait()))
+        if wait_seconds:
+            waiters.append(asyncio.ensure_future(asyncio.sleep(wait_seconds)))
+        if console:
+            loop.add_reader(sys.stdin.fileno(), lambda: (sys.stdin.readline(), started.set()))
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if console:
+                loop.remove_reader(sys.stdin.fileno())
+            for waiter in waiters:
+                waiter.cancel()
+
+    async def play(self):
+        session = self.session
+        while not session.finished and session.current_q < self.limit:
+            q = session.load_question()
+            self.question_no = session.current_q
+            self.answers = 0
+            self.all_answered.clear()
+            self.current = encode({"t": "soru", "no": self.question_no, "soru": q.soru,
+                                   "siklar": session.options, "sure": session.max_time})
+            self.accepting = True
+            for player in list(self.players.values()):
+                self.send(player, self.current)
+            try:
+                await asyncio.wait_for(self.all_answered.wait(), session.remaining_ns() / 1e9)
+            except asyncio.TimeoutError: pass
+            self.accepting = False
+            self.reveal()
+            session.next_question()
+            await asyncio.sleep(self.reveal_seconds)
+        self.broadcast({"t": "bitti", "ilk10": [[p.name, p.score] for p in self.ranking()[:TOP]]})
+
+    def reveal(self):
+        ranking = self.ranking()
+        no = self.question_no
+        self.broadcast({"t": "sonuc", "no": no, "cevap": self.session.correct_slot,
+                        "ilk10": [[p.name, p.score] for p in ranking[:TOP]]})
+        for rank, player in enumerate(ranking, 1):
+            self.send(player, encode({"t": "durum", "no": no, "dogru": player.answered == no and player.last_correct,
+                                      "puan": player.score, "sira": rank}))
+
+
+def find_category(catalog, name):
+    return next((c for c in catalog.names() if c.casefold() == name.casefold()), None)
+
+
+async def serve(category, port=PORT, max_time=60, limit=None, min_players=0, wait_seconds=None,
+                reveal_seconds=REVEAL_SECONDS, data_dir=None):
+    catalog = soru_bankasi.SoruKatalogu(data_dir or os.path.dirname(os.path.abspath(__file__)))
+    name = find_category(catalog, category)
+    if name is None or not catalog.prepare(name):
+        print(f"Kategori bulunamadı: {category}. Kategoriler: {', '.join(catalog.names())}")
+        return 1
+    # start_category ile aynı hazırlık
+    seed = random.getrandbits(32)
+    session = QuizSession(catalog.session_questions(name, seed, SAMPLE_SIZE), name, max_time)
+    session.start(seed)
+    game = CanliYarisma(session, limit, reveal_seconds, min_players)
+    console = sys.stdin.isatty()
+    if not (console or min_players or wait_seconds):
+        print("Konsol yok: başlamak için --oyuncu veya --bekle verin")
+        return 2
+
+    raise_file_limit()
+    server = await asyncio.start_server(game.handle, None, port, limit=MAX_LINE, backlog=1024)
+    print(f"'{name}' ({game.limit} soru) {port} portunda bekliyor"
+          + (", başlatmak için Enter" if console else ""), flush=True)
+    await game.wait_for_players(wait_seconds, console)
+    print(f"{len(game.players)} oyuncuyla başlıyor", flush=True)
+    await game.play()
+    ranking = game.ranking()
+
+    server.close()
+    for player in list(game.players.values()):
+        player.writer.close()
+    # Bağlantılar kapanınca okuma döngüleri kendiliğinden biter; iptal edilmeden beklenir
+    await asyncio.gather(*game.handlers, return_exceptions=True)
+    await server.wait_closed()
+    for rank, player in enumerate(ranking[:TOP], 1):
+        print(f"{rank:3}. {player.name:<{MAX_NAME}} {player.score:7} puan  ({player.correct} doğru)")
+    return 0
+
+
+async def join(address, name):
+    host, _, port = address.partition(":")
+    reader, writer = await asyncio.open_connection(host, int(port or PORT))
+    writer.write(encode({"t": "katil", "ad": name}))
+    loop = asyncio.get_running_loop()
+    state = {"no": None, "options": []}
+
+    def on_input():
+        text = sys.stdin.readline()
+        if not text:
+            loop.remove_reader(sys.stdin.fileno())
+            return
+        text = text.strip()
+        if state["no"] is not None and text in ("1", "2", "3", "4"):
+            writer.write(encode({"t": "cevap", "no": state["no"], "sik": int(text) - 1}))
+            state["no"] = None
+
+    loop.add_reader(sys.stdin.fileno(), on_input)
+    try:
+        while line := await reader.readline():
+            m = json.loads(line)
+            if m["t"] == "hos":
+                print(f"'{m['kategori']}' yarışmasına {m['ad']} olarak katıldınız ({m['toplam']} soru, {m['sure']} sn)")
+            elif m["t"] == "soru":
+                state["no"], state["options"] = m["no"], m["siklar"]
+                print(f"\nSoru {m['no'] + 1}: {m['soru']}")
+                for i, option in enumerate(m["siklar"], 1):
+                    print(f"  {i}) {option}")
+            elif m["t"] == "sonuc":
+                state["no"] = None
+                print(f"Doğru cevap: {state['options'][m['cevap']]}")
+            elif m["t"] == "durum":
+                print(f"{'✔' if m['dogru'] else '✘'} {m['puan']} puan, {m['sira']}. sıradasınız")
+            elif m["t"] == "bitti":
+                print("\nYarışma bitti:")
+                for rank, (player, score) in enumerate(m["ilk10"], 1):
+                    print(f"{rank:3}. {player:<{MAX_NAME}} {score:7} puan")
+                break
+    finally:
+        loop.remove_reader(sys.stdin.fileno())
+        writer.close()
+    return 0
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    option = lambda flag, default: args[args.index(flag) + 1] if flag in args else default
+    if len(args) >= 3 and args[0] == "istemci":
+        sys.exit(asyncio.run(join(args[1], args[2])))
+    elif len(args) >= 2 and args[0] == "sunucu":
+        sys.exit(asyncio.run(serve(args[1], int(option("--port", PORT)), int(option("--sure", 60)),
+                                   int(option("--soru", 0)) or None, int(option("--oyuncu", 0)),
+                                   float(option("--bekle", 0)), float(option("--ara", REVEAL_SECONDS)))))
+    print("Kullanım:" + __doc__.split("Kullanım:")[1].rstrip())
+    sys.exit(2)
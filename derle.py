@@ -0,0 +1,166 @@
+"""paketle.sh için artımlı, içerik özetli derleme adımı.
+
+Hazırlık ağacını (islami-test/) her seferinde silip baştan kurmak yerine
+uygulama klasörünü (opt/islami-test) kaynaklarla eşitler. Her çıktı,
+girdilerinin SHA-256 özetiyle .derle-onbellek dosyasına yazılır; özeti
+değişmeyen çıktı yeniden üretilmez:
+
+    kopyalar        *.py, *.json, *.jsonl, *.mp3, icon.png
+    soru bankası    kaynak paketler + soru_bankasi.py -> soru-bankasi.bin
+    bayt kodu       her .py -> __pycache__/*.pyc (özet tabanlı, zaman damgasız)
+    sesler          *.mp3 -> *.wav (ffmpeg varsa, -bitexact)
+
+Kaynağı kalmayan dosyalar silinir. Son olarak ağaçtaki tüm dosyaların
+izinleri (dizin/çalıştırılabilir 755, diğerleri 644) ve zamanları
+SOURCE_DATE_EPOCH'a sabitlenir; sahiplik dpkg-deb --root-owner-group ile
+verildiğinden aynı kaynaklar bayt bayt aynı paketi üretir.
+
+Kullanım: python3 derle.py <hazırlık klasörü> [uygulama dizini, /opt/islami-test]
+"""
+import sys
+import os
+import glob
+import shutil
+import hashlib
+import subprocess
+import py_compile
+import importlib.util
+
+import soru_bankasi
+
+CACHE_FILE = ".derle-onbellek"
+SOURCE_PATTERNS = ("*.py", "*.json", "*.jsonl", "*.mp3", "icon.png")
+FFMPEG_ARGS = ["-loglevel", "error", "-y", "-bitexact", "-ac", "1", "-ar", "44100", "-sample_fmt", "s16"]
+EXECUTABLE_DIRS = ("usr/bin",)
+
+
+def digest(files, *strings):
+    """files içeriklerinin ve dizgilerin birleşik özeti.
+
+    Dizgi hiçbir zaman dosya yolu olarak yorumlanmaz; "zekat.json" gibi bir ad
+    çalışma dizinindeki dosyanın içeriğine dönüşmesin diye türler ayrı etiketlenir.
+    """
+    h = hashlib.sha256()
+    for path in files:
+        with open(path, "rb") as f:
+            h.update(b"F" + hashlib.sha256(f.read()).digest())
+    for text in strings:
+        raw = text.encode("utf-8")
+        h.update(b"S" + len(raw).to_bytes(4, "little") + raw)
+    return h.hexdigest()
+
+
+def load_cache(path):
+    cache = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                name, _, value = line.rstrip("\n").partition(" ")
+                cache[name] = value
+    except OSError: pass
+    return cache
+
+
+def save_cache(path, cache):
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        f.writelines(f"{name} {value}\n" for name, value in sorted(cache.items()))
+    os.replace(path + ".tmp", path)
+
+
+class Derleyici:
+    def __init__(self, source_dir, stage_dir, install_dir):
+        self.source_dir = source_dir
+        self.stage_dir = stage_dir
+        self.app_dir = os.path.join(stage_dir, install_dir.strip("/"))
+        self.install_dir = install_dir
+        self.cache_path = os.path.join(source_dir, CACHE_FILE)
+        self.old = load_cache(self.cache_path)
+        self.cache = {}
+        self.built = []
+
+    def target(self, name, key, build):
+        """name çıktısını, anahtarı önbellektekinden farklıysa veya dosya yoksa üretir."""
+        path = os.path.join(self.app_dir, name)
+        self.cache[name] = key
+        if self.old.get(name) == key and os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        build(path)
+        self.built.append(name)
+
+    def run(self):
+        os.makedirs(self.app_dir, exist_ok=True)
+        sources = sorted({os.path.basename(p) for pattern in SOURCE_PATTERNS
+                          for p in glob.glob(os.path.join(self.source_dir, pattern))})
+        for name in sources:
+            src = os.path.join(self.source_dir, name)
+            self.target(name, digest([src]), lambda path, src=src: shutil.copyfile(src, path))
+
+        packs = soru_bankasi.find_sources(self.source_dir)
+        bank_key = digest([os.path.join(self.source_dir, "soru_bankasi.py"), *packs],
+                          *[os.path.basename(src) for src in packs])
+        self.target(soru_bankasi.BANK_FILE, bank_key,
+                    lambda path: soru_bankasi.compile_bank(self.source_dir, path))
+
+        tag = sys.implementation.cache_tag
+        for name in sources:
+            if not name.endswith(".py"): continue
+            src = os.path.join(self.source_dir, name)
+            pyc = os.path.relpath(importlib.util.cache_from_source(os.path.join(self.app_dir, name)), self.app_dir)
+            # Zaman damgası yerine kaynak özeti gömülür; yeniden derleme aynı baytları verir
+            self.target(pyc, digest([src], tag), lambda path, src=src, name=name: py_compile.compile(
+                src, path, dfile=os.path.join(self.install_dir, name), doraise=True,
+                invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH))
+
+        if shutil.which("ffmpeg"):
+            for name in sources:
+                if not name.endswith(".mp3"): continue
+                src = os.path.join(self.source_dir, name)
+                self.target(name[:-4] + ".wav", digest([src], *FFMPEG_ARGS), lambda path, src=src: subprocess.run(
+                    ["ffmpeg", "-i", src, *FFMPEG_ARGS, path], check=True))
+        else:
+            print("Uyarı: ffmpeg bulunamadı, sesler MP3 olarak çalınacak.")
+
+        removed = self.remove_stale()
+        save_cache(self.cache_path, self.cache)
+        return removed
+
+    def remove_stale(self):
+        removed = []
+        for root, dirs, files in os.walk(self.app_dir, topdown=False):
+            for name in files:
+                rel = os.path.relpath(os.path.join(root, name), self.app_dir)
+                if rel not in self.cache:
+                    os.remove(os.path.join(root, name))
+                    removed.append(rel)
+            if root != self.app_dir and not os.listdir(root):
+                os.rmdir(root)
+        return removed
+
+
+def normalize_tree(stage_dir, epoch):
+    """İzinleri ve değişme zamanlarını sabitler (yeniden üretilebilir paket)."""
+    for root, dirs, files in os.walk(stage_dir):
+        rel_root = os.path.relpath(root, stage_dir)
+        for name in files:
+            path = os.path.join(root, name)
+            executable = rel_root in EXECUTABLE_DIRS or (rel_root == "DEBIAN" and name not in ("control", "conffiles"))
+            os.chmod(path, 0o755 if executable else 0o644)
+            os.utime(path, (epoch, epoch))
+        os.chmod(root, 0o755)
+    for root, dirs, files in os.walk(stage_dir, topdown=False):
+        os.utime(root, (epoch, epoch))
+
+
+if __name__ == '__main__':
+    stage_dir = sys.argv[1]
+    install_dir = sys.argv[2] if len(sys.argv) > 2 else "/opt/islami-test"
+    source_dir = os.path.dirname(os.path.abspath(__file__))
+    builder = Derleyici(source_dir, stage_dir, install_dir)
+    removed = builder.run()
+    for name in builder.built:
+        print(f"  derlendi: {name}")
+    for name in removed:
+        print(f"  silindi:  {name}")
+    print(f"{len(builder.cache)} çıktı, {len(builder.built)} yeniden üretildi, {len(removed)} silindi")
+    normalize_tree(stage_dir, int(os.environ.get("SOURCE_DATE_EPOCH", 0)))
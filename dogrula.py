@@ -0,0 +1,221 @@
+"""Soru paketlerinin doğrulayıcısı.
+
+Uygulama bozuk kayıtları sessizce atlar (soru_bankasi.is_valid_question);
+bu araç aynı kayıtları dosya:satır konumuyla raporlar. Her paket ayrı bir
+süreçte denetlenir. Dosyaların SHA-256 özetleri sonuçlarıyla birlikte
+.dogrula-onbellek dosyasında saklanır; bir sonraki çalıştırmada değişmemiş
+dosyalar yeniden denetlenmez, önceki bulguları raporlanır.
+
+Hatalar: UTF-8 olmayan bayt, JSON sözdizimi, eksik/yanlış tipte alan, tam
+dört olmayan veya tekrar eden şıklar, şıklarda olmayan cevap.
+Uyarılar: uzunluk sınırını aşan metin, baş/son boşluk, kontrol karakteri.
+
+Kullanım: python3 dogrula.py [klasör] [--katı] [-j N]
+Hata varsa (--katı ile uyarı da varsa) çıkış kodu 1'dir; paketle.sh buna
+göre paketlemeyi durdurur.
+"""
+import sys
+import os
+import json
+import bisect
+import hashlib
+import concurrent.futures
+
+import soru_bankasi
+
+CACHE_FILE = ".dogrula-onbellek"
+# Kurallar değişince eski önbellek geçersiz olur
+RULES_VERSION = 1
+MAX_QUESTION_CHARS = 250
+MAX_OPTION_CHARS = 100
+
+
+class Konumlayici:
+    """Metin içi karakter konumunu satır numarasına çevirir."""
+
+    def __init__(self, text):
+        self.text = text
+        self.newlines = [i for i, c in enumerate(text) if c == "\n"]
+
+    def line(self, pos):
+        return bisect.bisect_right(self.newlines, pos - 1) + 1
+
+    def field_line(self, start, end, field):
+        # Alanın kendi satırı; bulunamazsa kaydın başladığı satır
+        pos = self.text.find(f'"{field}"', start, end)
+        return self.line(pos if pos >= 0 else start)
+
+
+def check_question(q):
+    """Tek kaydın bulgularını [(düzey, alan, mesaj)] olarak döndürür."""
+    if not isinstance(q, dict):
+        return [("hata", None, "kayıt bir nesne değil")]
+    issues = []
+    for key in ("soru", "siklar", "cevap"):
+        if key not in q:
+            issues.append(("hata", None, f"'{key}' alanı eksik"))
+    soru, siklar, cevap = q.get("soru"), q.get("siklar"), q.get("cevap")
+    if "soru" in q and not isinstance(soru, str):
+        issues.append(("hata", "soru", "soru metin değil"))
+    if "cevap" in q and not isinstance(cevap, str):
+        issues.append(("hata", "cevap", "cevap metin değil"))
+    if "siklar" in q:
+        if not isinstance(siklar, list) or not all(isinstance(s, str) for s in siklar):
+            issues.append(("hata", "siklar", "şıklar metin listesi değil"))
+            siklar = None
+        elif len(siklar) != soru_bankasi.OPTION_COUNT:
+            issues.append(("hata", "siklar", f"{len(siklar)} şık var, {soru_bankasi.OPTION_COUNT} olmalı"))
+        elif len(set(siklar)) != len(siklar):
+            issues.append(("hata", "siklar", "tekrar eden şık"))
+    if isinstance(cevap, str) and isinstance(siklar, list) and cevap not in siklar:
+        issues.append(("hata", "cevap", f"cevap şıklarda yok: {cevap!r}"))
+
+    texts = [("soru", soru, MAX_QUESTION_CHARS)] if isinstance(soru, str) else []
+    texts += [("siklar", s, MAX_OPTION_CHARS) for s in siklar or ()]
+    for field, text, limit in texts:
+        if len(text) > limit:
+            issues.append(("uyarı", field, f"{len(text)} karakter, sınır {limit}: {text[:40]!r}..."))
+        if text != text.strip():
+            issues.append(("uyarı", field, f"baş/son boşluk: {text!r}"))
+        if any(ord(c) < 32 or c == "\ufffd" for c in text):
+            issues.append(("uyarı", field, f"kontrol karakteri: {text!r}"))
+    return issues
+
+
+def iter_records(text, jsonl):
+    """(kayıt, başlangıç, bitiş) verir; sözdizimi hatasında json.JSONDecodeError.
+
+    jsonl'de her satır bağımsızdır: bozuk satır için kayıt yerine hata verilir
+    ve sonraki satırlarla devam edilir.
+    """
+    decoder = json.JSONDecoder()
+    if jsonl:
+        pos = 0
+        for line in text.splitlines(keepends=True):
+            if line.strip():
+                start = pos + len(line) - len(line.lstrip())
+                try:
+                    obj, end = decoder.raw_decode(text, start)
+                    if text[end:pos + len(line)].strip():
+                        raise json.JSONDecodeError("satır sonunda fazladan veri", text, end)
+                except json.JSONDecodeError as e:
+                    obj = e
+                yield obj, start, pos + len(line)
+            pos += len(line)
+        return
+    pos = len(text) - len(text.lstrip())
+    if not text.startswith("[", pos):
+        raise json.JSONDecodeError("JSON dizisi bekleniyor", text, pos)
+    pos += 1
+    while True:
+        while pos < len(text) and text[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= len(text):
+            raise json.JSONDecodeError("dizi kapanmamış", text, pos)
+        if text[pos] == "]":
+            return
+        obj, end = decoder.raw_decode(text, pos)
+        yield obj, pos, end
+        pos = end
+
+
+def check_file(file_path):
+    """Dosyanın bulgularını [(satır, düzey, mesaj)] olarak döndürür."""
+    with open(file_path, "rb") as f:
+        raw = f.read()
+    try:
+        text = raw.decode("utf-8")
+    except UnicodeDecodeError as e:
+        line = raw.count(b"\n", 0, e.start) + 1
+        return [(line, "hata", f"UTF-8 değil (bayt {e.start})")]
+    # Yükleyici de utf-8-sig ile okur; baştaki BOM sorun değildir
+    if text.startswith("\ufeff"):
+        text = text[1:]
+    where = Konumlayici(text)
+    jsonl = file_path.endswith(".jsonl")
+    issues = []
+    count = 0
+    try:
+        for q, start, end in iter_records(text, jsonl):
+            if isinstance(q, json.JSONDecodeError):
+                issues.append((where.line(q.pos), "hata", f"JSON sözdizimi: {q.msg}"))
+                continue
+            count += 1
+            for level, field, message in check_question(q):
+                line = where.field_line(start, end, field) if field else where.line(start)
+                issues.append((line, level, message))
+    except json.JSONDecodeError as e:
+        issues.append((where.line(e.pos), "hata", f"JSON sözdizimi: {e.msg}"))
+    if count == 0 and not issues:
+        issues.append((1, "uyarı", "dosyada soru yok"))
+    return issues
+
+
+def file_digest(file_path):
+    with open(file_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def load_cache(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache.get("version") == RULES_VERSION:
+            return cache["files"]
+    except (OSError, ValueError, KeyError): pass
+    return {}
+
+
+def save_cache(path, files):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": RULES_VERSION, "files": files}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def validate(directory, jobs=None):
+    """Klasördeki tüm paketleri denetler; {dosya adı: bulgular} ve yeniden denetlenen sayısı."""
+    cache_path = os.path.join(directory, CACHE_FILE)
+    cache = load_cache(cache_path)
+    results = {}
+    pending = {}
+    for file_path in soru_bankasi.find_sources(directory):
+        name = os.path.basename(file_path)
+        digest = file_digest(file_path)
+        entry = cache.get(name)
+        if entry and entry["sha256"] == digest:
+            results[name] = [tuple(i) for i in entry["issues"]]
+        else:
+            pending[name] = (file_path, digest)
+    if pending:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+            checked = pool.map(check_file, [p for p, _ in pending.values()])
+            for name, issues in zip(pending, checked):
+                results[name] = issues
+    files = {name: {"sha256": digest, "issues": results[name]}
+             for name, (_, digest) in pending.items()}
+    files.update({name: cache[name] for name in results if name not in pending})
+    try: save_cache(cache_path, files)
+    except OSError: pass
+    return dict(sorted(results.items())), len(pending)
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    strict = "--katı" in args
+    jobs = None
+    if "-j" in args:
+        jobs = int(args[args.index("-j") + 1])
+        del args[args.index("-j"):args.index("-j") + 2]
+    args = [a for a in args if not a.startswith("--")]
+    directory = args[0] if args else os.path.dirname(os.path.abspath(__file__))
+
+    results, checked = validate(directory, jobs)
+    errors = warnings = 0
+    for name, issues in results.items():
+        for line, level, message in sorted(issues):
+            print(f"{name}:{line}: {level}: {message}")
+            if level == "hata": errors += 1
+            else: warnings += 1
+    print(f"{len(results)} dosya ({checked} yeniden denetlendi): {errors} hata, {warnings} uyarı")
+    sys.exit(1 if errors or (strict and warnings) else 0)
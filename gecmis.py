@@ -0,0 +1,293 @@
+"""Cevap geçmişi: sütun düzeninde, yalnızca sona eklenen kayıt.
+
+Her cevap ~/.islami_test/gecmis/ altında altı sütun dosyasına sabit
+genişlikte eklenir (array modülü, makine bayt sırası):
+
+    soru.sutun        I  soru kimliği (soru_bankasi.question_id)
+    kategori.sutun    H  kategoriler.txt'deki satır numarası
+    dogru.sutun       B  1: doğru
+    sure_doldu.sutun  B  1: süre doldu
+    ms.sutun          I  cevap süresi (milisaniye)
+    zaman.sutun       I  Unix zamanı (saniye)
+
+Yazma kayit.EklemeGunlugu'nun arka plan iş parçacığıyla topludur. Yazım
+ortasında çökme sütunların boyunu eşitsiz bırakabilir; açılışta hepsi en
+kısasına kırpılır.
+
+İstatistikler satır satır Python döngüsüyle değil, sütunların üzerinde
+map/operator/itertools.compress zincirleri ve Counter ile (C içinde)
+hesaplanır. Toplamlar (sayılar, 100 ms'lik süre histogramları, haftalık
+doğru/toplam) birleştirilebilir olduğundan ozet.json'da kaç satırı
+kapsadıklarıyla saklanır ve yazıcı iş parçacığı her toplu yazımda yalnızca
+yeni satırları ekler. İstatistik ekranı geçmişin boyundan bağımsız olarak
+hazır toplamları okur; sütunlar yalnızca özet kaybolursa baştan taranır.
+
+Kullanım: python3 gecmis.py [klasör, ~/.islami_test/gecmis]
+"""
+import os
+import sys
+import json
+import time
+import array
+import operator
+import itertools
+import collections
+
+from kayit import EklemeGunlugu
+
+HISTORY_DIR = "gecmis"
+CATEGORY_FILE = "kategoriler.txt"
+SUMMARY_FILE = "ozet.json"
+COLUMNS = (("soru", "I"), ("kategori", "H"), ("dogru", "B"),
+           ("sure_doldu", "B"), ("ms", "I"), ("zaman", "I"))
+# Özetin biçimi değişince eskisi baştan hesaplanır
+SUMMARY_VERSION = 1
+BUCKET_MS = 100
+BUCKETS = 1024
+# Histogram anahtarı bir sonraki kategoriye taşmasın
+MAX_MS = BUCKET_MS * BUCKETS - 1
+WEEK = 7 * 24 * 3600
+TREND_WEEKS = 8
+SPARK = "▁▂▃▄▅▆▇█"
+
+
+def column_path(directory, name):
+    return os.path.join(directory, name + ".sutun")
+
+
+def read_categories(directory):
+    try:
+        with open(os.path.join(directory, CATEGORY_FILE), "r", encoding="utf-8") as f:
+            return [line.rstrip("\n") for line in f]
+    except OSError:
+        return []
+
+
+def row_count(directory):
+    """Tüm sütunlarda eksiksiz bulunan satır sayısı."""
+    counts = []
+    for name, code in COLUMNS:
+        try: size = os.path.getsize(column_path(directory, name))
+        except OSError: size = 0
+        counts.append(size // array.array(code).itemsize)
+    return min(counts)
+
+
+def read_columns(directory, start=0, stop=None):
+    """[start, stop) satırlarını {sütun: array} olarak okur."""
+    stop = row_count(directory) if stop is None else stop
+    columns = {}
+    for name, code in COLUMNS:
+        column = array.array(code)
+        if stop > start:
+            with open(column_path(directory, name), "rb") as f:
+                f.seek(start * column.itemsize)
+                column.fromfile(f, stop - start)
+        columns[name] = column
+    return columns
+
+
+class GecmisDeposu(EklemeGunlugu):
+    """Cevapları sütun dosyalarına arka planda toplu ekler."""
+
+    def __init__(self, directory, delay=0.2):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.categories = {name: i for i, name in enumerate(read_categories(directory))}
+        self._repair()
+        # Özet ilk toplu yazımda (arka planda) veya ilk summary() çağrısında yüklenir
+        self._summary = None
+        super().__init__(directory, delay)
+
+    def _repair(self):
+        rows = row_count(self.directory)
+        for name, code in COLUMNS:
+            path = column_path(self.directory, name)
+            size = rows * array.array(code).itemsize
+            try:
+                if os.path.getsize(path) != size:
+                    os.truncate(path, size)
+            except OSError: pass
+
+    def add(self, category, question, correct, timed_out, ms, ts=None):
+        # Puanlanmadan kaydedilen cevabın süresi (ms None) 0 sayılır
+        self.append((question or 0, category, bool(correct), bool(timed_out), min(ms or 0, MAX_MS),
+                     int(time.time() if ts is None else ts)))
+
+    def _append(self, batch):
+        try:
+            new_names = []
+            rows = []
+            for question, category, correct, timed_out, ms, ts in batch:
+                if category not in self.categories:
+                    self.categories[category] = len(self.categories)
+                    new_names.append(category)
+                rows.append((question, self.categories[category], correct, timed_out, ms, ts))
+            # Ad, ona başvuran satırdan önce diske yazılır
+            if new_names:
+                with open(os.path.join(self.directory, CATEGORY_FILE), "a", encoding="utf-8") as f:
+                    f.writelines(name + "\n" for name in new_names)
+            columns = {}
+            for (name, code), values in zip(COLUMNS, zip(*rows)):
+                columns[name] = array.array(code, values)
+                with open(column_path(self.directory, name), "ab") as f:
+                    columns[name].tofile(f)
+        except OSError:
+            # Diskteki satırlar belirsiz; özet gerektiğinde diskten yeniden kurulur
+            self._summary = None
+            return
+        if self._summary is None:
+            self._summary = load_summary(self.directory)
+        else:
+            self._summary.update(columns)
+
+    def summary(self):
+        """Diske yazılmamış cevaplar dahil güncel özet."""
+        self.flush()
+        if self._summary is None:
+            self._summary = load_summary(self.directory)
+        return self._summary
+
+    def close(self):
+        if self._closed: return
+        super().close()
+        if self._summary is not None:
+            save_summary(self.directory, self._summary)
+
+
+class GecmisOzeti:
+    """Sütunlardan türetilen, birleştirilebilir toplamlar.
+
+    Anahtarlar tamsayıdır: kategori; kategori * BUCKETS + süre kovası;
+    hafta << 16 | kategori.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.answers = collections.Counter()
+        self.correct = collections.Counter()
+        self.timeouts = collections.Counter()
+        self.latency = collections.Counter()
+        self.week_answers = collections.Counter()
+        self.week_correct = collections.Counter()
+
+    FIELDS = ("answers", "correct", "timeouts", "latency", "week_answers", "week_correct")
+
+    def update(self, columns):
+        cats, correct, timeouts = columns["kategori"], columns["dogru"], columns["sure_doldu"]
+        self.rows += len(cats)
+        self.answers.update(cats)
+        self.correct.update(itertools.compress(cats, correct))
+        self.timeouts.update(itertools.compress(cats, timeouts))
+        # Süre dolan cevaplar süre dağılımını bozmasın diye histograma girmez
+        buckets = map(operator.floordiv, columns["ms"], itertools.repeat(BUCKET_MS))
+        keys = map(operator.add, map(operator.mul, cats, itertools.repeat(BUCKETS)), buckets)
+        self.latency.update(itertools.compress(keys, map(operator.not_, timeouts)))
+        weeks = array.array("Q", map(operator.or_, map(operator.lshift, map(
+            operator.floordiv, columns["zaman"], itertools.repeat(WEEK)), itertools.repeat(16)), cats))
+        self.week_answers.update(weeks)
+        self.week_correct.update(itertools.compress(weeks, correct))
+
+    def to_json(self):
+        data = {"version": SUMMARY_VERSION, "rows": self.rows}
+        for field in self.FIELDS:
+            data[field] = {str(k): v for k, v in getattr(self, field).items()}
+        return data
+
+    @classmethod
+    def from_json(cls, data):
+        summary = cls()
+        # Nesne olmayan ya da eski biçimli özet yok sayılır, sütunlardan yeniden kurulur
+        if not isinstance(data, dict) or data.get("version") != SUMMARY_VERSION:
+            return summary
+        summary.rows = data["rows"]
+        for field in cls.FIELDS:
+            getattr(summary, field).update({int(k): v for k, v in data[field].items()})
+        return summary
+
+
+def load_summary(directory):
+    """Saklanan özeti yeni satırlarla günceller ve kaydeder."""
+    path = os.path.join(directory, SUMMARY_FILE)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            summary = GecmisOzeti.from_json(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        summary = GecmisOzeti()
+    rows = row_count(directory)
+    # Sütunlar özetten kısaysa (silinmiş/kırpılmış geçmiş) baştan hesaplanır
+    if summary.rows > rows:
+        summary = GecmisOzeti()
+    if rows > summary.rows:
+        summary.update(read_columns(directory, summary.rows, rows))
+        save_summary(directory, summary)
+    return summary
+
+
+def save_summary(directory, summary):
+    path = os.path.join(directory, SUMMARY_FILE)
+    try:
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(summary.to_json(), f)
+        os.replace(path + ".tmp", path)
+    except OSError: pass
+
+
+def percentile(histogram, q):
+    """{kova: sayı} histogramında q (0-1) yüzdeliğinin ms değeri; boşsa None."""
+    total = sum(histogram.values())
+    if not total: return None
+    target = q * total
+    seen = 0
+    for bucket in sorted(histogram):
+        seen += histogram[bucket]
+        if seen >= target:
+            return bucket * BUCKET_MS
+    return None
+
+
+def sparkline(values):
+    return "".join("·" if v is None else SPARK[min(int(v * len(SPARK)), len(SPARK) - 1)] for v in values)
+
+
+def category_stats(summary, categories, now=None, weeks=TREND_WEEKS):
+    """Kategori başına (ve sonda "Tümü" için) istatistik sözlüklerinin listesi.
+
+    trend: son `weeks` haftanın doğruluk oranları (eskiden yeniye, veri yoksa None).
+    """
+    current = int(time.time() if now is None else now) // WEEK
+    week_range = range(current - weeks + 1, current + 1)
+    latency = collections.defaultdict(dict)
+    for key, n in summary.latency.items():
+        latency[key // BUCKETS][key % BUCKETS] = n
+
+    def row(name, cats):
+        answers = sum(summary.answers[c] for c in cats)
+        hist = collections.Counter()
+        for c in cats: hist.update(latency[c])
+        trend = []
+        for w in week_range:
+            total = sum(summary.week_answers[w << 16 | c] for c in cats)
+            trend.append(sum(summary.week_correct[w << 16 | c] for c in cats) / total if total else None)
+        return {"category": name, "answers": answers,
+                "accuracy": sum(summary.correct[c] for c in cats) / answers if answers else 0.0,
+                "timeouts": sum(summary.timeouts[c] for c in cats),
+                "p50_ms": percentile(hist, 0.5), "p90_ms": percentile(hist, 0.9), "trend": trend}
+
+    stats = [row(name, (i,)) for i, name in enumerate(categories) if summary.answers[i]]
+    stats.sort(key=lambda s: -s["answers"])
+    stats.append(row("Tümü", range(len(categories))))
+    return stats
+
+
+if __name__ == '__main__':
+    directory = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.expanduser("~"), ".islami_test", HISTORY_DIR)
+    t = time.perf_counter()
+    stats = category_stats(load_summary(directory), read_categories(directory))
+    elapsed = time.perf_counter() - t
+    ms = lambda v: "-" if v is None else f"{v / 1000:.1f} s"
+    print(f"{'Kategori':<24}{'Cevap':>8}{'Doğru':>8}{'Süre doldu':>12}{'p50':>9}{'p90':>9}  Son {TREND_WEEKS} hafta")
+    for s in stats:
+        print(f"{s['category']:<24}{s['answers']:>8}{s['accuracy']:>8.0%}{s['timeouts']:>12}"
+              f"{ms(s['p50_ms']):>9}{ms(s['p90_ms']):>9}  {sparkline(s['trend'])}")
+    print(f"({elapsed * 1000:.1f} ms)")
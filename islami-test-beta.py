@@ -4,6 +4,8 @@ import json
 import os
 import glob
 
+from oturum import KarisikSira
+
 from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                              QPushButton, QMessageBox, QProgressBar, QFrame, QGridLayout)
 from PyQt6.QtCore import Qt, QTimer, QUrl
@@ -14,6 +16,7 @@ class IslamiTestUygulamasi(QWidget):
     def __init__(self):
         super().__init__()
         self.questions = []
+        self.order = []
         self.current_q = 0
         self.score_correct = 0
         self.score_wrong = 0
@@ -119,7 +122,8 @@ class IslamiTestUygulamasi(QWidget):
             self.questions = [{"soru": "Soru dosyası bulunamadı!", "cevap": "Tamam", "siklar": ["Tamam", "Hata", "Yok", "Kontrol Et"]}]
         else:
             self.questions = all_questions
-            random.shuffle(self.questions)
+        # Havuz karıştırılmaz; soru sırası tembel permütasyondan okunur
+        self.order = KarisikSira(len(self.questions), random.getrandbits(32))
 
     def center_on_screen(self):
         # Ekranın merkez koordinatlarını hesaplar ve pencereyi oraya taşır
@@ -205,7 +209,7 @@ class IslamiTestUygulamasi(QWidget):
             self.time_left = self.max_time
             self.pbar.setValue(self.max_time)
             self.timer.start(1000)
-            q_data = self.questions[self.current_q]
+            q_data = self.questions[self.order[self.current_q]]
             self.lbl_count.setText(f"Soru: {self.current_q + 1} / {len(self.questions)}")
             self.lbl_timer.setText(f"⏱ {self.time_left}")
             self.lbl_question.setText(q_data["soru"])
@@ -234,7 +238,7 @@ class IslamiTestUygulamasi(QWidget):
     def check_answer(self):
         self.timer.stop()
         sender = self.sender()
-        correct_answer = self.questions[self.current_q]["cevap"]
+        correct_answer = self.questions[self.order[self.current_q]]["cevap"]
 
         if sender.text() == correct_answer:
             sender.setStyleSheet("background-color: #27ae60; color: white; border: none;")
@@ -252,7 +256,7 @@ class IslamiTestUygulamasi(QWidget):
         QTimer.singleShot(1500, self.next_question)
 
     def highlight_correct_answer(self):
-        ans = self.questions[self.current_q]["cevap"]
+        ans = self.questions[self.order[self.current_q]]["cevap"]
         for btn in self.buttons:
             if btn.text() == ans:
                 btn.setStyleSheet("background-color: #27ae60; color: white; border: none;")
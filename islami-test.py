@@ -1,42 +1,170 @@
+import time
+_T0 = time.perf_counter()
+
 import sys
-import random
-import json
 import os
-import glob
+import random
 
 from PyQt6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QPushButton, QMessageBox, QProgressBar, QFrame, QGridLayout, QStackedWidget)
-from PyQt6.QtCore import Qt, QTimer, QUrl
+                             QPushButton, QMessageBox, QProgressBar, QFrame, QGridLayout, QStackedWidget,
+                             QLineEdit, QListWidget, QTableWidget, QTableWidgetItem, QHeaderView)
+from PyQt6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QFont
-from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
+
+import soru_bankasi
+import arama
+from oturum import QuizSession
+from kayit import OturumGunlugu, JOURNAL_FILE
+import tekrar
+import gecmis
+import iz
+import bekci
+
+# ÖLÇÜM BAYRAKLARI: --startup-report açılış sürelerini ilk çizimden sonra,
+# --sound-latency her cevapta tıklamadan sesin başlamasına kadar geçen süreyi yazdırır,
+# --trace tıklama -> geri bildirim adımlarını Chrome iz biçiminde kaydeder (iz.py),
+# --watchdog[=ms] olay döngüsünün takıldığı anları yığınlarıyla raporlar (bekci.py)
+STARTUP_REPORT = "--startup-report" in sys.argv
+SOUND_LATENCY = "--sound-latency" in sys.argv
+TRACE = "--trace" in sys.argv
+
+def watchdog_flag(argv):
+    """--watchdog -> varsayılan eşik, --watchdog=N -> N ms, bayrak yoksa 0 (kapalı)."""
+    for arg in argv:
+        flag, eq, value = arg.partition("=")
+        if flag != "--watchdog": continue
+        if not eq: return bekci.DEFAULT_THRESHOLD_MS
+        try:
+            if int(value) > 0: return int(value)
+        except ValueError: pass
+        print(f"Uyarı: geçersiz --watchdog değeri '{value}', {bekci.DEFAULT_THRESHOLD_MS} ms kullanılıyor",
+              file=sys.stderr)
+        return bekci.DEFAULT_THRESHOLD_MS
+    return 0
+
+WATCHDOG_MS = watchdog_flag(sys.argv)
+STARTUP_MARKS = [("içe aktarma", time.perf_counter())]
+
+def mark_startup(phase):
+    STARTUP_MARKS.append((phase, time.perf_counter()))
+
+def print_startup_report():
+    print("Açılış süreleri:")
+    prev = _T0
+    for phase, t in STARTUP_MARKS:
+        print(f"  {phase:<14}{(t - prev) * 1000:9.1f} ms")
+        prev = t
+    print(f"  {'toplam':<14}{(prev - _T0) * 1000:9.1f} ms")
+
+class KategoriSinyalleri(QObject):
+    loaded = pyqtSignal(str, bool)
+
+def build_stylesheet(theme):
+    return f"""
+        QWidget {{ background-color: {theme['bg']}; color: {theme['text']}; }}
+        #questionBox {{
+            background-color: {theme['card']};
+            border-radius: 20px;
+            padding: 25px;
+            border: 2px solid {theme['accent']};
+        }}
+        QPushButton {{
+            background-color: {theme['btn']};
+            border: 1px solid {theme['border']};
+            border-radius: 10px;
+            color: {theme['text']};
+            padding: 10px;
+        }}
+        QPushButton:hover {{
+            background-color: {theme['accent']};
+            color: {theme['bg']};
+        }}
+        QPushButton[state="correct"] {{
+            background-color: #27ae60; color: white; border: none;
+        }}
+        QPushButton[state="wrong"] {{
+            background-color: #c0392b; color: white; border: none;
+        }}
+        QProgressBar {{
+            border: none;
+            background-color: {theme['btn']};
+            height: 8px;
+            border-radius: 4px;
+        }}
+        QProgressBar::chunk {{
+            background-color: {theme['accent']};
+            border-radius: 4px;
+        }}
+    """
+
+class AramaSinyalleri(QObject):
+    ready = pyqtSignal()
+
+class AramaIndeksleyici(QRunnable):
+    """Arama indeksini arka planda günceller (yalnızca değişen JSON dosyaları)."""
+    def __init__(self, db_path, directory, signals):
+        super().__init__()
+        self.db_path = db_path
+        self.directory = directory
+        self.signals = signals
+
+    def run(self):
+        try:
+            index = arama.SoruIndeksi(self.db_path)
+            index.update(self.directory)
+            index.close()
+        except: pass
+        self.signals.ready.emit()
+
+class KategoriYukleyici(QRunnable):
+    """Bir kategorinin sorularını arka planda yükler, bitince ana iş parçacığına haber verir."""
+    def __init__(self, catalog, name, signals):
+        super().__init__()
+        self.catalog = catalog
+        self.name = name
+        self.signals = signals
+
+    def run(self):
+        ok = self.catalog.prepare(self.name)
+        self.signals.loaded.emit(self.name, ok)
 
 class IslamiTestUygulamasi(QWidget):
-    def __init__(self):
+    def __init__(self, data_dir=None):
         super().__init__()
-        self.questions = []
-        self.all_data = {} 
-        self.current_q = 0
-        self.score_correct = 0
-        self.score_wrong = 0
+        # Soru paketlerinin klasörü; ölçümler sentetik bankalarla değiştirir
+        self.data_dir = data_dir or os.path.dirname(os.path.abspath(__file__))
+        self.session = None
+        self.catalog = None
+        self.category_buttons = {}
+        self.pending_state = None
+        self.review_scheduler = None
         self.max_time = 60
-        self.time_left = self.max_time
+        self.sample_size = 50
         self.is_muted = False
-        self.current_category = ""
         
         # AYAR DOSYASI YOLU (Home dizininde gizli bir klasör)
         self.save_dir = os.path.join(os.path.expanduser("~"), ".islami_test")
-        self.save_file = os.path.join(self.save_dir, "settings.json")
+        self.journal_file = os.path.join(self.save_dir, JOURNAL_FILE)
         
         if not os.path.exists(self.save_dir):
             os.makedirs(self.save_dir)
+        # Başlangıç, cevap ve bitiş kayıtları arka planda günlüğün sonuna eklenir
+        self.journal = OturumGunlugu(self.journal_file)
+        # Oturumlar arası cevap geçmişi (istatistik ekranı) sütun dosyalarında tutulur
+        self.history = gecmis.GecmisDeposu(os.path.join(self.save_dir, gecmis.HISTORY_DIR))
+        self.tracer = iz.Izleyici(os.path.join(self.save_dir, "iz.json")) if TRACE else iz.KAPALI
+        self.pending_transition = None
+        self.watchdog = None
+        if WATCHDOG_MS:
+            self.watchdog = bekci.Bekci(os.path.join(self.save_dir, bekci.REPORT_FILE), WATCHDOG_MS)
+            self.watchdog.start()
         
-        # SES MOTORU
-        self.media_player = QMediaPlayer()
-        self.audio_output = QAudioOutput()
-        self.media_player.setAudioOutput(self.audio_output)
-        self.audio_output.setVolume(0.7)
+        # SES MOTORU (QtMultimedia ilk play_sound çağrısında yüklenir)
+        self.sounds = None
+        self.first_paint_done = False
 
-        # RENK PALETLERİ
+        # RENK PALETLERİ (üretilen stiller theme_sheets içinde saklanır)
+        self.theme_sheets = {}
         self.day_style = {
             "bg": "#e0e0e0", "card": "#ffffff", "text": "#2d3436", 
             "accent": "#7f8c8d", "btn": "#f5f5f5", "border": "#bdc3c7"
@@ -47,15 +175,44 @@ class IslamiTestUygulamasi(QWidget):
         }
 
         self.load_all_categories()
+        mark_startup("veri yükleme")
         self.init_ui()
+        mark_startup("init_ui")
         self.apply_theme(self.day_style)
+        mark_startup("apply_theme")
         
+        # Geri sayım tek atımlık bir zamanlayıcıdır: yalnızca görünen saniye
+        # değişeceği ana kurulur, pencere gizliyken (gösterilmeden önce de) hiç kurulmaz
         self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.timer.timeout.connect(self.update_timer)
+        self.shown_second = None
+        self.window_hidden = True
         
         # Uygulama açıldığında kaldığı yeri kontrol et
         QTimer.singleShot(100, self.check_saved_state)
 
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.first_paint_done:
+            self.first_paint_done = True
+            mark_startup("ilk çizim")
+            if STARTUP_REPORT: print_startup_report()
+
+    def closeEvent(self, event):
+        self.journal.close()
+        self.history.close()
+        path = self.tracer.save()
+        if path: print(f"İz kaydedildi: {path}")
+        if self.watchdog is not None:
+            self.watchdog.stop()
+            print(f"Takılma raporu: {self.watchdog.save()}")
+            self.watchdog = None
+        if self.review_scheduler is not None:
+            self.review_scheduler.close()
+        super().closeEvent(event)
+
     def center_on_screen(self):
         qr = self.frameGeometry()
         cp = self.screen().availableGeometry().center()
@@ -63,80 +220,138 @@ class IslamiTestUygulamasi(QWidget):
         self.move(qr.topLeft())
 
     def load_all_categories(self):
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        json_files = glob.glob(os.path.join(current_dir, "*.json"))
-        
-        temp_data = {}
-        for file_path in json_files:
-            if "settings.json" in file_path: continue 
-            try:
-                category_name = os.path.basename(file_path).replace(".json", "").capitalize()
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        temp_data[category_name] = data
-            except: continue
-        
-        self.all_data = dict(sorted(temp_data.items()))
-
-    def save_state(self):
-        state = {
-            "category": self.current_category,
-            "current_index": self.current_q,
-            "correct": self.score_correct,
-            "wrong": self.score_wrong
+        # Yalnızca manifest burada okunur; kategoriler arka planda yüklenir ve
+        # her biri hazır oldukça butonu kategori ekranına eklenir
+        self.catalog = soru_bankasi.SoruKatalogu(self.data_dir)
+        self.loader_signals = KategoriSinyalleri()
+        self.loader_signals.loaded.connect(self.on_category_loaded)
+        pool = QThreadPool.globalInstance()
+        for name in self.catalog.names():
+            pool.start(KategoriYukleyici(self.catalog, name, self.loader_signals))
+
+    def on_category_loaded(self, name, ok):
+        if ok:
+            self.add_category_button(name)
+        # Kaldığı yer bu kategorideyse artık sorulabilir
+        if self.pending_state is not None and self.pending_state["category"] == name:
+            state, self.pending_state = self.pending_state, None
+            self.ask_resume(state)
+
+    def save_state(self, event, **extra):
+        # Her kayıt kaldığı yeri tek başına anlatır; devam için son satır yeterlidir
+        record = {
+            "type": event,
+            "category": self.session.category,
+            "seed": self.session.seed,
+            "current_index": self.session.current_q,
+            "correct": self.session.score_correct,
+            "wrong": self.session.score_wrong,
+            "ts": round(time.time(), 3)
         }
-        try:
-            with open(self.save_file, "w", encoding="utf-8") as f:
-                json.dump(state, f)
-        except: pass
+        record.update(extra)
+        self.journal.append(record)
+
+    def record_answer(self, chosen, is_correct):
+        self.save_state("answer",
+                        question_index=self.session.current_q,
+                        question=self.session.question_id,
+                        chosen=chosen,
+                        is_correct=is_correct,
+                        timeout=chosen is None,
+                        ms=self.session.response_ms)
+        category = self.session.category
+        if category == tekrar.REVIEW_CATEGORY:
+            category, question = tekrar.split_key(self.session.question_id)
+        else:
+            question = soru_bankasi.question_id(self.session.question.soru)
+        self.history.add(category, question, is_correct, chosen is None, self.session.response_ms)
 
     def check_saved_state(self):
-        """Kaldığı yeri kontrol eder ve TÜRKÇE butonlu mesaj kutusu gösterir."""
-        if os.path.exists(self.save_file):
+        """Kaldığı yeri kontrol eder; kategori henüz yüklenmediyse yüklenince sorar."""
+        state = self.journal.last_state()
+        if state is not None:
             try:
-                with open(self.save_file, "r", encoding="utf-8") as f:
-                    state = json.load(f)
-                
-                if state["category"] in self.all_data:
-                    # Mesaj kutusunu özelleştiriyoruz
-                    msg_box = QMessageBox(self)
-                    msg_box.setWindowTitle("Devam Et")
-                    msg_box.setText(f"'{state['category']}' kategorisinde kaldığınız yerden (Soru {state['current_index']+1}) devam etmek ister misiniz?")
-                    
-                    # Türkçe butonlar ekliyoruz
-                    evet_button = msg_box.addButton("Evet", QMessageBox.ButtonRole.YesRole)
-                    hayir_button = msg_box.addButton("Hayır", QMessageBox.ButtonRole.NoRole)
-                    msg_box.setDefaultButton(evet_button)
-                    
-                    msg_box.exec()
-                    
-                    if msg_box.clickedButton() == evet_button:
-                        self.current_category = state["category"]
-                        self.questions = list(self.all_data[self.current_category])
-                        self.current_q = state["current_index"]
-                        self.score_correct = state["correct"]
-                        self.score_wrong = state["wrong"]
-                        self.lbl_correct.setText(f"Doğru: {self.score_correct}")
-                        self.lbl_wrong.setText(f"Yanlış: {self.score_wrong}")
-                        self.stack.setCurrentIndex(1)
-                        self.load_question()
+                if state["category"] in self.catalog:
+                    if self.catalog.is_ready(state["category"]):
+                        self.ask_resume(state)
+                    else:
+                        self.pending_state = state
             except: pass
 
+    def ask_resume(self, state):
+        """TÜRKÇE butonlu mesaj kutusu ile devam etmek isteyip istemediğini sorar."""
+        if not self.catalog.prepare(state["category"]): return
+        try:
+            # Mesaj kutusunu özelleştiriyoruz
+            msg_box = QMessageBox(self)
+            msg_box.setWindowTitle("Devam Et")
+            msg_box.setText(f"'{state['category']}' kategorisinde kaldığınız yerden (Soru {state['current_index']+1}) devam etmek ister misiniz?")
+            
+            # Türkçe butonlar ekliyoruz
+            evet_button = msg_box.addButton("Evet", QMessageBox.ButtonRole.YesRole)
+            hayir_button = msg_box.addButton("Hayır", QMessageBox.ButtonRole.NoRole)
+            msg_box.setDefaultButton(evet_button)
+            
+            msg_box.exec()
+            
+            if msg_box.clickedButton() == evet_button:
+                self.ensure_game_ui()
+                questions = self.session_questions(state["category"], state["seed"])
+                self.session = QuizSession(questions, state["category"], self.max_time)
+                self.session.resume(state["seed"], state["current_index"], state["correct"], state["wrong"])
+                self.lbl_correct.setText(f"Doğru: {self.session.score_correct}")
+                self.lbl_wrong.setText(f"Yanlış: {self.session.score_wrong}")
+                self.stack.setCurrentWidget(self.game_widget)
+                self.load_question()
+        except: pass
+
+    def session_questions(self, category_name, seed):
+        # Büyük paketlerden tohuma bağlı rastgele bir alt küme akış halinde seçilir
+        return self.catalog.session_questions(category_name, seed, self.sample_size)
+
     def start_category(self, category_name):
-        self.current_category = category_name
-        self.questions = list(self.all_data[category_name])
-        random.shuffle(self.questions)
-        self.current_q = 0
-        self.score_correct = 0
-        self.score_wrong = 0
+        seed = random.getrandbits(32)
+        questions = self.session_questions(category_name, seed)
+        if not questions: return
+        self.begin_session(QuizSession(questions, category_name, self.max_time), seed)
+
+    def start_review(self):
+        """Tüm bankadan, vadesi gelen soruları soran aralıklı tekrar oturumu başlatır."""
+        if self.review_scheduler is None:
+            # Yalnızca soru metinleri okunur (kimlik için); sorular çözülmez
+            keys = list(dict.fromkeys(tekrar.question_key(name, qid)
+                                      for name in self.catalog.names() if not self.catalog.is_large(name)
+                                      for qid in self.catalog.question_ids(name)))
+            if not keys: return
+            self.review_scheduler = tekrar.TekrarPlanlayici(os.path.join(self.save_dir, tekrar.REVIEW_FILE), keys)
+        self.begin_session(tekrar.TekrarOturumu(self.review_scheduler, self.review_question, max_time=self.max_time))
+
+    def review_question(self, key):
+        return self.catalog.question_by_id(*tekrar.split_key(key))
+
+    def begin_session(self, session, seed=None):
+        self.ensure_game_ui()
+        self.session = session
+        self.session.start(seed)
         self.lbl_correct.setText("Doğru: 0")
         self.lbl_wrong.setText("Yanlış: 0")
         
-        self.save_state() 
-        self.stack.setCurrentIndex(1)
+        self.save_state("start", total=self.session.total)
+        self.stack.setCurrentWidget(self.game_widget)
         self.load_question()
 
+    def add_category_button(self, cat_name):
+        if cat_name in self.category_buttons: return
+        btn = QPushButton(cat_name)
+        btn.setMinimumHeight(85)
+        btn.setFont(QFont('Segoe UI', 12, QFont.Weight.Bold))
+        btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        btn.clicked.connect(lambda ch, name=cat_name: self.start_category(name))
+        # Yüklenme sırası ne olursa olsun her kategori manifestteki yerinde durur
+        row, col = divmod(self.catalog.names().index(cat_name), 2)
+        self.cat_grid.addWidget(btn, row, col)
+        self.category_buttons[cat_name] = btn
+
     def init_ui(self):
         self.setWindowTitle('İslami Bilgi Yarışması')
         self.setFixedSize(650, 720)
@@ -154,26 +369,42 @@ class IslamiTestUygulamasi(QWidget):
         cat_title.setFont(QFont('Segoe UI', 20, QFont.Weight.Bold))
         cat_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         cat_layout.addWidget(cat_title)
-        cat_layout.addSpacing(40)
+        cat_layout.addSpacing(20)
+
+        self.btn_search = QPushButton("🔍 Soru Ara")
+        self.btn_search.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.btn_search.clicked.connect(self.open_search)
+        self.btn_review = QPushButton("🧠 Tekrar Modu")
+        self.btn_review.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.btn_review.clicked.connect(self.start_review)
+        self.btn_stats = QPushButton("📊 İstatistikler")
+        self.btn_stats.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.btn_stats.clicked.connect(self.open_stats)
+        tools_box = QHBoxLayout()
+        tools_box.addWidget(self.btn_search)
+        tools_box.addWidget(self.btn_review)
+        tools_box.addWidget(self.btn_stats)
+        cat_layout.addLayout(tools_box)
+        cat_layout.addSpacing(20)
         
         self.cat_grid = QGridLayout()
         self.cat_grid.setSpacing(15)
         
-        row, col = 0, 0
-        for cat_name in self.all_data.keys():
-            btn = QPushButton(cat_name)
-            btn.setMinimumHeight(85)
-            btn.setFont(QFont('Segoe UI', 12, QFont.Weight.Bold))
-            btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.clicked.connect(lambda ch, name=cat_name: self.start_category(name))
-            self.cat_grid.addWidget(btn, row, col)
-            col += 1
-            if col > 1:
-                col = 0
-                row += 1
+        # Kategori butonları yüklendikçe add_category_button ile eklenir
         
         cat_layout.addLayout(self.cat_grid)
         cat_layout.addStretch()
+
+        # Yarışma ve arama ekranları ilk kullanılana kadar kurulmaz
+        self.game_widget = None
+        self.search_widget = None
+        self.search_index = None
+        self.stats_widget = None
+        self.stack.addWidget(self.category_widget)
+        self.main_layout.addWidget(self.stack)
+
+    def ensure_game_ui(self):
+        if self.game_widget is not None: return
         
         # --- EKRAN 2: YARIŞMA EKRANI ---
         self.game_widget = QWidget()
@@ -240,140 +471,276 @@ class IslamiTestUygulamasi(QWidget):
             btn.setFont(QFont('Segoe UI', 11))
             btn.setMinimumHeight(65)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.clicked.connect(self.check_answer)
+            btn.setProperty("state", "idle")
+            btn.clicked.connect(lambda ch, slot=i: self.check_answer(slot))
             self.grid.addWidget(btn, i // 2, i % 2)
             self.buttons.append(btn)
         game_layout.addLayout(self.grid)
 
-        self.stack.addWidget(self.category_widget)
         self.stack.addWidget(self.game_widget)
-        self.main_layout.addWidget(self.stack)
+
+    def open_search(self):
+        if self.search_widget is None:
+            # --- EKRAN 3: SORU ARAMA ---
+            self.search_widget = QWidget()
+            search_layout = QVBoxLayout(self.search_widget)
+
+            top_box = QHBoxLayout()
+            btn_back = QPushButton("⬅ Geri")
+            btn_back.clicked.connect(lambda: self.stack.setCurrentIndex(0))
+            self.search_input = QLineEdit()
+            self.search_input.setPlaceholderText("Soru, şık veya cevap ara...")
+            self.search_input.setFont(QFont('Segoe UI', 12))
+            top_box.addWidget(btn_back)
+            top_box.addWidget(self.search_input)
+            search_layout.addLayout(top_box)
+
+            self.lbl_search_status = QLabel("İndeks hazırlanıyor...")
+            search_layout.addWidget(self.lbl_search_status)
+            self.search_results = QListWidget()
+            self.search_results.setWordWrap(True)
+            search_layout.addWidget(self.search_results)
+            self.stack.addWidget(self.search_widget)
+
+            # Her tuşta değil, yazma durunca aranır
+            self.search_timer = QTimer()
+            self.search_timer.setSingleShot(True)
+            self.search_timer.timeout.connect(self.run_search)
+            self.search_input.textChanged.connect(lambda: self.search_timer.start(150))
+
+            self.search_signals = AramaSinyalleri()
+            self.search_signals.ready.connect(self.on_search_index_ready)
+            db_path = os.path.join(self.save_dir, arama.INDEX_FILE)
+            QThreadPool.globalInstance().start(AramaIndeksleyici(db_path, self.data_dir, self.search_signals))
+        self.stack.setCurrentWidget(self.search_widget)
+        self.search_input.setFocus()
+
+    def on_search_index_ready(self):
+        self.search_index = arama.SoruIndeksi(os.path.join(self.save_dir, arama.INDEX_FILE))
+        self.lbl_search_status.setText("")
+        self.run_search()
+
+    def run_search(self):
+        if self.search_index is None: return
+        self.search_results.clear()
+        text = self.search_input.text()
+        if not text.strip():
+            self.lbl_search_status.setText("")
+            return
+        results = self.search_index.search(text)
+        self.lbl_search_status.setText(f"{len(results)} sonuç")
+        for r in results:
+            self.search_results.addItem(f"[{r['category']}] {r['soru']}\n    ✔ {r['cevap']}")
+
+    def open_stats(self):
+        if self.stats_widget is None:
+            # --- EKRAN 4: İSTATİSTİKLER ---
+            self.stats_widget = QWidget()
+            stats_layout = QVBoxLayout(self.stats_widget)
+
+            top_box = QHBoxLayout()
+            btn_back = QPushButton("⬅ Geri")
+            btn_back.clicked.connect(lambda: self.stack.setCurrentIndex(0))
+            title = QLabel("İstatistikler")
+            title.setFont(QFont('Segoe UI', 16, QFont.Weight.Bold))
+            top_box.addWidget(btn_back)
+            top_box.addWidget(title)
+            top_box.addStretch()
+            stats_layout.addLayout(top_box)
+
+            self.lbl_stats_status = QLabel("")
+            stats_layout.addWidget(self.lbl_stats_status)
+            self.stats_table = QTableWidget(0, 7)
+            self.stats_table.setHorizontalHeaderLabels(
+                ["Kategori", "Cevap", "Doğru", "Süre doldu", "Orta süre", "%90 süre", f"Son {gecmis.TREND_WEEKS} hafta"])
+            self.stats_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+            self.stats_table.verticalHeader().setVisible(False)
+            self.stats_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+            self.stats_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+            stats_layout.addWidget(self.stats_table)
+            self.stack.addWidget(self.stats_widget)
+
+        # Toplamlar yazıcı iş parçacığında güncel tutulur; burada yalnızca tablo kurulur
+        stats = gecmis.category_stats(self.history.summary(), gecmis.read_categories(self.history.directory))
+        seconds = lambda ms: "-" if ms is None else f"{ms / 1000:.1f} sn"
+        self.stats_table.setRowCount(len(stats))
+        for row, s in enumerate(stats):
+            cells = [s["category"], str(s["answers"]), f"%{s['accuracy'] * 100:.0f}", str(s["timeouts"]),
+                     seconds(s["p50_ms"]), seconds(s["p90_ms"]), gecmis.sparkline(s["trend"])]
+            for col, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if col: item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                self.stats_table.setItem(row, col, item)
+        total = stats[-1]["answers"]
+        self.lbl_stats_status.setText(f"Toplam {total} cevap" if total else "Henüz cevap kaydı yok.")
+        self.stack.setCurrentWidget(self.stats_widget)
 
     def apply_theme(self, theme):
+        # Her tema için stil bir kez üretilir; cevap durumları [state=...] seçicileriyle
+        # aynı stilin içindedir, böylece cevapta CSS yeniden ayrıştırılmaz
+        if theme is getattr(self, "current_theme", None): return
         self.current_theme = theme
-        style = f"""
-            QWidget {{ background-color: {theme['bg']}; color: {theme['text']}; }}
-            #questionBox {{
-                background-color: {theme['card']};
-                border-radius: 20px;
-                padding: 25px;
-                border: 2px solid {theme['accent']};
-            }}
-            QPushButton {{
-                background-color: {theme['btn']};
-                border: 1px solid {theme['border']};
-                border-radius: 10px;
-                color: {theme['text']};
-                padding: 10px;
-            }}
-            QPushButton:hover {{
-                background-color: {theme['accent']};
-                color: {theme['bg']};
-            }}
-            QProgressBar {{
-                border: none;
-                background-color: {theme['btn']};
-                height: 8px;
-                border-radius: 4px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {theme['accent']};
-                border-radius: 4px;
-            }}
-        """
-        self.setStyleSheet(style)
+        key = tuple(theme.items())
+        if key not in self.theme_sheets:
+            self.theme_sheets[key] = build_stylesheet(theme)
+        self.setStyleSheet(self.theme_sheets[key])
 
     def load_question(self):
-        if self.current_q < len(self.questions):
-            self.save_state() 
-            self.time_left = self.max_time
-            self.pbar.setValue(self.max_time)
-            self.timer.start(1000)
-            q_data = self.questions[self.current_q]
-            self.lbl_count.setText(f"Soru: {self.current_q + 1} / {len(self.questions)}")
-            self.lbl_timer.setText(f"⏱ {self.time_left}")
-            self.lbl_question.setText(q_data["soru"])
-            opts = list(q_data["siklar"])
-            random.shuffle(opts)
+        with self.tracer.span("load_question", index=self.session.current_q):
+            self._load_question()
+
+    def _load_question(self):
+        q_data = self.session.load_question()
+        if q_data is not None:
+            self.lbl_count.setText(f"Soru: {self.session.current_q + 1} / {self.session.total}")
+            self.show_time_left()
+            self.schedule_tick()
+            self.lbl_question.setText(q_data.soru)
             for i, btn in enumerate(self.buttons):
-                btn.setText(opts[i])
+                # '&' Qt'de kısayol işaretidir; metinde aynen görünsün
+                btn.setText(self.session.options[i].replace("&", "&&"))
                 btn.setEnabled(True)
-                btn.setStyleSheet("") 
+                self.set_answer_state(btn, "idle")
+            self.tracer.until_paint("soru→boyama", self.lbl_question)
         else:
             self.show_result()
 
+    def show_time_left(self):
+        left = self.session.time_left
+        if left == self.shown_second: return
+        self.shown_second = left
+        self.pbar.setValue(left)
+        self.lbl_timer.setText(f"⏱ {left}")
+
+    def schedule_tick(self):
+        # Gizli pencerede (ör. geçiş sırasında küçültüldüyse) süre durur; showEvent sürdürür
+        if self.window_hidden:
+            self.session.pause_clock()
+            return
+        # Bir sonraki tam saniye sınırına kadar uyunur; son tarihten hesaplandığı için kaymaz
+        remaining = self.session.remaining_ns()
+        self.timer.start((remaining % 1_000_000_000) // 1_000_000 + 1 if remaining else 0)
+
     def update_timer(self):
-        if self.time_left > 0:
-            self.time_left -= 1
-            self.pbar.setValue(self.time_left)
-            self.lbl_timer.setText(f"⏱ {self.time_left}")
+        if not self.session.tick():
+            self.show_time_left()
+            self.schedule_tick()
         else:
-            self.timer.stop()
-            self.score_wrong += 1
-            self.lbl_wrong.setText(f"Yanlış: {self.score_wrong}")
+            self.show_time_left()
+            self.record_answer(None, False)
+            self.lbl_wrong.setText(f"Yanlış: {self.session.score_wrong}")
             self.play_sound("wrong")
             self.highlight_correct_answer()
+            self.pending_transition = self.tracer.begin("geçiş (singleShot 1500)")
             QTimer.singleShot(1500, self.next_question)
 
-    def check_answer(self):
+    def hideEvent(self, event):
+        # Simge durumuna küçültülen/gizlenen pencerede süre durur, zamanlayıcı uyandırmaz
+        self.window_hidden = True
+        if self.timer.isActive():
+            self.timer.stop()
+            self.session.pause_clock()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        self.window_hidden = False
+        if self.session is not None and self.session.paused_ns is not None:
+            self.session.resume_clock()
+            self.schedule_tick()
+        super().showEvent(event)
+
+    def check_answer(self, slot):
+        clicked_at = time.perf_counter()
+        with self.tracer.span("check_answer", slot=slot):
+            self._check_answer(slot, clicked_at)
+
+    def _check_answer(self, slot, clicked_at):
         self.timer.stop()
-        sender = self.sender()
-        correct_answer = self.questions[self.current_q]["cevap"]
-
-        if sender.text() == correct_answer:
-            sender.setStyleSheet("background-color: #27ae60; color: white; border: none;")
-            self.score_correct += 1
-            self.lbl_correct.setText(f"Doğru: {self.score_correct}")
-            self.play_sound("correct")
+        sender = self.buttons[slot]
+        self.tracer.until_paint("tıklama→boyama", sender, clicked_at)
+
+        with self.tracer.span("cevaplama"):
+            is_correct = self.session.answer(slot)
+            self.record_answer(self.session.options[slot], is_correct)
+        if is_correct:
+            self.set_answer_state(sender, "correct")
+            self.lbl_correct.setText(f"Doğru: {self.session.score_correct}")
+            self.play_sound("correct", clicked_at)
         else:
-            sender.setStyleSheet("background-color: #c0392b; color: white; border: none;")
-            self.score_wrong += 1
-            self.lbl_wrong.setText(f"Yanlış: {self.score_wrong}")
-            self.play_sound("wrong")
+            self.set_answer_state(sender, "wrong")
+            self.lbl_wrong.setText(f"Yanlış: {self.session.score_wrong}")
+            self.play_sound("wrong", clicked_at)
             self.highlight_correct_answer()
 
         for btn in self.buttons: btn.setEnabled(False)
+        self.pending_transition = self.tracer.begin("geçiş (singleShot 1500)")
         QTimer.singleShot(1500, self.next_question)
 
     def highlight_correct_answer(self):
-        ans = self.questions[self.current_q]["cevap"]
-        for btn in self.buttons:
-            if btn.text() == ans:
-                btn.setStyleSheet("background-color: #27ae60; color: white; border: none;")
+        self.set_answer_state(self.buttons[self.session.correct_slot], "correct")
+
+    def set_answer_state(self, btn, state):
+        # Yalnızca bu butonun özelliği değişir ve yalnızca o yeniden cilalanır
+        if btn.property("state") == state: return
+        with self.tracer.span("stil değişimi", state=state):
+            btn.setProperty("state", state)
+            btn.style().unpolish(btn)
+            btn.style().polish(btn)
+            btn.update()
 
     def next_question(self):
-        self.current_q += 1
-        self.load_question()
+        if self.pending_transition is not None:
+            self.tracer.end("geçiş (singleShot 1500)", self.pending_transition)
+            self.pending_transition = None
+        with self.tracer.span("next_question"):
+            self.session.next_question()
+            self.load_question()
 
     def toggle_sound(self):
         self.is_muted = not self.is_muted
         self.btn_mute.setText("🔈 Ses Kapalı" if self.is_muted else "🔊 Ses Açık")
-        self.audio_output.setMuted(self.is_muted)
+        if self.sounds is not None:
+            self.sounds.set_muted(self.is_muted)
 
-    def play_sound(self, result):
+    def ensure_sounds(self):
+        # Multimedya arka ucu (GStreamer/FFmpeg) ses gerçekten gerektiğinde yüklenir;
+        # efektler bir kez çözülür ve her cevapta yeniden açılmaz
+        # Arka uç yoksa (ör. libpulse eksik) hata Qt yuvasından çıkıp süreci sonlandırmasın:
+        # ses bir kez uyarılarak kapatılır ve oyun sessiz sürer
+        if self.sounds is not None: return True
+        try:
+            import ses
+            current_dir = os.path.dirname(os.path.abspath(__file__))
+            self.sounds = ses.SesEfektleri(current_dir, report_latency=SOUND_LATENCY)
+        except Exception as e:
+            print(f"Uyarı: ses kullanılamıyor, kapatıldı ({e})", file=sys.stderr)
+            self.is_muted = True
+            self.btn_mute.setText("🔈 Ses Yok")
+            self.btn_mute.setEnabled(False)
+            return False
+        return True
+
+    def play_sound(self, result, clicked_at=None):
         if self.is_muted: return
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        file_name = "correct.mp3" if result == "correct" else "wrong.mp3"
-        full_path = os.path.join(current_dir, file_name)
-        if os.path.exists(full_path):
-            self.media_player.setSource(QUrl.fromLocalFile(full_path))
-            self.media_player.play()
+        with self.tracer.span("play_sound", result=result):
+            if not self.ensure_sounds(): return
+            self.sounds.play("correct" if result == "correct" else "wrong", clicked_at)
 
     def show_result(self):
         self.timer.stop()
-        total = len(self.questions)
-        success = int((self.score_correct / total) * 100) if total > 0 else 0
-        QMessageBox.information(self, "Sonuç", f"Kategori Bitti!\n\nDoğru: {self.score_correct}\nYanlış: {self.score_wrong}\nBaşarı: %{success}")
-        
-        if os.path.exists(self.save_file):
-            try: os.remove(self.save_file)
-            except: pass
+        # Bitmiş oturum devam edilemez; bitiş kaydı hemen diske yazılır
+        self.save_state("end")
+        self.journal.flush()
+
+        success = self.session.success_rate()
+        QMessageBox.information(self, "Sonuç", f"Kategori Bitti!\n\nDoğru: {self.session.score_correct}\nYanlış: {self.session.score_wrong}\nBaşarı: %{success}")
             
         self.stack.setCurrentIndex(0)
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
+    mark_startup("QApplication")
     window = IslamiTestUygulamasi()
     window.show()
     sys.exit(app.exec())
\ No newline at end of file
@@ -0,0 +1,106 @@
+"""İsteğe bağlı gecikme izleme (Chrome/Perfetto iz biçimi).
+
+islami-test.py --trace ile açılır; kapanışta ~/.islami_test/iz.json yazılır.
+Dosya chrome://tracing veya ui.perfetto.dev ile açılır. Kaydedilenler:
+
+    X olayları     check_answer, cevaplama, stil değişimi (set_answer_state),
+                   play_sound, next_question, load_question gibi eşzamanlı adımlar
+    b/e olayları   araya olay döngüsü giren aralıklar: tıklamadan düğmenin bir
+                   sonraki boyanmasına kadar, singleShot(1500) geçişi, soru
+                   yüklenmesinden boyanmasına kadar
+
+Kapalıyken KAPALI kullanılır; her çağrı boş bir metottur.
+"""
+import os
+import json
+import time
+import threading
+import contextlib
+
+from PyQt6.QtCore import QObject, QEvent
+
+
+class _BoyamaFiltresi(QObject):
+    """İzlenen widget'ın ilk Paint olayında bekleyen aralıkları kapatır."""
+
+    def __init__(self, tracer):
+        super().__init__()
+        self.tracer = tracer
+        self.pending = {}
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            for name, span_id in self.pending.pop(obj, ()):
+                self.tracer.end(name, span_id, "boyama")
+        return False
+
+
+class Izleyici:
+    def __init__(self, path):
+        self.path = path
+        self.events = []
+        self.pid = os.getpid()
+        self._t0 = time.perf_counter()
+        self._next_id = 0
+        self._paint = _BoyamaFiltresi(self)
+        self._watched = set()
+
+    def _ts(self, t=None):
+        return round(((time.perf_counter() if t is None else t) - self._t0) * 1e6, 1)
+
+    def _event(self, ph, name, cat, ts, **fields):
+        self.events.append({"name": name, "cat": cat, "ph": ph, "ts": ts,
+                            "pid": self.pid, "tid": threading.get_ident(), **fields})
+
+    @contextlib.contextmanager
+    def span(self, name, cat="ui", **args):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._event("X", name, cat, self._ts(start), dur=round((time.perf_counter() - start) * 1e6, 1), args=args)
+
+    def begin(self, name, cat="ui", t=None, **args):
+        """Olay döngüsünü aşan bir aralık başlatır; end() için kimliğini döndürür."""
+        self._next_id += 1
+        self._event("b", name, cat, self._ts(t), id=self._next_id, args=args)
+        return self._next_id
+
+    def end(self, name, span_id, cat="ui"):
+        self._event("e", name, cat, self._ts(), id=span_id)
+
+    def until_paint(self, name, widget, t=None, **args):
+        """widget bir sonraki kez boyandığında kapanan aralık."""
+        span_id = self.begin(name, "boyama", t, **args)
+        if widget not in self._watched:
+            self._watched.add(widget)
+            widget.installEventFilter(self._paint)
+        self._paint.pending.setdefault(widget, []).append((name, span_id))
+        return span_id
+
+    def save(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+        return self.path
+
+
+class _Kapali:
+    _null = contextlib.nullcontext()
+
+    def span(self, name, cat="ui", **args):
+        return self._null
+
+    def begin(self, name, cat="ui", t=None, **args):
+        return None
+
+    def end(self, name, span_id, cat="ui"):
+        pass
+
+    def until_paint(self, name, widget, t=None, **args):
+        return None
+
+    def save(self):
+        return None
+
+
+KAPALI = _Kapali()
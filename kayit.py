@@ -0,0 +1,183 @@
+"""Oturum günlüğü: yalnızca sona eklenen kalıcı kayıt.
+
+Her kategori başlangıcı, her cevap (seçilen şık, doğru/yanlış, süre doldu mu,
+geçen süre) ve her bitiş ~/.islami_test/session.jsonl dosyasına tek satırlık
+bir JSON kaydı olarak eklenir. Kayıtlar arka plandaki tek bir iş parçacığında
+toplu halde yazılır; her ekleme O(1)'dir ve arayüzü bekletmez.
+
+Kaldığı yer yalnızca dosyanın son satırından okunur: her kayıt o andaki
+kategori, tohum ve puan bilgisini taşır. Yarım kalmış son satır (yazım
+ortasında çökme) atlanır. Dosya sınırı aşınca yalnızca bitmemiş son oturumun
+kayıtları bırakılarak sıkıştırılır (geçici dosya + atomik os.replace).
+
+Yazma/sıkıştırma düzeni EklemeGunlugu'ndedir; başka kalıcı kayıtlar (ör.
+tekrar.py) aynı sınıfı kendi sıkıştırma kuralıyla kullanır.
+"""
+import os
+import json
+import sys
+import time
+import threading
+import traceback
+
+JOURNAL_FILE = "session.jsonl"
+
+
+def read_records(path):
+    """Tüm okunabilir kayıtları sırayla verir; bozuk ve nesne olmayan satırları atlar."""
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                try: record = json.loads(line)
+                except ValueError: continue
+                if isinstance(record, dict): yield record
+    except OSError: return
+
+
+def read_last_record(path, block=4096):
+    """Dosyanın sonundaki ilk okunabilir kaydı döndürür; tüm dosyayı okumaz."""
+    try:
+        with open(path, "rb") as f:
+            end = f.seek(0, os.SEEK_END)
+            pos = end
+            tail = b""
+            while pos > 0:
+                step = min(block, pos)
+                pos -= step
+                f.seek(pos)
+                tail = f.read(step) + tail
+                lines = tail.split(b"\n")
+                # İlk parça bir önceki bloğa taşabilir; baştan okunmadıysa güvenilmez
+                complete = lines if pos == 0 else lines[1:]
+                for line in reversed(complete):
+                    if not line.strip(): continue
+                    try: record = json.loads(line)
+                    except ValueError: continue
+                    if isinstance(record, dict): return record
+    except OSError: pass
+    return None
+
+
+def resume_state(record):
+    """Son kayıttan devam durumu üretir; oturum bitmişse None."""
+    if record is None or record.get("type") == "end":
+        return None
+    state = {k: record.get(k) for k in ("category", "seed", "correct", "wrong")}
+    if record.get("type") == "answer":
+        state["current_index"] = record["question_index"] + 1
+    else:
+        state["current_index"] = record.get("current_index", 0)
+    return state
+
+
+class EklemeGunlugu:
+    """Arka planda toplu yazan, sınırı aşınca sıkıştırılan JSON Lines dosyası."""
+
+    def __init__(self, path, delay=0.2, max_bytes=256 * 1024):
+        self.path = path
+        self.delay = delay
+        self.max_bytes = max_bytes
+        # Sıkıştırmadan sonra dosya hâlâ büyükse bir sonraki sınır ona göre büyür
+        self._limit = max_bytes
+        self._cond = threading.Condition()
+        self._queue = []
+        self._writing = False
+        self._flush = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=os.path.basename(path), daemon=True)
+        self._thread.start()
+
+    def append(self, record):
+        with self._cond:
+            self._queue.append(record)
+            self._cond.notify_all()
+
+    def flush(self):
+        """Kuyruktaki kayıtlar diske yazılana kadar bekler; yazıcı yoksa beklemez."""
+        with self._cond:
+            self._flush = True
+            self._cond.notify_all()
+            while (self._queue or self._writing) and self._thread.is_alive():
+                self._cond.wait(0.1)
+            self._flush = False
+
+    def close(self):
+        if self._closed: return
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                # Kısa bir süre içinde gelen kayıtlar tek yazımda toplanır
+                deadline = time.monotonic() + self.delay
+                while not self._flush and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0: break
+                    self._cond.wait(remaining)
+                batch, self._queue = self._queue, []
+                self._writing = True
+            try:
+                self._append(batch)
+            except Exception:
+                # Kayıt işleyicisindeki bir hata yazıcıyı öldürmesin; flush/close beklemede kalır
+                print(f"{self.path}: kayıt yazılamadı", file=sys.stderr)
+                traceback.print_exc()
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
+
+    def _append(self, batch):
+        data = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in batch).encode("utf-8")
+        try:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, data)
+                os.fsync(fd)
+                size = os.fstat(fd).st_size
+            finally:
+                os.close(fd)
+            if size > self._limit:
+                self._compact()
+        except OSError: pass
+
+    def compact_records(self, records):
+        """Sıkıştırmada tutulacak kayıtlar; alt sınıflar kendi kuralını koyar."""
+        return records
+
+    def _compact(self):
+        keep = self.compact_records(list(read_records(self.path)))
+        data = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in keep)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._limit = max(self.max_bytes, 2 * len(data.encode("utf-8")))
+
+
+class OturumGunlugu(EklemeGunlugu):
+    def last_state(self):
+        """Kaldığı yer (category, seed, current_index, correct, wrong) veya None."""
+        self.flush()
+        return resume_state(read_last_record(self.path))
+
+    def compact_records(self, records):
+        # Yalnızca bitmemiş son oturumun kayıtları tutulur
+        keep = []
+        for record in records:
+            if record.get("type") == "start":
+                keep = []
+            keep.append(record)
+        if keep and keep[-1].get("type") == "end":
+            keep = []
+        return keep
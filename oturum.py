@@ -0,0 +1,203 @@
+"""Arayüzden bağımsız yarışma motoru.
+
+QuizSession soruların karıştırılmasını, şıkların karıştırılmasını, puanlamayı
+ve süre dolmasını yönetir; Qt içe aktarmaz. IslamiTestUygulamasi bu motoru
+sürer, aynı motor ekransız ön yüzlerde ve benchmarks/ altındaki ölçümlerde
+de kullanılır.
+
+Soru sırası kategori kopyalanıp karıştırılmadan, tohumdan türetilen tembel bir
+permütasyonla (KarisikSira) üretilir; ilk sorunun gecikmesi kategori boyutuyla
+büyümez ve kaldığı yer için tohum + current_q yeterlidir.
+
+Süre saniye saniye azaltılan bir sayaç değil, monoton saatten (time.monotonic_ns)
+bir son tarihtir: olay döngüsü gecikse de kaymaz, cevap süresi milisaniye
+olarak bilinir (response_ms) ve saat pause_clock/resume_clock ile durdurulabilir.
+"""
+import time
+import random
+
+
+class KarisikSira:
+    """0..n-1 aralığının tohumlu, tembel permütasyonu.
+
+    n'i kapsayan en küçük 2^k alanda her tur bir xorshift ve tek sayıyla
+    çarpıp toplama yapar; ikisi de mod 2^k tersinir olduğundan sonuç bir
+    bijeksiyondur. n dışına düşen değerler yeniden karıştırılır (cycle
+    walking, alan 2n'den küçük olduğundan ortalama 2 denemeden az). Her
+    indeks O(1) işle hesaplanır, durum yalnızca n ve tur anahtarlarıdır.
+    """
+
+    def __init__(self, n, seed, rounds=4):
+        self.n = n
+        bits = max(1, (n - 1).bit_length())
+        self.mask = (1 << bits) - 1
+        self.shift = (bits + 1) // 2
+        rng = random.Random(seed)
+        self.keys = [(rng.getrandbits(bits) | 1, rng.getrandbits(bits)) for _ in range(rounds)]
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.n:
+            raise IndexError(i)
+        mask, shift, n = self.mask, self.shift, self.n
+        x = i
+        while True:
+            for mul, add in self.keys:
+                x ^= x >> shift
+                x = (x * mul + add) & mask
+            if x < n:
+                return x
+
+
+class QuizSession:
+    def __init__(self, questions, category="", max_time=60, rng=None, clock=None):
+        self.questions = questions
+        self.category = category
+        self.max_time = max_time
+        self.rng = rng or random.Random()
+        self.clock = clock or time.monotonic_ns
+        # Soru sırası questions içindeki indekslerdir; tohumdan yeniden üretilebilir
+        self.seed = None
+        self.order = range(len(questions))
+        self._id_at = (-1, -1)
+        self.current_q = 0
+        self.score_correct = 0
+        self.score_wrong = 0
+        self.deadline_ns = 0
+        self.limit_ns = 0
+        self.paused_ns = None
+        # Cevap anında kalan süre; response_ms bundan yalnızca okunduğunda hesaplanır
+        self.answered_left_ns = None
+        self.options = []
+        self.correct_slot = -1
+
+    def _shuffle_order(self, seed):
+        self.seed = seed
+        self.order = KarisikSira(len(self.questions), seed)
+        self._id_at = (-1, -1)
+
+    def start(self, seed=None):
+        """Soruları karıştırır ve puanları sıfırlar."""
+        self._shuffle_order(self.rng.getrandbits(32) if seed is None else seed)
+        self.current_q = 0
+        self.score_correct = 0
+        self.score_wrong = 0
+
+    def resume(self, seed, current_q, correct, wrong):
+        """Aynı tohumla aynı soru sırasını kurar ve kaldığı yere döner."""
+        if seed is not None:
+            self._shuffle_order(seed)
+        self.current_q = current_q
+        self.score_correct = correct
+        self.score_wrong = wrong
+
+    @property
+    def total(self):
+        return len(self.questions)
+
+    @property
+    def finished(self):
+        return self.current_q >= len(self.questions)
+
+    @property
+    def question_id(self):
+        """Geçerli sorunun kategori içindeki indeksi."""
+        # Permütasyon her soru için bir kez hesaplanır
+        current, index = self._id_at
+        if current != self.current_q:
+            index = self.order[self.current_q]
+            self._id_at = (self.current_q, index)
+        return index
+
+    @property
+    def question(self):
+        return self.questions[self.question_id]
+
+    @property
+    def answer_text(self):
+        return self.questions[self.question_id].cevap
+
+    @property
+    def time_left(self):
+        """Ekranda görünen kalan saniye (yukarı yuvarlanmış)."""
+        return (self.remaining_ns() + 999_999_999) // 1_000_000_000
+
+    @property
+    def response_ms(self):
+        """Son puanlanan cevabın süresi (milisaniye); puanlanmadıysa None."""
+        left = self.answered_left_ns
+        if left is None:
+            return None
+        return (self.limit_ns - max(left, 0)) // 1_000_000
+
+    def remaining_ns(self):
+        if self.paused_ns is not None:
+            return self.paused_ns
+        return max(0, self.deadline_ns - self.clock())
+
+    def pause_clock(self):
+        """Kalan süreyi dondurur (ör. pencere gizlenince)."""
+        if self.paused_ns is None:
+            self.paused_ns = self.remaining_ns()
+
+    def resume_clock(self):
+        if self.paused_ns is not None:
+            self.deadline_ns = self.clock() + self.paused_ns
+            self.paused_ns = None
+
+    def load_question(self):
+        """Sıradaki soruyu hazırlar (süre başlar, şıklar karıştırılır); bittiyse None."""
+        if self.finished:
+            return None
+        q = self.question
+        # random.shuffle'ın _randbelow yolu 4 şık için pahalı; aynı Fisher-Yates, random() ile.
+        # Doğru cevabın hangi yuvaya düştüğü karıştırırken izlenir; başlangıç yuvası soruda saklıdır
+        opts = list(q.siklar)
+        slot = q.cevap_index
+        rand = self.rng.random
+        for i in range(len(opts) - 1, 0, -1):
+            j = int(rand() * (i + 1))
+            opts[i], opts[j] = opts[j], opts[i]
+            if slot == i: slot = j
+            elif slot == j: slot = i
+        self.options = opts
+        self.correct_slot = slot
+        self.answered_left_ns = None
+        self.paused_ns = None
+        self.limit_ns = self.max_time * 1_000_000_000
+        self.deadline_ns = self.clock() + self.limit_ns
+        return q
+
+    def answer(self, slot):
+        """Verilen yuvadaki şıkkı puanlar, doğruysa True döner."""
+        # Sıcak yol: saat bir kez okunur, milisaniye hesabı response_ms okunana kadar ertelenir
+        paused = self.paused_ns
+        self.answered_left_ns = self.deadline_ns - self.clock() if paused is None else paused
+        if slot == self.correct_slot:
+            self.score_correct += 1
+            self.graded(True)
+            return True
+        self.score_wrong += 1
+        self.graded(False)
+        return False
+
+    def tick(self):
+        """Son tarih geçtiyse soruyu yanlış sayar ve True döner."""
+        if self.remaining_ns() > 0:
+            return False
+        self.answered_left_ns = 0
+        self.score_wrong += 1
+        self.graded(False)
+        return True
+
+    def graded(self, correct):
+        """Geçerli soru puanlandığında çağrılır; alt sınıflar (ör. tekrar modu) kullanır."""
+
+    def next_question(self):
+        self.current_q += 1
+
+    def success_rate(self):
+        total = self.total
+        return int((self.score_correct / total) * 100) if total > 0 else 0
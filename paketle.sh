@@ -8,21 +8,20 @@ INSTALL_DIR="/opt/$APP_NAME"
 
 echo "--- .deb Paketi Hazırlama İşlemi Başladı ---"
 
-# 1. Temizlik ve Dizin Oluşturma
-rm -rf $DEB_DIR
+# 0. Soru Paketlerini Doğrula (hatalı kayıt varsa paketleme durur)
+echo "Soru paketleri doğrulanıyor..."
+python3 dogrula.py || exit 1
+
+# Paket içindeki tüm zamanlar bu ana sabitlenir (yeniden üretilebilir paket)
+export SOURCE_DATE_EPOCH=${SOURCE_DATE_EPOCH:-$(git log -1 --format=%ct 2>/dev/null || echo 0)}
+
+# 1. Dizin Oluşturma (hazırlık ağacı silinmez, derle.py onu artımlı günceller)
 mkdir -p $DEB_DIR/DEBIAN
 mkdir -p $DEB_DIR$INSTALL_DIR
 mkdir -p $DEB_DIR/usr/bin
 mkdir -p $DEB_DIR/usr/share/applications
 
-# 2. Uygulama Dosyalarını Kopyala
-echo "Dosyalar kopyalanıyor..."
-cp *.py $DEB_DIR$INSTALL_DIR/
-cp *.json $DEB_DIR$INSTALL_DIR/
-cp *.mp3 $DEB_DIR$INSTALL_DIR/ 2>/dev/null || true
-cp icon.png $DEB_DIR$INSTALL_DIR/ 2>/dev/null || true
-
-# 3. Kontrol Dosyası Oluştur (DEBIAN/control)
+# 2. Kontrol Dosyası Oluştur (DEBIAN/control)
 cat <<EOF > $DEB_DIR/DEBIAN/control
 Package: $APP_NAME
 Version: $VERSION
@@ -35,14 +34,14 @@ Description: PyQt6 ile hazırlanmış İslami Bilgi Yarışması.
  1400 karma soru ile
 EOF
 
-# 4. Başlatıcı Script Oluştur (Bin)
+# 3. Başlatıcı Script Oluştur (Bin)
 cat <<EOF > $DEB_DIR/usr/bin/$APP_NAME
 #!/bin/bash
 cd $INSTALL_DIR && python3 islami-test.py
 EOF
 chmod +x $DEB_DIR/usr/bin/$APP_NAME
 
-# 5. Masaüstü Kısayolu Oluştur (.desktop)
+# 4. Masaüstü Kısayolu Oluştur (.desktop)
 cat <<EOF > $DEB_DIR/usr/share/applications/$APP_NAME.desktop
 [Desktop Entry]
 Name=İslami Test
@@ -54,16 +53,17 @@ Categories=Education;
 Terminal=false
 EOF
 
-# 6. Python Kodundaki Dosya Yollarını Sabitle (Opsiyonel ama Önemli)
+# 5. Python Kodundaki Dosya Yollarını Sabitle (Opsiyonel ama Önemli)
 # Kodun içindeki yerel yolları /opt dizinine yönlendirmek için:
 # sed -i "s|open('|open('$INSTALL_DIR/|g" $DEB_DIR$INSTALL_DIR/*.py
 
-# 7. İzinleri Ayarla
-sudo chown -R root:root $DEB_DIR
-sudo chmod -R 755 $DEB_DIR
+# 6. Uygulama Dosyalarını Derle (yalnızca girdisi değişen çıktılar yeniden üretilir:
+#    kopyalar, soru bankası, .pyc, WAV sesler) ve izin/zamanları sabitle
+echo "Uygulama dosyaları derleniyor..."
+python3 derle.py $DEB_DIR $INSTALL_DIR || exit 1
 
-# 8. Paketi Oluştur
-dpkg-deb --build $DEB_DIR
+# 7. Paketi Oluştur (sahiplik sudo chown yerine paket içinde root:root verilir)
+dpkg-deb --root-owner-group --build $DEB_DIR
 
 echo "--- İşlem Tamamlandı! ---"
 echo "Kurulum için: sudo apt install ./$DEB_DIR.deb"
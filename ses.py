@@ -0,0 +1,87 @@
+"""Cevap ses efektleri.
+
+paketle.sh correct.mp3/wrong.mp3 dosyalarını derleme sırasında WAV'a çevirir.
+WAV varsa her efekt QSoundEffect ile bir kez belleğe (PCM) çözülür ve küçük bir
+ses havuzundan çalınır; art arda verilen cevaplar yeniden çözme olmadan üst
+üste binebilir. WAV yoksa her efekt için kaynağı bir kez atanmış ayrı bir
+QMediaPlayer kullanılır.
+"""
+import os
+import time
+
+from PyQt6.QtCore import QUrl
+from PyQt6.QtMultimedia import QSoundEffect, QMediaPlayer, QAudioOutput
+
+EFFECTS = ("correct", "wrong")
+
+
+class SesEfektleri:
+    def __init__(self, directory, voices=3, volume=0.7, report_latency=False):
+        self.report_latency = report_latency
+        self.latencies = []
+        self.pools = {}
+        self.next_voice = {}
+        self._outputs = []
+        for name in EFFECTS:
+            wav = os.path.join(directory, f"{name}.wav")
+            mp3 = os.path.join(directory, f"{name}.mp3")
+            if os.path.exists(wav):
+                pool = []
+                for _ in range(voices):
+                    effect = QSoundEffect()
+                    effect.setSource(QUrl.fromLocalFile(wav))
+                    effect.setVolume(volume)
+                    pool.append(effect)
+            elif os.path.exists(mp3):
+                player = QMediaPlayer()
+                output = QAudioOutput()
+                output.setVolume(volume)
+                player.setAudioOutput(output)
+                player.setSource(QUrl.fromLocalFile(mp3))
+                self._outputs.append(output)
+                pool = [player]
+            else:
+                continue
+            for voice in pool:
+                voice.playingChanged.connect(lambda *args, v=voice: self._on_playing_changed(v))
+            self.pools[name] = pool
+            self.next_voice[name] = 0
+        self._pending = {}
+
+    def set_muted(self, muted):
+        for pool in self.pools.values():
+            for voice in pool:
+                if isinstance(voice, QSoundEffect):
+                    voice.setMuted(muted)
+        for output in self._outputs:
+            output.setMuted(muted)
+
+    def play(self, name, clicked_at=None):
+        """Efekti boştaki (yoksa en eski) sesten çalar; clicked_at perf_counter zamanıdır."""
+        pool = self.pools.get(name)
+        if not pool: return
+        i = self.next_voice[name]
+        for k in range(len(pool)):
+            if not pool[(i + k) % len(pool)].isPlaying():
+                i = (i + k) % len(pool)
+                break
+        self.next_voice[name] = (i + 1) % len(pool)
+        voice = pool[i]
+        if isinstance(voice, QMediaPlayer):
+            voice.setPosition(0)
+        else:
+            voice.stop()
+        if clicked_at is not None:
+            self._pending[id(voice)] = (name, clicked_at)
+        voice.play()
+
+    def _on_playing_changed(self, voice):
+        # Tıklamadan Qt'nin çalmaya başladığını bildirmesine kadar geçen süre
+        if not voice.isPlaying(): return
+        pending = self._pending.pop(id(voice), None)
+        if pending is None: return
+        name, clicked_at = pending
+        ms = (time.perf_counter() - clicked_at) * 1000
+        self.latencies.append(ms)
+        if self.report_latency:
+            print(f"Ses gecikmesi ({name}): {ms:.1f} ms")
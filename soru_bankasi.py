@@ -0,0 +1,540 @@
+"""Soru bankası: JSON kaynak dosyaları ve derlenmiş ikili banka.
+
+JSON dosyaları kaynak biçimidir. paketle.sh bunları tek bir ikili dosyaya
+(soru-bankasi.bin) derler; uygulama bu dosyayı mmap ile açar ve açılışta
+hiçbir JSON ayrıştırmaz. Banka yoksa veya kaynaklardan eskiyse JSON'a dönülür.
+Okunamayan kaynaklar bankada 0 soruluk kategori olarak kalır; JSON'a dönüşte
+de boş sayılacakları için banka geçerliliğini yitirmez.
+
+Uygulama soruları SoruKatalogu üzerinden okur: açılışta yalnızca küçük bir
+manifest (kategori adı, soru sayısı, kaynak dosya / banka ofseti) kurulur,
+bir kategorinin soruları ilk istendiğinde yüklenir.
+
+Kaynaklar tek bir JSON dizisi (*.json) ya da satır başına bir soru (*.jsonl)
+olabilir. Çok büyük paketler belleğe hiç alınmaz: iter_questions soruları
+akış halinde tek tek verir, oturum için rastgele N soru reservoir_sample ile
+seçilir.
+
+Bellekte her soru bir Soru kaydıdır (__slots__): soru metni, şıkların
+tuple'ı ve cevabın şıklar içindeki sırası. Şık dizgileri ("4", "5", peygamber
+adları ...) ve aynı şık takımları tekrarsız bir havuzdan paylaşılır; cevap
+ayrıca saklanmaz. memory_report() yüklü soruların kapladığı baytı hesaplar.
+
+Dosya düzeni (tüm tamsayılar little-endian):
+
+    BAŞLIK      4s magic, H sürüm, H kategori sayısı, I soru sayısı,
+                I havuzdaki şık sayısı
+    KATEGORİLER her biri: I ilk soru, I soru sayısı,
+                H+utf8 kategori adı, H+utf8 kaynak dosya adı
+    ŞIK OFSETLERİ (şık sayısı) adet I, havuzdaki her şıkkın başlangıcı
+    ŞIKLAR      her biri H+utf8, tekrarsız şık havuzu
+    OFSETLER    (soru sayısı + 1) adet I, her kaydın dosya içi başlangıcı
+    KAYITLAR    H+utf8 soru, B şık sayısı, B cevabın şık sırası,
+                her şık için I havuz indeksi
+"""
+import sys
+import os
+import glob
+import json
+import math
+import mmap
+import random
+import zlib
+import struct
+import itertools
+
+BANK_FILE = "soru-bankasi.bin"
+MAGIC = b"ITSB"
+VERSION = 3
+
+_HEADER = struct.Struct("<4sHHII")
+_CATEGORY = struct.Struct("<II")
+_U32 = struct.Struct("<I")
+_U16 = struct.Struct("<H")
+
+# Arayüzde dört şık düğmesi var; başka sayıda şıklı soru gösterilemez
+OPTION_COUNT = 4
+# Bu boyutu/sayıyı aşan kategoriler tamamen yüklenmez, örneklenir
+LARGE_PACK_BYTES = 8 * 1024 * 1024
+LARGE_PACK_QUESTIONS = 20000
+
+
+def category_name(file_path):
+    return os.path.splitext(os.path.basename(file_path))[0].capitalize()
+
+
+def find_sources(directory):
+    """Klasördeki soru dosyalarını (settings.json hariç) sıralı döndürür."""
+    json_files = glob.glob(os.path.join(directory, "*.json")) + glob.glob(os.path.join(directory, "*.jsonl"))
+    return sorted(p for p in json_files if "settings.json" not in p)
+
+
+def question_id(text):
+    """Soru metninin kararlı 32 bitlik kimliği; paket düzenlenip sıralar kaysa da değişmez."""
+    return zlib.crc32(text.encode("utf-8"))
+
+
+def is_valid_question(q):
+    # Eksik veya yanlış tipte alanı olan kayıt çalışma anında hata verir ya da hiç doğru cevaplanamaz;
+    # cevap şıklarda tam bir kez geçmelidir ki doğru yuva karıştırmada tek anlamlı olsun
+    return (isinstance(q, dict)
+            and isinstance(q.get("soru"), str)
+            and isinstance(q.get("cevap"), str)
+            and isinstance(q.get("siklar"), list)
+            and len(q["siklar"]) == OPTION_COUNT
+            and all(isinstance(s, str) for s in q["siklar"])
+            and q["siklar"].count(q["cevap"]) == 1)
+
+
+class Soru:
+    """Tek soru; eski sözlük erişimi (q["soru"], q["cevap"]) de çalışır."""
+    __slots__ = ("soru", "siklar", "cevap_index")
+
+    def __init__(self, soru, siklar, cevap_index):
+        self.soru = soru
+        self.siklar = siklar
+        self.cevap_index = cevap_index
+
+    @property
+    def cevap(self):
+        return self.siklar[self.cevap_index]
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    @classmethod
+    def from_dict(cls, q, pool):
+        """JSON kaydından Soru üretir; şıklar ve şık takımı pool'dan paylaşılır."""
+        siklar = tuple(pool.setdefault(s, s) for s in q["siklar"])
+        return cls(q["soru"], pool.setdefault(siklar, siklar), q["siklar"].index(q["cevap"]))
+
+
+def memory_report(questions):
+    """Soruların bellekte kapladığı bayt; paylaşılan nesneler bir kez sayılır."""
+    seen = set()
+    report = {"questions": 0, "records": 0, "text": 0, "option_sets": 0, "options": 0, "unique_options": 0}
+
+    def size(obj):
+        if id(obj) in seen: return 0
+        seen.add(id(obj))
+        return sys.getsizeof(obj)
+
+    questions = list(questions)
+    for q in questions:
+        report["questions"] += 1
+        if isinstance(q, dict):
+            # Karşılaştırma için eski gösterim: sözlük + şık listesi + ayrı cevap dizgisi
+            report["records"] += size(q)
+            report["text"] += size(q["soru"]) + size(q["cevap"])
+        else:
+            report["records"] += size(q)
+            report["text"] += size(q.soru)
+        report["option_sets"] += size(q["siklar"])
+        for s in q["siklar"]:
+            n = size(s)
+            report["options"] += n
+            report["unique_options"] += n > 0
+    report["total"] = report["records"] + report["text"] + report["option_sets"] + report["options"]
+    return report
+
+
+def iter_json_array(file_path, chunk_size=1 << 16):
+    """Tek bir JSON dizisinin elemanlarını dosyayı parça parça okuyarak verir.
+
+    Dosya UTF-8 BOM ile başlayabilir (dogrula.py de kabul eder).
+    """
+    decoder = json.JSONDecoder()
+    with open(file_path, 'r', encoding='utf-8-sig') as f:
+        buf = f.read(chunk_size).lstrip()
+        if not buf.startswith("["):
+            raise ValueError(f"JSON dizisi değil: {file_path}")
+        pos = 1
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos == len(buf):
+                buf, pos = f.read(chunk_size), 0
+                # Kapanış ']' gelmeden biten dosya yarım yazılmıştır; eksik paket tam sayılmasın
+                if not buf: raise ValueError(f"JSON dizisi kapanmamış: {file_path}")
+                continue
+            if buf[pos] == "]": return
+            try:
+                obj, end = decoder.raw_decode(buf, pos)
+            except ValueError:
+                # Eleman parçanın sonunda kesilmiş; bir sonraki parçayla birleştir
+                chunk = f.read(chunk_size)
+                if not chunk: raise
+                buf, pos = buf[pos:] + chunk, 0
+                continue
+            yield obj
+            pos = end
+
+
+def iter_json_lines(file_path):
+    with open(file_path, 'r', encoding='utf-8-sig') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_questions(file_path):
+    """Kaynaktaki geçerli soruları belleğe toplamadan tek tek verir."""
+    items = iter_json_lines(file_path) if file_path.endswith(".jsonl") else iter_json_array(file_path)
+    return (q for q in items if is_valid_question(q))
+
+
+def reservoir_sample(items, n, rng=None):
+    """Uzunluğu bilinmeyen bir akıştan eşit olasılıkla n eleman seçer (Algoritma L).
+
+    Her elemana rastgele sayı üretmek yerine atlanacak eleman sayısı
+    geometrik dağılımdan çekilir; akış bir kez okunur, bellekte n eleman kalır.
+    """
+    rng = rng or random.Random()
+    it = iter(items)
+    sample = list(itertools.islice(it, n))
+    if len(sample) < n or n == 0:
+        return sample
+    u = lambda: 1.0 - rng.random()   # (0, 1]
+    w = math.exp(math.log(u()) / n)
+    while w < 1.0:
+        skip = int(math.log(u()) / math.log(1.0 - w))
+        nxt = next(itertools.islice(it, skip, skip + 1), None)
+        if nxt is None:
+            break
+        sample[rng.randrange(n)] = nxt
+        w *= math.exp(math.log(u()) / n)
+    return sample
+
+
+def read_json_category(file_path):
+    if file_path.endswith(".jsonl"):
+        return list(iter_questions(file_path))
+    with open(file_path, 'r', encoding='utf-8-sig') as f:
+        data = json.load(f)
+    if not isinstance(data, list):
+        return None
+    return [q for q in data if is_valid_question(q)]
+
+
+def _pack_str(text):
+    raw = text.encode("utf-8")
+    return _U16.pack(len(raw)) + raw
+
+
+def _pack_question(q, pool):
+    siklar = q["siklar"]
+    ids = [pool.setdefault(s, len(pool)) for s in siklar]
+    return (_pack_str(q["soru"]) + bytes([len(siklar), siklar.index(q["cevap"])])
+            + struct.pack(f"<{len(ids)}I", *ids))
+
+
+def compile_bank(directory, out_path=None):
+    """Klasördeki JSON dosyalarını tek bir ikili bankaya derler."""
+    out_path = out_path or os.path.join(directory, BANK_FILE)
+    categories = []
+    pool = {}
+    for file_path in find_sources(directory):
+        try:
+            records = [_pack_question(q, pool) for q in iter_questions(file_path)]
+        except ValueError as e:
+            # Kaynak listesi open_bank'ta klasörle karşılaştırılır; atlanan dosya da yer almalı
+            print(f"Uyarı: {os.path.basename(file_path)} okunamadı, boş kategori olarak derlendi ({e})",
+                  file=sys.stderr)
+            records = []
+        categories.append((category_name(file_path), os.path.basename(file_path), records))
+    categories.sort(key=lambda c: c[0])
+    options = [_pack_str(s) for s in pool]
+
+    total = sum(len(c[2]) for c in categories)
+    table = []
+    first = 0
+    for name, source, records in categories:
+        table.append(_CATEGORY.pack(first, len(records)) + _pack_str(name) + _pack_str(source))
+        first += len(records)
+    table = b"".join(table)
+
+    offset = _HEADER.size + len(table) + _U32.size * len(options)
+    option_offsets = []
+    for rec in options:
+        option_offsets.append(offset)
+        offset += len(rec)
+
+    offset += _U32.size * (total + 1)
+    offsets = []
+    for _, _, records in categories:
+        for rec in records:
+            offsets.append(offset)
+            offset += len(rec)
+    offsets.append(offset)
+
+    tmp_path = out_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(categories), total, len(options)))
+        f.write(table)
+        f.write(struct.pack(f"<{len(options)}I", *option_offsets))
+        f.writelines(options)
+        f.write(struct.pack(f"<{total + 1}I", *offsets))
+        for _, _, records in categories:
+            f.writelines(records)
+    os.replace(tmp_path, out_path)
+    return out_path
+
+
+class SoruBankasi:
+    """mmap ile açılmış derlenmiş soru bankası."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, n_cat, self.total, n_options = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"Geçersiz soru bankası: {path}")
+
+        # Kategori tablosu bankanın manifestidir: ad -> (ilk soru, soru sayısı, kaynak)
+        self.categories = {}
+        pos = _HEADER.size
+        for _ in range(n_cat):
+            first, count = _CATEGORY.unpack_from(self._mm, pos)
+            pos += _CATEGORY.size
+            name, pos = self._read_str(pos)
+            source, pos = self._read_str(pos)
+            self.categories[name] = (first, count, source)
+        # Şıklar ve şık takımları ilk kullanıldıklarında çözülür, sonra paylaşılır
+        self._options_pos = pos
+        self._options = {}
+        self._option_sets = {}
+        pos += _U32.size * n_options
+        if n_options:
+            # Soru ofsetleri son şıkkın hemen ardından başlar
+            _, pos = self._read_str(self._option_offset(n_options - 1))
+        self._index_pos = pos
+
+    def _read_str(self, pos):
+        (n,) = _U16.unpack_from(self._mm, pos)
+        pos += 2
+        return self._mm[pos:pos + n].decode("utf-8"), pos + n
+
+    def _offset(self, i):
+        return _U32.unpack_from(self._mm, self._index_pos + 4 * i)[0]
+
+    def _option_offset(self, j):
+        return _U32.unpack_from(self._mm, self._options_pos + 4 * j)[0]
+
+    def _option(self, j):
+        s = self._options.get(j)
+        if s is None:
+            s = self._options[j] = self._read_str(self._option_offset(j))[0]
+        return s
+
+    def question(self, i):
+        pos = self._offset(i)
+        soru, pos = self._read_str(pos)
+        n, cevap_index = self._mm[pos], self._mm[pos + 1]
+        pos += 2
+        raw = self._mm[pos:pos + 4 * n]
+        siklar = self._option_sets.get(raw)
+        if siklar is None:
+            siklar = tuple(self._option(j) for j in struct.unpack(f"<{n}I", raw))
+            self._option_sets[raw] = siklar
+        return Soru(soru, siklar, cevap_index)
+
+    def question_text(self, i):
+        """Yalnızca soru metni; şıklar çözülmez."""
+        return self._read_str(self._offset(i))[0]
+
+    def questions(self, name):
+        first, count, _ = self.categories[name]
+        return [self.question(i) for i in range(first, first + count)]
+
+    def close(self):
+        self._mm.close()
+
+
+def open_bank(directory):
+    """Derlenmiş banka varsa ve kaynaklarla uyumluysa açar, yoksa None döner."""
+    path = os.path.join(directory, BANK_FILE)
+    try:
+        bank_mtime = os.stat(path).st_mtime_ns
+        sources = find_sources(directory)
+        # Kaynak eklenmiş/silinmişse veya bankadan yeni bir kaynak varsa banka bayattır
+        if any(os.stat(p).st_mtime_ns > bank_mtime for p in sources):
+            return None
+        bank = SoruBankasi(path)
+    except (OSError, ValueError, struct.error):
+        return None
+    if sorted(c[2] for c in bank.categories.values()) != [os.path.basename(p) for p in sources]:
+        bank.close()
+        return None
+    return bank
+
+
+class SoruKatalogu:
+    """Kategori manifesti ve soruların kategori bazında tembel yüklenmesi.
+
+    manifest: kategori adı -> {"count", "source", "first", "large"}. Derlenmiş
+    banka varsa sayılar ve ofsetler banka tablosundan gelir; JSON'a dönüldüğünde
+    yalnızca dosya adları bilinir, sayı ilk yüklemede doldurulur. "large"
+    kategoriler hiçbir zaman tamamen yüklenmez, sample() ile örneklenir.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.bank = open_bank(directory)
+        self.manifest = {}
+        self._pool = {}
+        self._loaded = {}
+        self._ids = {}
+        self._ready = set()
+        if self.bank is not None:
+            for name, (first, count, source) in self.bank.categories.items():
+                self.manifest[name] = {"count": count, "source": source, "first": first,
+                                       "large": count > LARGE_PACK_QUESTIONS}
+        else:
+            for file_path in find_sources(directory):
+                self.manifest[category_name(file_path)] = {
+                    "count": None, "source": os.path.basename(file_path), "first": None,
+                    "large": os.path.getsize(file_path) > LARGE_PACK_BYTES}
+        self.manifest = dict(sorted(self.manifest.items()))
+
+    def __contains__(self, name):
+        return name in self.manifest
+
+    def names(self):
+        return list(self.manifest)
+
+    def is_large(self, name):
+        return self.manifest[name]["large"]
+
+    def count(self, name):
+        """Soru sayısı; banka varsa tablodan, yoksa JSON bir kez yüklenerek."""
+        count = self.manifest[name]["count"]
+        return len(self.questions(name)) if count is None else count
+
+    def is_ready(self, name):
+        return name in self._ready
+
+    def prepare(self, name):
+        """Kategoriyi kullanıma hazırlar; içinde en az bir geçerli soru varsa True.
+
+        Banka varsa sayı banka tablosundan gelir, hiçbir soru çözülmez. JSON'da
+        normal kategoriler yüklenir, büyük kategorilerde yalnızca ilk soru okunur.
+        """
+        entry = self.manifest[name]
+        if self.bank is not None:
+            ok = entry["count"] > 0
+        elif not entry["large"]:
+            ok = bool(self.questions(name))
+        else:
+            try: ok = next(iter_questions(os.path.join(self.directory, entry["source"])), None) is not None
+            except: ok = False
+        self._ready.add(name)
+        return ok
+
+    def sample(self, name, n, seed=None):
+        """Kategoriden rastgele n soru; aynı tohum aynı örneği verir."""
+        rng = random.Random(seed)
+        entry = self.manifest[name]
+        if self.bank is not None:
+            first, count = entry["first"], entry["count"]
+            return [self.bank.question(first + i) for i in rng.sample(range(count), min(n, count))]
+        file_path = os.path.join(self.directory, entry["source"])
+        try:
+            if file_path.endswith(".jsonl"):
+                # Satırlar ayrıştırılmadan örneklenir, yalnızca seçilenler çözülür
+                with open(file_path, 'r', encoding='utf-8-sig') as f:
+                    lines = reservoir_sample((line for line in f if line.strip()), n, rng)
+                return [Soru.from_dict(q, self._pool) for q in map(json.loads, lines) if is_valid_question(q)]
+            return [Soru.from_dict(q, self._pool) for q in reservoir_sample(iter_questions(file_path), n, rng)]
+        except: return []
+
+    def question_ids(self, name):
+        """Kategorideki soruların question_id'leri, sırayla; bankadan yalnızca metinler okunur."""
+        ids = self._ids.get(name)
+        if ids is None:
+            entry = self.manifest[name]
+            if self.bank is not None and name not in self._loaded:
+                texts = map(self.bank.question_text, range(entry["first"], entry["first"] + entry["count"]))
+            else:
+                texts = (q.soru for q in self.questions(name))
+            ids = self._ids[name] = list(map(question_id, texts))
+        return ids
+
+    def question_by_id(self, name, qid):
+        """question_id'si qid olan soru; kategoride yoksa None."""
+        try: index = self.question_ids(name).index(qid)
+        except ValueError: return None
+        if self.bank is not None and name not in self._loaded:
+            return self.bank.question(self.manifest[name]["first"] + index)
+        return self.questions(name)[index]
+
+    def questions_page(self, name, start, count):
+        """Kategorinin [start, start + count) aralığındaki soruları; büyük kategoriler yüklenmez."""
+        entry = self.manifest[name]
+        if not entry["large"]:
+            return self.questions(name)[start:start + count]
+        if self.bank is not None:
+            stop = min(start + count, entry["count"])
+            return [self.bank.question(entry["first"] + i) for i in range(start, stop)]
+        try:
+            items = iter_questions(os.path.join(self.directory, entry["source"]))
+            return [Soru.from_dict(q, self._pool) for q in itertools.islice(items, start, start + count)]
+        except: return []
+
+    def session_questions(self, name, seed, sample_size):
+        """Bir oturumun soruları: büyük paketlerde tohuma bağlı örneklem, diğerlerinde tümü."""
+        if self.is_large(name):
+            return self.sample(name, sample_size, seed)
+        return self.questions(name)
+
+    def questions(self, name):
+        """Kategorinin sorularını döndürür; ilk çağrıda bankadan/JSON'dan yükler."""
+        if name not in self._loaded:
+            entry = self.manifest[name]
+            if self.bank is not None:
+                data = self.bank.questions(name)
+            else:
+                try:
+                    data = read_json_category(os.path.join(self.directory, entry["source"])) or []
+                except: data = []
+                data = [Soru.from_dict(q, self._pool) for q in data]
+                entry["count"] = len(data)
+            self._loaded[name] = data
+        return self._loaded[name]
+
+    def memory_report(self):
+        """Yüklenmiş kategorilerin bellekte kapladığı bayt (bkz. memory_report)."""
+        return memory_report(q for data in self._loaded.values() for q in data)
+
+    def close(self):
+        if self.bank is not None:
+            self.bank.close()
+            self.bank = None
+
+
+def print_memory_report(directory):
+    """Tüm bankayı yükler; sıkışık gösterimi eski sözlük gösterimiyle karşılaştırır."""
+    catalog = SoruKatalogu(directory)
+    for name in catalog.names():
+        if not catalog.is_large(name):
+            catalog.questions(name)
+    compact = catalog.memory_report()
+    sources = [os.path.join(directory, catalog.manifest[name]["source"]) for name in catalog._loaded]
+    # Nesneler ölçüm boyunca canlı tutulur, yoksa id'ler yeniden kullanılır
+    dicts = [q for path in sources for q in read_json_category(path) or []]
+    dicts = memory_report(dicts)
+    catalog.close()
+    print(f"{compact['questions']} soru, {compact['unique_options']} tekrarsız şık")
+    for key, label in (("records", "kayıtlar"), ("text", "metin"), ("option_sets", "şık takımları"),
+                       ("options", "şık dizgileri"), ("total", "toplam")):
+        print(f"  {label:<16}{compact[key]:>12,} B   (sözlükle {dicts[key]:>12,} B)")
+
+
+if __name__ == '__main__':
+    args = [a for a in sys.argv[1:] if a != "--bellek"]
+    source_dir = args[0] if args else os.path.dirname(os.path.abspath(__file__))
+    if "--bellek" in sys.argv:
+        print_memory_report(source_dir)
+    else:
+        out = compile_bank(source_dir)
+        print(f"Soru bankası derlendi: {out}")
@@ -0,0 +1,155 @@
+"""Aralıklı tekrar (Leitner) modu.
+
+Her soru bir kutudadır; doğru cevap soruyu bir üst kutuya taşır ve bir
+sonraki gösterimi kutunun aralığı kadar ileri atar, yanlış cevap veya süre
+dolması soruyu birinci kutuya indirir ve kısa süre sonra yeniden sordurur.
+Tüm bankadaki sorular vade zamanına göre bir yığında (heap) tutulur; sıradaki
+soruyu seçmek O(log n)'dir. Kutular ve vadeler ~/.islami_test/tekrar.jsonl
+dosyasına eklenerek yazılır (kayit.EklemeGunlugu), sıkıştırmada her sorunun
+yalnızca son kaydı kalır.
+
+Sorular "kategori/kimlik" anahtarıyla tutulur; kimlik soru metninin özetidir
+(soru_bankasi.question_id). Paketten soru silinip eklendiğinde diğer soruların
+kutuları yer değiştirmez.
+"""
+import time
+import heapq
+import random
+
+from kayit import EklemeGunlugu, read_records
+from oturum import QuizSession
+from soru_bankasi import question_id
+
+REVIEW_FILE = "tekrar.jsonl"
+REVIEW_CATEGORY = "Tekrar"
+# Kutu -> bir sonraki gösterime kadar saniye (0: yeni soru)
+INTERVALS = (0, 10 * 60, 24 * 3600, 3 * 24 * 3600, 7 * 24 * 3600, 21 * 24 * 3600)
+RETRY_DELAY = 60
+
+
+def question_key(category, question):
+    """question: soru metni veya question_id."""
+    qid = question_id(question) if isinstance(question, str) else question
+    return f"{category}/{qid:08x}"
+
+
+def split_key(key):
+    """Anahtarı (kategori, question_id) olarak ayırır."""
+    category, _, qid = key.rpartition("/")
+    return category, int(qid, 16)
+
+
+class TekrarGunlugu(EklemeGunlugu):
+    def compact_records(self, records):
+        latest = {}
+        for record in records:
+            if isinstance(record.get("key"), str):
+                latest[record["key"]] = record
+        return list(latest.values())
+
+
+class TekrarPlanlayici:
+    def __init__(self, path, keys, rng=None):
+        self.boxes = {}
+        self.due = {}
+        for record in read_records(path):
+            # Bozuk kayıt açılışı durdurmaz, atlanır
+            key, box, due = record.get("key"), record.get("box"), record.get("due")
+            if not isinstance(key, str) or not isinstance(box, int) or not isinstance(due, (int, float)):
+                continue
+            self.boxes[key] = box
+            self.due[key] = due
+        self.log = TekrarGunlugu(path)
+        # Yeni sorular aynı vadeyi (0) paylaşır; aralarındaki sıra rastgeledir
+        self.rng = rng or random.Random()
+        self._heap = [(self.due.get(key, 0.0), self.rng.random(), key) for key in keys]
+        heapq.heapify(self._heap)
+        self._size = len(self._heap)
+        self._in_flight = None
+
+    def __len__(self):
+        return self._size
+
+    def pop(self):
+        """Vadesi en yakın soruyu çıkarır; hiçbir soru vadesinde değilse en erkenini."""
+        if self._in_flight is not None:
+            # Cevaplanmadan bırakılan soru yığına geri döner
+            self._push(self._in_flight, self.due.get(self._in_flight, 0.0))
+            self._in_flight = None
+        while self._heap:
+            due, _, key = heapq.heappop(self._heap)
+            # Yeniden planlanmış soruların eski girdileri tembelce atlanır
+            if due == self.due.get(key, 0.0):
+                self._in_flight = key
+                return key
+        return None
+
+    def record(self, key, correct, now=None):
+        now = time.time() if now is None else now
+        if correct:
+            box = min(self.boxes.get(key, 0) + 1, len(INTERVALS) - 1)
+            due = now + INTERVALS[box]
+        else:
+            box = 1
+            due = now + RETRY_DELAY
+        self.boxes[key] = box
+        self.due[key] = due
+        if key == self._in_flight:
+            self._in_flight = None
+        self._push(key, due)
+        self.log.append({"key": key, "box": box, "due": round(due, 3)})
+
+    def _push(self, key, due):
+        heapq.heappush(self._heap, (due, self.rng.random(), key))
+
+    def close(self):
+        self.log.close()
+
+
+class TekrarOturumu(QuizSession):
+    """Doğrusal current_q yürüyüşü yerine soruları planlayıcıdan çeken oturum."""
+
+    def __init__(self, scheduler, lookup, length=20, max_time=60, rng=None):
+        super().__init__([], REVIEW_CATEGORY, max_time, rng)
+        self.scheduler = scheduler
+        self.lookup = lookup
+        self.length = min(length, len(scheduler))
+        self.key = None
+
+    def start(self, seed=None):
+        self.current_q = 0
+        self.score_correct = 0
+        self.score_wrong = 0
+        self.key = None
+
+    @property
+    def total(self):
+        return self.length
+
+    @property
+    def finished(self):
+        return self.current_q >= self.length
+
+    @property
+    def question_id(self):
+        return self.key
+
+    @property
+    def question(self):
+        return self.lookup(self.key)
+
+    @property
+    def answer_text(self):
+        return self.question.cevap
+
+    def load_question(self):
+        if not self.finished and self.key is None:
+            self.key = self.scheduler.pop()
+        return super().load_question()
+
+    def graded(self, correct):
+        self.scheduler.record(self.key, correct)
+
+    def next_question(self):
+        self.current_q += 1
+        self.key = None
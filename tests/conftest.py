@@ -0,0 +1,35 @@
+import os
+import sys
+import importlib.util
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture
+def app_module():
+    """islami-test.py modülü (adında tire olduğu için dosyadan yüklenir)."""
+    pytest.importorskip("PyQt6.QtWidgets")
+    spec = importlib.util.spec_from_file_location("islami_test", os.path.join(ROOT, "islami-test.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def window(app_module, tmp_path, monkeypatch):
+    """Geçici bir ev klasörüyle kurulan, ekransız uygulama penceresi."""
+    from PyQt6.QtCore import QThreadPool
+    from PyQt6.QtWidgets import QApplication
+    monkeypatch.setenv("HOME", str(tmp_path))
+    app = QApplication.instance() or QApplication([])
+    w = app_module.IslamiTestUygulamasi()
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+    yield w
+    w.close()
+    w.deleteLater()
+    app.processEvents()
@@ -0,0 +1,46 @@
+import api
+
+
+class Yazici:
+    def __init__(self):
+        self.sent = b""
+
+    def write(self, data):
+        self.sent += data
+
+
+def send(response, headers):
+    writer = Yazici()
+    api.SoruServisi.write(writer, response, False, headers, True)
+    head, _, body = writer.sent.partition(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    fields = dict(line.split(": ", 1) for line in lines[1:])
+    return int(lines[0].split()[1]), fields, body
+
+
+def test_gzip_variant_has_its_own_etag():
+    response = api.Yanit(200, api.encode_json({"sorular": ["soru"] * 200}))
+    gzip = {"accept-encoding": "gzip"}
+    _, plain, body = send(response, {})
+    _, packed, packed_body = send(response, gzip)
+    assert plain["ETag"] != packed["ETag"]
+    assert plain["Vary"] == packed["Vary"] == "Accept-Encoding"
+    assert packed["Content-Encoding"] == "gzip" and packed_body != body
+    # Her ETag yalnızca kendi gösterimini doğrular
+    assert send(response, {"if-none-match": plain["ETag"]})[0] == 304
+    assert send(response, dict(gzip, **{"if-none-match": packed["ETag"]}))[0] == 304
+    assert send(response, dict(gzip, **{"if-none-match": plain["ETag"]}))[0] == 200
+    assert send(response, {"if-none-match": packed["ETag"]})[0] == 200
+
+
+def test_accept_encoding_q_values():
+    assert api.accepts_gzip("gzip")
+    assert api.accepts_gzip("deflate, gzip;q=0.5")
+    assert api.accepts_gzip("br, *")
+    assert not api.accepts_gzip("")
+    assert not api.accepts_gzip("gzip;q=0")
+    assert not api.accepts_gzip("gzip; q=0.0, deflate")
+    assert not api.accepts_gzip("*;q=0")
+    assert not api.accepts_gzip("identity")
+    response = api.Yanit(200, api.encode_json({"sorular": ["soru"] * 200}))
+    assert "Content-Encoding" not in send(response, {"accept-encoding": "gzip;q=0"})[1]
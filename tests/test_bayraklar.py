@@ -0,0 +1,14 @@
+import bekci
+
+
+def test_watchdog_flag(app_module, capsys):
+    flag = app_module.watchdog_flag
+    assert flag(["islami-test.py"]) == 0
+    assert flag(["islami-test.py", "--watchdog"]) == bekci.DEFAULT_THRESHOLD_MS
+    assert flag(["islami-test.py", "--watchdog=120"]) == 120
+    # Benzer önekli başka bayraklar eşleşmez
+    assert flag(["islami-test.py", "--watchdogs"]) == 0
+    assert capsys.readouterr().err == ""
+    # Hatalı değer açılışı bozmaz, uyarıyla varsayılana düşer
+    assert flag(["islami-test.py", "--watchdog=abc"]) == bekci.DEFAULT_THRESHOLD_MS
+    assert "--watchdog" in capsys.readouterr().err
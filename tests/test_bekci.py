@@ -0,0 +1,21 @@
+import pytest
+
+
+def histogram(threshold_ms, stalls_ms):
+    pytest.importorskip("PyQt6.QtCore")
+    import bekci
+    watchdog = bekci.Bekci("/dev/null", threshold_ms)
+    watchdog.stalls = [(ms / 1000, []) for ms in stalls_ms]
+    report = watchdog.report()
+    return {line.split()[0]: int(line.split()[-1]) for line in report.splitlines()
+            if line.startswith("  ") and " ms" in line}
+
+
+def test_buckets_follow_threshold():
+    counts = histogram(10, [12, 15, 25, 60, 500])
+    assert counts == {"10-20": 2, "20-50": 1, "50-100": 1, "100-200": 0, "200-400": 0, "400+": 1}
+
+
+def test_default_buckets():
+    counts = histogram(50, [60, 120, 3000])
+    assert counts["50-100"] == 1 and counts["100-250"] == 1 and counts["2000+"] == 1
@@ -0,0 +1,36 @@
+import random
+import itertools
+
+import benzer
+
+WORDS = ["namaz", "abdest", "oruç", "zekat", "hac", "sure", "ayet", "peygamber", "sahabe", "dua",
+         "kıble", "rekat", "secde", "rüku", "kıyam", "hicret", "Mekke", "Medine", "Kabe", "cuma"]
+
+
+def fixture_questions():
+    """Rastgele sorular ve bir-iki kelimesi değiştirilmiş kopyaları."""
+    rng = random.Random(7)
+    questions = []
+    for i in range(40):
+        words = [rng.choice(WORDS) for _ in range(12)]
+        questions.append(" ".join(words) + "?")
+        for changes in (1, 1, 2, 4):
+            variant = list(words)
+            for _ in range(changes):
+                variant[rng.randrange(len(variant))] = rng.choice(WORDS)
+            questions.append(" ".join(variant) + " nedir?")
+    return questions
+
+
+def test_lsh_matches_brute_force():
+    questions = fixture_questions()
+    index = benzer.BenzerlikIndeksi()
+    found = set()
+    for i, text in enumerate(questions):
+        for sim, other in index.add(i, text):
+            found.add((other, i))
+    sets = [benzer.shingles(text) for text in questions]
+    expected = {(i, j) for i, j in itertools.combinations(range(len(questions)), 2)
+                if benzer.BenzerlikIndeksi.similarity(sets[i], sets[j]) >= benzer.THRESHOLD}
+    assert expected
+    assert found == expected
@@ -0,0 +1,57 @@
+import asyncio
+
+import canli
+import soru_bankasi
+from oturum import QuizSession
+
+
+class Yazici:
+    """Gönderilenleri biriktiren sahte akış yazıcısı."""
+
+    def __init__(self):
+        self.transport = self
+        self.sent = []
+
+    def is_closing(self):
+        return False
+
+    def write(self, data):
+        self.sent.append(data)
+
+    def get_write_buffer_size(self):
+        return 0
+
+
+def make_game():
+    questions = [soru_bankasi.Soru(f"S{i}?", ("a", "b", "c", "d"), 0) for i in range(3)]
+    session = QuizSession(questions, "Deneme", max_time=60)
+    session.start(1)
+    game = canli.CanliYarisma(session)
+    session.load_question()
+    game.question_no = session.current_q
+    game.accepting = True
+    return game
+
+
+def test_leaving_player_answer_is_not_counted():
+    async def run():
+        game = make_game()
+        a, b, c = (game.join(name, Yazici()) for name in "ABC")
+        game.answer(a, game.question_no, 0)
+        game.leave(a)
+        game.answer(b, game.question_no, 1)
+        # C henüz cevaplamadı
+        assert not game.all_answered.is_set()
+        game.answer(c, game.question_no, 2)
+        assert game.all_answered.is_set()
+    asyncio.run(run())
+
+
+def test_leaving_last_unanswered_player_ends_question():
+    async def run():
+        game = make_game()
+        a, b = (game.join(name, Yazici()) for name in "AB")
+        game.answer(a, game.question_no, 0)
+        game.leave(b)
+        assert game.all_answered.is_set()
+    asyncio.run(run())
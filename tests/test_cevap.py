@@ -0,0 +1,27 @@
+def start(window):
+    window.is_muted = True
+    window.start_category(window.catalog.names()[0])
+    return window.session
+
+
+def test_correct_slot_click(window):
+    session = start(window)
+    slot = session.correct_slot
+    assert window.buttons[slot].text() == session.answer_text
+    window.buttons[slot].click()
+    assert session.score_correct == 1 and session.score_wrong == 0
+    assert window.buttons[slot].property("state") == "correct"
+    assert window.lbl_correct.text() == "Doğru: 1"
+    assert not any(b.isEnabled() for b in window.buttons)
+    assert not window.timer.isActive()
+
+
+def test_wrong_slot_click_highlights_answer(window):
+    session = start(window)
+    correct = session.correct_slot
+    wrong = (correct + 1) % 4
+    window.buttons[wrong].click()
+    assert session.score_wrong == 1
+    assert window.buttons[wrong].property("state") == "wrong"
+    assert window.buttons[correct].property("state") == "correct"
+    assert window.lbl_wrong.text() == "Yanlış: 1"
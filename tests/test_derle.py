@@ -0,0 +1,35 @@
+import os
+import json
+import shutil
+
+import derle
+import soru_bankasi
+
+from conftest import ROOT
+
+
+def test_renamed_pack_rebuilds_bank(tmp_path, monkeypatch):
+    source = tmp_path / "kaynak"
+    source.mkdir()
+    shutil.copy(os.path.join(ROOT, "soru_bankasi.py"), source)
+    questions = [{"soru": "S?", "siklar": ["a", "b", "c", "d"], "cevap": "a"}]
+    (source / "zekat.json").write_text(json.dumps(questions), encoding="utf-8")
+    # Dizgi parçaları çalışma dizinindeki dosyalarla karışmamalı
+    monkeypatch.chdir(source)
+    stage = tmp_path / "stage"
+    derle.Derleyici(str(source), str(stage), "/opt/x").run()
+    (source / "zekat.json").rename(source / "zekat2.json")
+    builder = derle.Derleyici(str(source), str(stage), "/opt/x")
+    builder.run()
+    assert soru_bankasi.BANK_FILE in builder.built
+    bank = soru_bankasi.open_bank(str(stage / "opt" / "x"))
+    assert bank is not None
+    assert [c[2] for c in bank.categories.values()] == ["zekat2.json"]
+    bank.close()
+
+
+def test_digest_separates_names_and_files(tmp_path, monkeypatch):
+    (tmp_path / "a.json").write_text("[]", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    assert derle.digest([], "a.json") != derle.digest(["a.json"])
+    assert derle.digest([], "a.json") != derle.digest([], "b.json")
@@ -0,0 +1,36 @@
+import os
+
+import gecmis
+
+
+def test_record_answer_before_grading(window):
+    # Puanlanmamış cevapta response_ms None'dır; kayıt yine de yazılmalı
+    window.start_category(window.catalog.names()[0])
+    assert window.session.response_ms is None
+    window.record_answer("x", True)
+    summary = window.history.summary()
+    assert summary.rows == 1
+    columns = gecmis.read_columns(window.history.directory)
+    assert list(columns["ms"]) == [0]
+
+
+def test_add_and_summary(tmp_path):
+    store = gecmis.GecmisDeposu(str(tmp_path))
+    store.add("Abdest", 3, True, False, 1200, ts=0)
+    store.add("Abdest", 4, False, True, 60000, ts=0)
+    store.add("Namaz", 1, True, False, None, ts=0)
+    summary = store.summary()
+    store.close()
+    stats = {s["category"]: s for s in gecmis.category_stats(summary, gecmis.read_categories(str(tmp_path)), now=0)}
+    assert stats["Abdest"]["answers"] == 2 and stats["Abdest"]["timeouts"] == 1
+    assert stats["Tümü"]["accuracy"] == 2 / 3
+    assert gecmis.load_summary(str(tmp_path)).rows == 3
+
+
+def test_malformed_summary_is_rebuilt(tmp_path):
+    store = gecmis.GecmisDeposu(str(tmp_path))
+    store.add("Abdest", 1, True, False, 500, ts=0)
+    store.close()
+    for bad in ("[]", '{"version": 1, "rows": 0, "answers": []}', "5"):
+        (tmp_path / gecmis.SUMMARY_FILE).write_text(bad, encoding="utf-8")
+        assert gecmis.load_summary(str(tmp_path)).rows == 1
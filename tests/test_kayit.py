@@ -0,0 +1,60 @@
+import kayit
+
+
+class Bozuk(kayit.EklemeGunlugu):
+    def _append(self, batch):
+        if batch == [{"bozuk": True}]:
+            raise RuntimeError("işleyici hatası")
+        super()._append(batch)
+
+
+def test_writer_survives_handler_error(tmp_path, capsys):
+    path = str(tmp_path / "g.jsonl")
+    log = Bozuk(path, delay=0)
+    log.append({"bozuk": True})
+    log.flush()
+    log.append({"n": 1})
+    log.close()
+    assert list(kayit.read_records(path)) == [{"n": 1}]
+    assert "kayıt yazılamadı" in capsys.readouterr().err
+
+
+def test_flush_does_not_hang_without_writer(tmp_path):
+    log = kayit.EklemeGunlugu(str(tmp_path / "g.jsonl"), delay=0)
+    log.close()
+    log.append({"n": 1})
+    log.flush()
+
+
+def test_resume_skips_partial_trailing_line(tmp_path):
+    path = str(tmp_path / kayit.JOURNAL_FILE)
+    log = kayit.OturumGunlugu(path, delay=0)
+    log.append({"type": "start", "category": "Namaz", "seed": 5, "current_index": 0, "correct": 0, "wrong": 0})
+    log.append({"type": "answer", "category": "Namaz", "seed": 5, "question_index": 2, "correct": 2, "wrong": 1})
+    log.close()
+    # Yazım ortasında çökme: son satır yarım kalmış
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"type": "answer", "category": "Nam')
+    state = kayit.resume_state(kayit.read_last_record(path, block=16))
+    assert state == {"category": "Namaz", "seed": 5, "correct": 2, "wrong": 1, "current_index": 3}
+
+
+def test_session_compaction_keeps_unfinished_session(tmp_path):
+    path = str(tmp_path / kayit.JOURNAL_FILE)
+    log = kayit.OturumGunlugu(path, delay=0, max_bytes=1)
+    for seed in (1, 2):
+        log.append({"type": "start", "category": "Oruç", "seed": seed, "current_index": 0, "correct": 0, "wrong": 0})
+    log.append({"type": "answer", "category": "Oruç", "seed": 2, "question_index": 0, "correct": 1, "wrong": 0})
+    log.close()
+    assert [r["seed"] for r in kayit.read_records(path)] == [2, 2]
+
+
+def test_review_compaction_keeps_last_record_per_key(tmp_path):
+    import tekrar
+    path = str(tmp_path / tekrar.REVIEW_FILE)
+    log = tekrar.TekrarGunlugu(path, delay=0, max_bytes=1)
+    for box, key in enumerate(["a", "b", "a", "c", "b"]):
+        log.append({"key": key, "box": box, "due": 0})
+    log.append(["nesne değil"])
+    log.close()
+    assert sorted((r["key"], r["box"]) for r in kayit.read_records(path)) == [("a", 2), ("b", 4), ("c", 3)]
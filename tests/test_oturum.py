@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+import soru_bankasi
+from oturum import KarisikSira, QuizSession
+
+
+def make_questions(n):
+    return [soru_bankasi.Soru(f"S{i}?", ("a", "b", "c", "d"), i % 4) for i in range(n)]
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 7, 64, 65, 1000, 4097])
+def test_order_is_bijection(n):
+    for seed in (0, 1, 12345):
+        order = KarisikSira(n, seed)
+        assert sorted(order[i] for i in range(n)) == list(range(n))
+    with pytest.raises(IndexError):
+        order[n]
+
+
+def test_order_depends_on_seed():
+    first = [KarisikSira(100, 1)[i] for i in range(100)]
+    assert first == [KarisikSira(100, 1)[i] for i in range(100)]
+    assert first != [KarisikSira(100, 2)[i] for i in range(100)]
+
+
+def test_resume_gives_same_order():
+    questions = make_questions(50)
+    session = QuizSession(questions, rng=random.Random(3))
+    session.start(777)
+    seen = []
+    for _ in range(20):
+        seen.append(session.question_id)
+        session.next_question()
+    resumed = QuizSession(questions, rng=random.Random(9))
+    resumed.resume(777, 10, 4, 6)
+    assert resumed.question_id == seen[10]
+    assert (resumed.score_correct, resumed.score_wrong) == (4, 6)
+
+
+def test_answer_and_timeout_scoring():
+    now = [0]
+    session = QuizSession(make_questions(3), max_time=10, rng=random.Random(1), clock=lambda: now[0])
+    session.start(5)
+    q = session.load_question()
+    # Karıştırılmış şıklarda doğru yuva cevabı göstermeli
+    assert session.options[session.correct_slot] == q.cevap == session.answer_text
+    now[0] += 2_500_000_000
+    assert session.answer(session.correct_slot)
+    assert session.response_ms == 2500
+    session.next_question()
+    session.load_question()
+    assert session.response_ms is None
+    assert not session.answer((session.correct_slot + 1) % 4)
+    session.next_question()
+    session.load_question()
+    now[0] += 9_000_000_000
+    assert not session.tick() and session.time_left == 1
+    session.pause_clock()
+    now[0] += 60_000_000_000
+    assert not session.tick()
+    session.resume_clock()
+    now[0] += 1_000_000_000
+    assert session.tick() and session.response_ms == 10_000
+    session.next_question()
+    assert session.finished and session.load_question() is None
+    assert (session.score_correct, session.score_wrong) == (1, 2)
+    assert session.success_rate() == 33
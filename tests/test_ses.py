@@ -0,0 +1,12 @@
+import sys
+
+
+def test_missing_sound_backend_mutes(window, monkeypatch, capsys):
+    # Multimedya arka ucu yüklenemezse cevap verilebilmeli, ses bir kez uyarıyla kapanmalı
+    monkeypatch.setitem(sys.modules, "ses", None)
+    window.start_category(window.catalog.names()[0])
+    window.play_sound("correct")
+    assert window.is_muted and window.sounds is None
+    assert not window.btn_mute.isEnabled()
+    window.play_sound("wrong")
+    assert capsys.readouterr().err.count("ses kullanılamıyor") == 1
@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+import soru_bankasi
+
+
+def write_pack(directory, name, count):
+    questions = [{"soru": f"{name} {i}?", "siklar": ["a", "b", "c", str(i)], "cevap": "a"} for i in range(count)]
+    with open(directory / f"{name}.json", "w", encoding="utf-8") as f:
+        json.dump(questions, f, ensure_ascii=False)
+
+
+def test_prepare_does_not_decode_bank(tmp_path):
+    write_pack(tmp_path, "bir", 5)
+    write_pack(tmp_path, "iki", 3)
+    soru_bankasi.compile_bank(str(tmp_path))
+    catalog = soru_bankasi.SoruKatalogu(str(tmp_path))
+    assert catalog.bank is not None
+    assert all(catalog.prepare(name) for name in catalog.names())
+    assert catalog.memory_report()["questions"] == 0
+    assert len(catalog.questions("Iki")) == 3
+    catalog.close()
+
+
+def test_prepare_json_fallback(tmp_path):
+    write_pack(tmp_path, "bir", 2)
+    catalog = soru_bankasi.SoruKatalogu(str(tmp_path))
+    assert catalog.bank is None
+    assert catalog.prepare("Bir")
+    assert catalog.manifest["Bir"]["count"] == 2
+
+
+def test_unreadable_source_keeps_bank(tmp_path, capsys):
+    write_pack(tmp_path, "bir", 2)
+    (tmp_path / "bozuk.json").write_text('{"soru": "dizi değil"}', encoding="utf-8")
+    soru_bankasi.compile_bank(str(tmp_path))
+    assert "bozuk.json" in capsys.readouterr().err
+    catalog = soru_bankasi.SoruKatalogu(str(tmp_path))
+    assert catalog.bank is not None
+    assert catalog.prepare("Bir") and not catalog.prepare("Bozuk")
+    catalog.close()
+
+
+def test_bom_pack_accepted_by_loader_and_validator(tmp_path):
+    import dogrula
+    questions = [{"soru": "S?", "siklar": ["a", "b", "c", "d"], "cevap": "a"}]
+    for name in ("bom.json", "bom2.jsonl"):
+        text = json.dumps(questions) if name.endswith(".json") else json.dumps(questions[0]) + "\n"
+        (tmp_path / name).write_text("\ufeff" + text, encoding="utf-8")
+        path = str(tmp_path / name)
+        assert dogrula.check_file(path) == []
+        assert len(list(soru_bankasi.iter_questions(path))) == 1
+    assert len(soru_bankasi.read_json_category(str(tmp_path / "bom.json"))) == 1
+
+
+def test_truncated_array_raises(tmp_path):
+    path = tmp_path / "yarim.json"
+    for text in ("[1, 2", "[1, 2,", "[", '[{"a": 1}  \n'):
+        path.write_text(text, encoding="utf-8")
+        with pytest.raises(ValueError):
+            list(soru_bankasi.iter_json_array(str(path), chunk_size=2))
+    path.write_text("[1, 2]", encoding="utf-8")
+    assert list(soru_bankasi.iter_json_array(str(path), chunk_size=2)) == [1, 2]
@@ -0,0 +1,44 @@
+import random
+
+import tekrar
+
+
+def review_order(path, seed):
+    scheduler = tekrar.TekrarPlanlayici(str(path), [f"k{i}" for i in range(20)], random.Random(seed))
+    # Aynı anda yanlış cevaplanan sorular aynı vadeyi paylaşır; sıra rng'den gelir
+    for _ in range(20):
+        scheduler.record(scheduler.pop(), False, now=0)
+    order = [scheduler.pop() for _ in range(5)]
+    scheduler.close()
+    return order
+
+
+def test_seeded_scheduler_is_reproducible(tmp_path):
+    assert review_order(tmp_path / "a.jsonl", 7) == review_order(tmp_path / "b.jsonl", 7)
+
+
+def test_review_keys_without_decoding(window):
+    window.start_review()
+    catalog = window.catalog
+    if catalog.bank is not None:
+        assert catalog.memory_report()["questions"] == 0
+    expected = {tekrar.question_key(name, q.soru) for name in catalog.names() if not catalog.is_large(name)
+                for q in catalog.questions(name)}
+    assert len(window.review_scheduler) == len(expected)
+    assert window.session.key in expected
+    assert tekrar.question_key(tekrar.split_key(window.session.key)[0], window.session.question.soru) == window.session.key
+
+
+def test_keys_survive_pack_edits(tmp_path):
+    texts = ["Birinci?", "İkinci?", "Üçüncü?"]
+    path = str(tmp_path / tekrar.REVIEW_FILE)
+    scheduler = tekrar.TekrarPlanlayici(path, [tekrar.question_key("Namaz", t) for t in texts])
+    scheduler.record(tekrar.question_key("Namaz", "Üçüncü?"), True, now=0)
+    scheduler.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"key": 5}\n[]\n{"key": "x"}\n')
+    # İlk soru silindi; kalanların kutusu kendi sorusunda kalır
+    scheduler = tekrar.TekrarPlanlayici(path, [tekrar.question_key("Namaz", t) for t in texts[1:]])
+    assert scheduler.boxes == {tekrar.question_key("Namaz", "Üçüncü?"): 1}
+    assert tekrar.split_key(tekrar.question_key("Namaz", "Üçüncü?"))[0] == "Namaz"
+    scheduler.close()
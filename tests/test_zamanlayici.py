@@ -0,0 +1,14 @@
+def test_hidden_window_does_not_start_timer(window):
+    # Pencere gizliyken yüklenen soruda zamanlayıcı kurulmaz, süre akmaz
+    window.show()
+    window.start_category(window.catalog.names()[0])
+    assert window.timer.isActive()
+    window.hide()
+    assert not window.timer.isActive()
+    window.next_question()
+    assert not window.timer.isActive()
+    left = window.session.remaining_ns()
+    assert window.session.remaining_ns() == left
+    window.show()
+    assert window.timer.isActive()
+    assert window.session.remaining_ns() < left